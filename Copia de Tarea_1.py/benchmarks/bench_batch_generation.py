@@ -0,0 +1,38 @@
+"""Compara la generación en lote contra load_from_json tablero por tablero"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.board import Board
+from model.board_generator import BatchBoardGenerator, BoardTemplate
+
+MAP_PATH = os.path.join(os.path.dirname(__file__), "..", "mapa1-2.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=200_000)
+    parser.add_argument("--naive", type=int, default=2_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    for _ in range(args.naive):
+        Board().load_from_json(MAP_PATH)
+    naive = args.naive / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    generator = BatchBoardGenerator(BoardTemplate.from_json(MAP_PATH), seed=0)
+    for batch in generator.iter_batches(args.boards):
+        pass
+    batched = args.boards / (time.perf_counter() - start)
+
+    print(f"load_from_json: {naive:>12,.0f} tableros/s")
+    print(f"lote NumPy:     {batched:>12,.0f} tableros/s ({batched / naive:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Memoria por tablero: Board (objetos) contra BoardArrays (arreglos compactos)"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.board_arrays import BoardArrays
+from model.board_generator import BatchBoardGenerator, BoardTemplate
+
+MAP_PATH = os.path.join(os.path.dirname(__file__), "..", "mapa1-2.json")
+
+
+def measure(build_fn):
+    """Bytes retenidos por lo que devuelve build_fn"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build_fn()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=20_000)
+    parser.add_argument("--no-build", action="store_true", help="no construir hex_grid/tile_coords")
+    args = parser.parse_args()
+
+    batch = BatchBoardGenerator(BoardTemplate.from_json(MAP_PATH), seed=0).generate(args.boards)
+    build = not args.no_build
+
+    boards, board_bytes = measure(lambda: list(batch.boards(build)))
+    compact, compact_bytes = measure(lambda: [BoardArrays.from_board(board) for board in boards])
+
+    # Verificación sin pérdida de una muestra
+    for board, arrays in zip(boards[:100], compact[:100]):
+        assert BoardArrays.from_board(arrays.to_board()) == arrays
+
+    n = args.boards
+    print(f"Board:       {board_bytes / n:>9,.0f} bytes/tablero ({board_bytes / 2**20:,.1f} MiB para {n:,})")
+    print(f"BoardArrays: {compact_bytes / n:>9,.0f} bytes/tablero ({compact_bytes / 2**20:,.1f} MiB para {n:,})")
+    print(f"Ahorro: {board_bytes / compact_bytes:.1f}x; un millón de tableros: "
+          f"{board_bytes / n * 1e6 / 2**30:.2f} GiB contra {compact_bytes / n * 1e6 / 2**30:.2f} GiB")
+
+
+if __name__ == "__main__":
+    main()
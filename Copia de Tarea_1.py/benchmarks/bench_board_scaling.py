@@ -0,0 +1,40 @@
+"""Mide el tiempo de construcción del tablero al crecer el radio"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.board import Board
+from model.HexCoord import tile_count_for_radius
+from utils.board_factory import generate_board_data
+
+
+def bench(radius: int, repeat: int) -> float:
+    data = generate_board_data(radius, seed=radius)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        board = Board()
+        board.load_from_dict(data)
+        board.construir_tablero_con_hex_coords()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--radii", type=int, nargs="+", default=[2, 5, 10, 20, 35, 57])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'radio':>6} {'hexes':>7} {'ms':>10} {'µs/hex':>8}")
+    for radius in args.radii:
+        hexes = tile_count_for_radius(radius)
+        elapsed = bench(radius, args.repeat)
+        print(f"{radius:>6} {hexes:>7} {elapsed * 1e3:>10.2f} {elapsed * 1e6 / hexes:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
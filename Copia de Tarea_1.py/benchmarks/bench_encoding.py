@@ -0,0 +1,91 @@
+"""Mide tiempo y tamaño de cada codificador, y memoria pico del renderizado por franjas"""
+import argparse
+import io
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.board import Board
+from utils.board_factory import generate_board_data
+from view.encoding import EncodeOptions, encode_image
+from view.image_view import ImageView
+
+MAP_PATH = Path(__file__).resolve().parent.parent / "mapa1-2.json"
+
+ENCODINGS = (
+    ("PNG nivel 0", EncodeOptions(compress_level=0)),
+    ("PNG nivel 1", EncodeOptions(compress_level=1)),
+    ("PNG nivel 6", EncodeOptions(compress_level=6)),
+    ("PNG nivel 9", EncodeOptions(compress_level=9)),
+    ("WebP q80", EncodeOptions(format="WEBP", quality=80)),
+    ("WebP sin pérdida", EncodeOptions(format="WEBP", lossless=True)),
+    ("JPEG q95", EncodeOptions(format="JPEG", quality=95)),
+    ("RGB crudo", EncodeOptions(format="RAW")),
+)
+
+
+def load_board(radius) -> Board:
+    board = Board()
+    if radius:
+        board.load_from_dict(generate_board_data(radius, seed=radius))
+    else:
+        board.load_from_json(str(MAP_PATH))
+    board.construir_tablero_con_hex_coords()
+    return board
+
+
+def render_child(radius: int, mode: str, strip_height: int):
+    """Corre en un proceso aparte para que ru_maxrss refleje solo este renderizado"""
+    board = load_board(radius)
+    view = ImageView()
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    output = io.BytesIO()
+    start = time.perf_counter()
+    if mode == "tiled":
+        view.render_tiled(board.tile_coords, board.port_positions, board.robber_position, output,
+                          strip_height=strip_height)
+    else:
+        view.render_to(output, board.tile_coords, board.port_positions, board.robber_position)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{elapsed} {peak - baseline} {len(output.getvalue())}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20, help="codificaciones por formato")
+    parser.add_argument("--radius", type=int, default=None, help="tablero sintético en vez de mapa1-2.json")
+    parser.add_argument("--tiled-radius", type=int, default=25, help="radio del tablero grande para franjas")
+    parser.add_argument("--strip-height", type=int, default=256)
+    parser.add_argument("--child", nargs=2, metavar=("MODO", "RADIO"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        render_child(int(args.child[1]), args.child[0], args.strip_height)
+        return
+
+    board = load_board(args.radius)
+    image = ImageView().generate_board_image(board.tile_coords, board.port_positions, board.robber_position)
+    print(f"Imagen de {image.width}x{image.height}, {args.repeat} codificaciones por formato")
+    for name, options in ENCODINGS:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            data = encode_image(image, options)
+        elapsed = (time.perf_counter() - start) / args.repeat
+        print(f"{name:<18} {elapsed * 1e3:>8.1f} ms {len(data) / 1024:>10,.0f} KiB")
+
+    print(f"\nTablero de radio {args.tiled_radius} (PNG nivel 6, memoria pico por encima del tablero cargado)")
+    for mode in ("full", "tiled"):
+        command = [sys.executable, __file__, "--child", mode, str(args.tiled_radius),
+                   "--strip-height", str(args.strip_height)]
+        elapsed, peak_kib, size = subprocess.run(command, capture_output=True, text=True, check=True).stdout.split()
+        label = "lienzo completo" if mode == "full" else f"franjas de {args.strip_height}"
+        print(f"{label:<18} {float(elapsed):>8.2f} s {int(peak_kib) / 1024:>8.1f} MiB {int(size) / 1024:>10,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
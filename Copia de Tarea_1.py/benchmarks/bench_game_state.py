@@ -0,0 +1,117 @@
+"""Mide jugadas/s aplicadas y deshechas con GameState sobre partidas aleatorias"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.board import Board
+from model.game_state import ROBBER, GameState, Move
+from utils.board_factory import generate_board_data
+
+MAP_PATH = Path(__file__).resolve().parent.parent / "mapa1-2.json"
+
+
+def random_game(state: GameState, moves: int, rng: random.Random):
+    """Juega moves jugadas al azar (caminos más frecuentes, ladrón 1 de cada 6) y deja el estado aplicado"""
+    hexes = len(state.hex_slot)
+    for turn in range(moves):
+        player = turn % state.players
+        if rng.random() < 1 / 6:
+            state.apply(Move(ROBBER, player, rng.choice([h for h in range(hexes) if h != state.robber])))
+            continue
+        options = state.legal_moves(player)
+        if options:
+            roads = [move for move in options if move.kind == "road"]
+            state.apply(rng.choice(roads if roads and rng.random() < 0.7 else options))
+
+
+def reference_longest_road(state: GameState, player: int) -> int:
+    """Camino más largo recorriendo todos los caminos del jugador desde cada vértice"""
+    edges = state.player_roads[player]
+    blocked = {v for v, owner in enumerate(state.vertex_owner) if owner not in (-1, player)}
+
+    def walk(vertex, used):
+        best = 0
+        for edge in edges:
+            if edge not in used and vertex in state.edge_vertices[edge]:
+                a, b = state.edge_vertices[edge]
+                other = b if a == vertex else a
+                tail = 0 if other in blocked else walk(other, used | {edge})
+                best = max(best, 1 + tail)
+        return best
+
+    return max((walk(v, frozenset()) for e in edges for v in state.edge_vertices[e]), default=0)
+
+
+def check(state: GameState) -> int:
+    """Compara los valores incrementales con un recálculo desde cero; devuelve la cantidad de diferencias"""
+    errors = 0
+    for player in range(state.players):
+        if state.road_length[player] != reference_longest_road(state, player):
+            errors += 1
+    income = [[0] * len(row) for row in state.income]
+    blocked = [[0] * len(row) for row in state.blocked]
+    for vertex, weight in enumerate(state.buildings):
+        if weight:
+            for h in state.vertex_hexes[vertex]:
+                slot = state.hex_slot[h]
+                if slot >= 0:
+                    table = blocked if h == state.robber else income
+                    table[state.vertex_owner[vertex]][slot] += weight
+    return errors + (income != state.income) + (blocked != state.blocked)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--moves", type=int, default=120, help="jugadas por partida")
+    parser.add_argument("--radius", type=int, default=None, help="tablero sintético en vez de mapa1-2.json")
+    parser.add_argument("--check", action="store_true", help="verifica contra un recálculo desde cero")
+    args = parser.parse_args()
+
+    board = Board()
+    if args.radius:
+        board.load_from_dict(generate_board_data(args.radius, seed=args.radius))
+    else:
+        board.load_from_json(str(MAP_PATH))
+    board.construir_tablero_con_hex_coords()
+
+    rng = random.Random(0)
+    applied = undone = 0
+    apply_time = undo_time = 0.0
+    errors = 0
+    for _ in range(args.games):
+        state = GameState(board)
+        random_game(state, args.moves, rng)
+        moves = list(state.history)
+        if args.check:
+            errors += check(state)
+        while state.history:
+            state.undo()
+
+        # Se repite la misma partida para medir solo apply/undo (sin generar jugadas legales)
+        start = time.perf_counter()
+        for move in moves:
+            state.apply(move)
+        apply_time += time.perf_counter() - start
+        start = time.perf_counter()
+        while state.history:
+            state.undo()
+        undo_time += time.perf_counter() - start
+        applied += len(moves)
+        undone += len(moves)
+        if args.check:
+            errors += check(state) + any(state.edge_owner[e] != -1 for e in range(len(state.edge_owner)))
+
+    print(f"{applied:,} jugadas en {args.games} partidas")
+    print(f"apply: {applied / apply_time:>12,.0f} jugadas/s")
+    print(f"undo:  {undone / undo_time:>12,.0f} jugadas/s")
+    if args.check:
+        print(f"Diferencias con el recálculo desde cero: {errors}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compara la latencia por turno del render incremental contra el render completo"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PIL import ImageChops
+
+from model.board import Board
+from utils.board_factory import generate_board_data
+from view.image_view import ImageView
+from view.incremental_view import IncrementalImageView
+
+MAP_PATH = Path(__file__).resolve().parent.parent / "mapa1-2.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--radius", type=int, default=None, help="tablero sintético en vez de mapa1-2.json")
+    parser.add_argument("--check", action="store_true", help="compara cada cuadro con un render completo")
+    args = parser.parse_args()
+
+    board = Board()
+    if args.radius:
+        board.load_from_dict(generate_board_data(args.radius, seed=0))
+    else:
+        board.load_from_json(str(MAP_PATH))
+    board.construir_tablero_con_hex_coords()
+
+    full_view = ImageView()
+    incremental = IncrementalImageView()
+    incremental.render(board.tile_coords, board.port_positions, board.robber_position)
+
+    rng = random.Random(0)
+    numbered = [tile for tile in board.tiles if tile.number]
+    full_times, incremental_times, mismatches = [], [], 0
+    for turn in range(args.turns):
+        # Cada turno se mueve el ladrón y, cada tanto, cambia un número
+        board.robber_position = rng.choice(board.tiles)
+        if turn % 5 == 0:
+            rng.choice(numbered).set_number(rng.choice([2, 3, 4, 5, 6, 8, 9, 10, 11, 12]))
+
+        start = time.perf_counter()
+        update = incremental.render(board.tile_coords, board.port_positions, board.robber_position)
+        incremental_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        image = full_view.generate_board_image(board.tile_coords, board.port_positions, board.robber_position)
+        full_times.append(time.perf_counter() - start)
+
+        if args.check and ImageChops.difference(update.image, image).getbbox():
+            mismatches += 1
+
+    full, partial = statistics.median(full_times), statistics.median(incremental_times)
+    print(f"Render completo:    p50 {full * 1e3:.2f} ms")
+    print(f"Render incremental: p50 {partial * 1e3:.2f} ms ({partial / full:.1%} del completo)")
+    if args.check:
+        print(f"Cuadros distintos al render completo: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compara el solver de números con backtracking contra muestreo por rechazo"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.board import Board
+from model.number_placement import NumberPlacementRules, NumberPlacer
+from utils.board_factory import generate_board_data
+
+
+def rejection_sample(placer: NumberPlacer, rng: random.Random, max_draws: int):
+    """Baraja los números hasta obtener una asignación válida; devuelve la cantidad de intentos"""
+    numbers = [0] * len(placer.coords)
+    pool = placer.pool.copy()
+    for draw in range(1, max_draws + 1):
+        rng.shuffle(pool)
+        for slot, value in zip(placer.slots, pool):
+            numbers[slot] = value
+        if placer.is_valid(numbers):
+            return draw
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--radii", type=int, nargs="+", default=[2, 3, 4])
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--max-draws", type=int, default=200_000)
+    parser.add_argument("--max-vertex-pips", type=int, default=None)
+    args = parser.parse_args()
+
+    rules = NumberPlacementRules(max_vertex_pips=args.max_vertex_pips)
+    print(f"{'radio':>6} {'solver µs':>10} {'rechazo µs':>12} {'intentos':>9}")
+    for radius in args.radii:
+        board = Board()
+        board.load_from_dict(generate_board_data(radius, seed=radius))
+        board.construir_tablero_con_hex_coords()
+        placer = NumberPlacer.from_board(board, rules)
+        rng = random.Random(0)
+
+        start = time.perf_counter()
+        for _ in range(args.samples):
+            assert placer.is_valid(placer.solve(rng))
+        solver = (time.perf_counter() - start) / args.samples
+
+        draws = []
+        start = time.perf_counter()
+        for _ in range(max(1, args.samples // 20)):
+            result = rejection_sample(placer, rng, args.max_draws)
+            if result is None:
+                break
+            draws.append(result)
+        if len(draws) == max(1, args.samples // 20):
+            rejection = f"{(time.perf_counter() - start) / len(draws) * 1e6:>12.0f}"
+            attempts = f"{sum(draws) / len(draws):>9.0f}"
+        else:
+            rejection, attempts = f"{'> límite':>12}", f"{'>' + str(args.max_draws):>9}"
+        print(f"{radius:>6} {solver * 1e6:>10.0f} {rejection} {attempts}")
+
+
+if __name__ == "__main__":
+    main()
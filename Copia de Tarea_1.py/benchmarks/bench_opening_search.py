@@ -0,0 +1,76 @@
+"""Mide tableros/s del ranking de aperturas (branch-and-bound) contra fuerza bruta"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.board_generator import BatchBoardGenerator, BoardTemplate
+from model.opening_search import OpeningSearch, search_batch
+from utils.board_factory import generate_board_data
+
+MAP_PATH = Path(__file__).resolve().parent.parent / "mapa1-2.json"
+
+
+def brute_force_seats(engine: OpeningSearch, production, seats: int, k: int):
+    """Evalúa todos los pares legales de cada asiento; devuelve los k mejores puntajes"""
+    vertex_count = len(production)
+    rankings = []
+    occupied = 0
+    for _ in range(seats):
+        blocked = occupied
+        for v in range(vertex_count):
+            if occupied >> v & 1:
+                blocked |= engine.neighbor_masks[v]
+        pairs = sorted(
+            ((engine.pair_score(production, a, b), -a, -b)
+             for a in range(vertex_count) if not blocked >> a & 1
+             for b in range(a + 1, vertex_count)
+             if not blocked >> b & 1 and not engine.neighbor_masks[a] >> b & 1),
+            reverse=True,
+        )[:k]
+        rankings.append([score for score, _, _ in pairs])
+        if pairs:
+            occupied |= 1 << -pairs[0][1] | 1 << -pairs[0][2]
+    return rankings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=2000)
+    parser.add_argument("--brute", type=int, default=50, help="tableros para la comparación con fuerza bruta")
+    parser.add_argument("--radius", type=int, default=None, help="plantilla sintética en vez de mapa1-2.json")
+    parser.add_argument("--seats", type=int, default=4)
+    parser.add_argument("-k", type=int, default=5)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count()])
+    args = parser.parse_args()
+
+    if args.radius:
+        template = BoardTemplate(generate_board_data(args.radius, seed=args.radius))
+    else:
+        template = BoardTemplate.from_json(str(MAP_PATH))
+    batch = BatchBoardGenerator(template, seed=0).generate(args.boards)
+    engine = OpeningSearch.for_template(template)
+
+    production = engine.production(batch.materials[:args.brute], batch.numbers[:args.brute]).tolist()
+    start = time.perf_counter()
+    expected = [brute_force_seats(engine, rows, args.seats, args.k) for rows in production]
+    brute = len(production) / (time.perf_counter() - start)
+    mismatches = sum(
+        [[opening.score for opening in seat] for seat in engine.rank_seats(rows, args.seats, args.k)] != scores
+        for rows, scores in zip(production, expected)
+    )
+
+    print(f"{len(template)} tiles, {engine.topology.vertex_count} esquinas, {args.seats} asientos, top-{args.k}")
+    print(f"fuerza bruta:      {brute:>10,.1f} tableros/s ({mismatches} distintos a branch-and-bound)")
+    for workers in dict.fromkeys(args.workers):
+        start = time.perf_counter()
+        results = search_batch(batch, args.seats, args.k, workers=workers, chunk_size=max(1, args.boards // (4 * workers)))
+        rate = len(results) / (time.perf_counter() - start)
+        print(f"branch-and-bound:  {rate:>10,.1f} tableros/s ({workers} procesos)")
+
+
+if __name__ == "__main__":
+    main()
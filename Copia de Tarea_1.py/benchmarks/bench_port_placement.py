@@ -0,0 +1,52 @@
+"""Mide ubicaciones de puertos por segundo con PortPlacer (solo solver y aplicado al Board)"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.board import Board
+from model.port_placement import Coastline, PortPlacer
+from model.validator import BoardValidator
+from utils.board_factory import generate_board_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--radii", type=int, nargs="+", default=[2, 3, 4, 8])
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument("--min-spacing", type=int, default=2)
+    parser.add_argument("--check", action="store_true", help="valida cada tablero con BoardValidator")
+    args = parser.parse_args()
+
+    validator = BoardValidator.default()
+    print(f"{'radio':>6} {'costa':>6} {'puertos':>8} {'solver/s':>10} {'tablero/s':>10} {'inválidos':>10}")
+    for radius in args.radii:
+        board = Board()
+        board.load_from_dict(generate_board_data(radius, seed=radius))
+        board.construir_tablero_con_hex_coords()
+        coastline = Coastline.for_board(board)
+        placer = PortPlacer(coastline, count=len(board.ports), min_spacing=args.min_spacing)
+        rng = random.Random(0)
+
+        start = time.perf_counter()
+        for _ in range(args.samples):
+            placer.solve(rng)
+        solver = args.samples / (time.perf_counter() - start)
+
+        invalid = 0
+        start = time.perf_counter()
+        for _ in range(args.samples):
+            placer.place(board, rng)
+            if args.check and validator.validate_board(board):
+                invalid += 1
+        placed = args.samples / (time.perf_counter() - start)
+
+        print(f"{radius:>6} {len(coastline):>6} {placer.count:>8} {solver:>10,.0f} {placed:>10,.0f} "
+              f"{invalid if args.check else '-':>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compara imágenes/s del renderizador original contra el de sprites"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.board_generator import BatchBoardGenerator, BoardTemplate
+from view.image_view import ImageView
+from view.sprite_view import SpriteImageView
+
+MAP_PATH = os.path.join(os.path.dirname(__file__), "..", "mapa1-2.json")
+
+
+def bench(view, boards) -> float:
+    start = time.perf_counter()
+    for board in boards:
+        view.generate_board_image(board.tile_coords, board.port_positions, board.robber_position)
+    return len(boards) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=200)
+    args = parser.parse_args()
+
+    generator = BatchBoardGenerator(BoardTemplate.from_json(MAP_PATH), seed=0)
+    boards = list(generator.generate(args.boards).boards())
+
+    sprite_view = SpriteImageView()
+    sprite_view.generate_board_image(boards[0].tile_coords, boards[0].port_positions, boards[0].robber_position)
+
+    original = bench(ImageView(), boards)
+    sprites = bench(sprite_view, boards)
+    print(f"ImageView:       {original:>8.1f} imágenes/s")
+    print(f"SpriteImageView: {sprites:>8.1f} imágenes/s ({sprites / original:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Mide huellas canónicas por segundo y cuántos tableros únicos deja pasar el filtro"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.board_generator import BatchBoardGenerator, BoardTemplate
+from model.symmetry import SeenSet, unique_batches
+from utils.board_factory import generate_board_data
+
+MAP_PATH = os.path.join(os.path.dirname(__file__), "..", "mapa1-2.json")
+
+
+def check_exhausted(batch_size: int = 2000) -> bool:
+    """Pide más tableros únicos de los que existen en radio 1: el filtro debe terminar solo"""
+    template = BoardTemplate(generate_board_data(1, seed=0))
+    classes = None
+    for total in (None, 100_000):
+        seen = SeenSet()
+        batches = unique_batches(BatchBoardGenerator(template, seed=0), total=total, batch_size=batch_size, seen=seen)
+        produced = sum(len(fingerprints) for fingerprints, _ in batches)
+        if produced != len(seen) or (classes is not None and produced != classes):
+            return False
+        classes = produced
+    print(f"Radio 1 agotado: {classes:,} clases de simetría, el generador terminó sin max_batches")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=500_000)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--radius", type=int, default=None, help="tablero sintético en vez de mapa1-2.json")
+    parser.add_argument("--max-exact", type=int, default=1_000_000)
+    parser.add_argument("--bloom-bits", type=int, default=0, help="bits del filtro de Bloom (0 = sin Bloom)")
+    parser.add_argument("--check", action="store_true", help="verifica que se detenga al agotar las clases")
+    args = parser.parse_args()
+
+    if args.check and not check_exhausted():
+        sys.exit("El filtro de únicos no terminó con las clases agotadas")
+
+    if args.radius is not None:
+        template = BoardTemplate(generate_board_data(args.radius, seed=0))
+    else:
+        template = BoardTemplate.from_json(MAP_PATH)
+    generator = BatchBoardGenerator(template, seed=0)
+    seen = SeenSet(args.max_exact, args.bloom_bits)
+
+    start = time.perf_counter()
+    unique = 0
+    for fingerprints, _ in unique_batches(generator, batch_size=args.batch_size, seen=seen,
+                                          max_batches=-(-args.boards // args.batch_size)):
+        unique += len(fingerprints)
+    elapsed = time.perf_counter() - start
+
+    total = -(-args.boards // args.batch_size) * args.batch_size
+    print(f"{total:,} tableros generados y canonizados en {elapsed:.2f} s ({total / elapsed:,.0f} tableros/s)")
+    print(f"Únicos: {unique:,} ({unique / total:.1%}); huellas exactas guardadas: {len(seen):,}")
+    if seen.bloom is not None:
+        print(f"Filtro de Bloom: {seen.bloom.nbytes / 1024:,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Mide cuántos tableros por minuto valida BoardValidator"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.board_generator import BatchBoardGenerator, BoardTemplate
+from model.validator import BoardValidator
+
+MAP_PATH = os.path.join(os.path.dirname(__file__), "..", "mapa1-2.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=100_000)
+    parser.add_argument("--distinct", type=int, default=1_000)
+    args = parser.parse_args()
+
+    generator = BatchBoardGenerator(BoardTemplate.from_json(MAP_PATH), seed=0)
+    boards = list(generator.generate(args.distinct).boards(build=False))
+    validator = BoardValidator()
+
+    start = time.perf_counter()
+    invalid = 0
+    for i in range(args.boards):
+        board = boards[i % len(boards)]
+        if validator.validate(board.tiles, board.ports):
+            invalid += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.boards:,} tableros validados en {elapsed:.2f} s "
+          f"({args.boards / elapsed * 60:,.0f} tableros/min, {invalid} inválidos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Prueba de carga del servicio de tableros con un cliente HTTP asyncio local
+
+Sin --port levanta el servicio en el mismo proceso (puerto libre); con --port apunta
+a un board_service.py ya corriendo. Cada cliente mantiene una conexión keep-alive y
+repite la mezcla de pedidos; se reportan pedidos/s y latencias p50/p99 por endpoint.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from board_service import start_service
+
+MAP_PATH = Path(__file__).resolve().parent.parent / "mapa1-2.json"
+
+
+class Client:
+    """Cliente HTTP/1.1 mínimo sobre una conexión persistente"""
+
+    def __init__(self, host: str, port: int):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def connect(self) -> None:
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method: str, path: str, payload=None) -> Tuple[int, bytes]:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        )
+        await self.writer.drain()
+        head = (await self.reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+        status = int(head.split(" ", 2)[1])
+        length = 0
+        for line in head.split("\r\n")[1:]:
+            if line.lower().startswith("content-length:"):
+                length = int(line.split(":", 1)[1])
+        return status, await self.reader.readexactly(length)
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def request_mix() -> List[Tuple[str, Dict]]:
+    with open(MAP_PATH) as f:
+        mapa = json.load(f)
+    mix = [("/validate", mapa), ("/generate", {"map": "mapa1-2.json", "count": 10})]
+    return mix + [("/render", {"map": "mapa1-2.json"})] * 4
+
+
+async def run_client(host: str, port: int, requests: int, mix, seeds, distinct_renders: int,
+                     latencies: Dict[str, List[float]], failures: List[int]):
+    client = Client(host, port)
+    await client.connect()
+    try:
+        for i in range(requests):
+            path, payload = mix[i % len(mix)]
+            if path == "/render":
+                # Semillas repetidas: parte de los renders sale del RenderCache
+                payload = dict(payload, seed=next(seeds) % distinct_renders)
+            start = time.perf_counter()
+            status, _ = await client.request("POST", path, payload)
+            latencies.setdefault(path, []).append(time.perf_counter() - start)
+            if status != 200:
+                failures.append(status)
+    finally:
+        await client.close()
+
+
+async def main_async(args) -> None:
+    server = service = None
+    host, port = args.host, args.port
+    if port is None:
+        server, service = await start_service(host, 0, workers=args.workers)
+        port = server.sockets[0].getsockname()[1]
+
+    mix = request_mix()
+    seeds = itertools.count()
+    latencies: Dict[str, List[float]] = {}
+    failures: List[int] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        run_client(host, port, args.requests, mix, seeds, args.distinct_renders, latencies, failures)
+        for _ in range(args.clients)
+    ))
+    elapsed = time.perf_counter() - start
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"{total:,} pedidos con {args.clients} clientes en {elapsed:.2f} s "
+          f"({total / elapsed:,.1f} pedidos/s, {len(failures)} fallidos)")
+    for path, values in sorted(latencies.items()):
+        values.sort()
+        p99 = values[min(len(values) - 1, int(0.99 * len(values)))]
+        print(f"  {path:<10} n={len(values):>5}  p50 {statistics.median(values) * 1e3:8.2f} ms  p99 {p99 * 1e3:8.2f} ms")
+
+    if service is not None:
+        client = Client(host, port)
+        await client.connect()
+        _, body = await client.request("GET", "/metrics")
+        await client.close()
+        cache = json.loads(body)["render_cache"]
+        print(f"RenderCache: {cache['hits']} aciertos, {cache['misses']} fallos ({cache['hit_rate']:.0%})")
+        server.close()
+        await server.wait_closed()
+        service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="servicio externo (por defecto se levanta uno local)")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=60, help="pedidos por cliente")
+    parser.add_argument("--workers", type=int, default=None, help="hilos del servicio local")
+    parser.add_argument("--distinct-renders", type=int, default=8, help="semillas distintas en /render")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
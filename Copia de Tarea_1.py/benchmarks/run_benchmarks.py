@@ -0,0 +1,174 @@
+"""Suite de benchmarks por etapa: load, build, validate y render.
+
+Corre sobre los mapas incluidos (mapa1-2.json ... mapa4.json) y sobre tableros
+sintéticos de radio creciente. Reporta ops/s, latencia p50/p99 y memoria pico
+por etapa, y guarda los resultados en JSON para comparar dos corridas:
+
+    python benchmarks/run_benchmarks.py --output base.json
+    python benchmarks/run_benchmarks.py --compare base.json --threshold 0.10
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.board import Board
+from model.exceptions import InvalidBoardException
+from model.validator import BoardValidator
+from utils.board_factory import generate_board_data
+
+ROOT = Path(__file__).resolve().parent.parent
+BUNDLED_MAPS = ("mapa1-2.json", "mapa2.json", "mapa3.json", "mapa4.json")
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def measure(fn: Callable[[], object], min_time: float, max_iterations: int) -> Dict[str, float]:
+    """Corre fn hasta acumular min_time segundos y mide la memoria pico en una corrida aparte"""
+    fn()  # calentamiento
+    samples = []
+    clock = time.perf_counter
+    deadline = clock() + min_time
+    while len(samples) < max_iterations and (clock() < deadline or len(samples) < 5):
+        start = clock()
+        fn()
+        samples.append(clock() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "iterations": len(samples),
+        "ops_per_sec": len(samples) / sum(samples),
+        "p50_ms": statistics.median(samples) * 1e3,
+        "p99_ms": _percentile(samples, 0.99) * 1e3,
+        "peak_kib": peak / 1024,
+    }
+
+
+def _unvalidated_board(data: Dict) -> Board:
+    """Board armado sin validar, para medir build/render de mapas inválidos"""
+    board = Board()
+    board._create_randomized_tiles(data["tiles"])
+    board._create_ports(data["ports"])
+    board._assign_random_numbers()
+    return board
+
+
+def _cases(radii: List[int], tmp: Path) -> List[Tuple[str, str, int]]:
+    """(nombre, ruta del JSON, radio); los sintéticos se escriben en el directorio tmp"""
+    cases = [(name, str(ROOT / name), 2) for name in BUNDLED_MAPS]
+    for radius in radii:
+        path = tmp / f"radio{radius}.json"
+        path.write_text(json.dumps(generate_board_data(radius, seed=radius)))
+        cases.append((f"radio{radius}", str(path), radius))
+    return cases
+
+
+def run_suite(radii: List[int], render_radius: int, min_time: float, max_iterations: int) -> Dict[str, Dict]:
+    from view.image_view import ImageView
+
+    validator = BoardValidator()
+    image_view = ImageView()
+    results: Dict[str, Dict] = {}
+
+    with tempfile.TemporaryDirectory(prefix="catan-bench-") as tmp:
+        for name, path, radius in _cases(radii, Path(tmp)):
+            with open(path) as f:
+                data = json.load(f)
+
+            def load():
+                try:
+                    Board().load_from_json(path)
+                except InvalidBoardException:
+                    pass
+
+            board = _unvalidated_board(data)
+            built = _unvalidated_board(data)
+            built.construir_tablero_con_hex_coords()
+
+            stages = {
+                "load": load,
+                "build": board.construir_tablero_con_hex_coords,
+                "validate": lambda: validator.validate(board.tiles, board.ports),
+            }
+            if radius <= render_radius:
+                stages["render"] = lambda: image_view.generate_board_image(
+                    built.tile_coords, built.port_positions, built.robber_position
+                )
+
+            valid = not validator.validate(board.tiles, board.ports)
+            for stage, fn in stages.items():
+                key = f"{name}/{stage}"
+                results[key] = dict(measure(fn, min_time, max_iterations), tiles=len(board.tiles), valid=valid)
+                r = results[key]
+                print(f"{key:<24} {r['ops_per_sec']:>11,.1f} ops/s  p50 {r['p50_ms']:>9.3f} ms  "
+                      f"p99 {r['p99_ms']:>9.3f} ms  pico {r['peak_kib']:>9.1f} KiB")
+    return results
+
+
+def compare(current: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """Claves cuya p50 empeoró más que threshold respecto a la línea base"""
+    regressions = []
+    print(f"\n{'etapa':<24} {'base p50':>10} {'actual p50':>11} {'cambio':>8}")
+    for key in sorted(set(current) & set(baseline)):
+        before, after = baseline[key]["p50_ms"], current[key]["p50_ms"]
+        change = (after - before) / before if before else 0.0
+        flag = "  REGRESIÓN" if change > threshold else ""
+        print(f"{key:<24} {before:>10.3f} {after:>11.3f} {change:>+8.1%}{flag}")
+        if flag:
+            regressions.append(key)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--radii", type=int, nargs="+", default=[2, 4, 8, 16])
+    parser.add_argument("--render-radius", type=int, default=4, help="radio máximo a renderizar")
+    parser.add_argument("--min-time", type=float, default=0.5, help="segundos por etapa")
+    parser.add_argument("--max-iterations", type=int, default=10_000)
+    parser.add_argument("--output", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--compare", help="JSON de una corrida anterior")
+    parser.add_argument("--threshold", type=float, default=0.10, help="empeoramiento tolerado de p50")
+    args = parser.parse_args()
+
+    results = run_suite(args.radii, args.render_radius, args.min_time, args.max_iterations)
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResultados guardados en {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} etapas empeoraron más de {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
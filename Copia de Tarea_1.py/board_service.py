@@ -0,0 +1,321 @@
+"""Servicio HTTP local para generar, validar y renderizar tableros sin relanzar Python.
+
+Mantiene en memoria las plantillas de mapas (BoardTemplate), un ImageView por hilo
+y un RenderCache; las imágenes se devuelven en la respuesta, sin escribir archivos.
+
+Uso:
+    python board_service.py --port 8765
+
+Endpoints (JSON en el cuerpo de los POST):
+    GET  /health
+    GET  /metrics
+    POST /generate  {"map": "mapa1-2.json" | "radius": 3, "count": 1, "seed": 0, "rules": false}
+    POST /validate  {"tiles": [...], "ports": [...]}
+    POST /render    mapa JSON completo, o {"map"/"radius", "seed"}; "format": "PNG" | "WEBP"
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from model.board import Board
+from model.board_generator import BatchBoardGenerator, BoardTemplate
+from model.exceptions import InvalidBoardException
+from model.number_placement import NumberPlacementRules
+from utils.board_factory import generate_board_data
+
+MAPS_DIR = Path(__file__).parent
+MAX_BODY = 1024 * 1024
+MAX_COUNT = 1000
+CONTENT_TYPES = {"PNG": "image/png", "WEBP": "image/webp"}
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+Response = Tuple[int, str, bytes]
+
+
+class RequestError(Exception):
+    def __init__(self, status: int, message: str, errors=None):
+        super().__init__(message)
+        self.status = status
+        self.errors = errors
+
+
+def _json_response(payload, status: int = 200) -> Response:
+    return status, "application/json", json.dumps(payload).encode("utf-8")
+
+
+def board_to_dict(board: Board) -> Dict:
+    """Tablero construido como JSON: tiles con coordenadas y número, puertos y ladrón"""
+    return {
+        "tiles": [
+            {"id": tile.id, "material": tile.material, "number": tile.number,
+             "coord": [board.tile_coords[tile].q, board.tile_coords[tile].r]}
+            for tile in board.tiles
+        ],
+        "ports": [
+            {"id": port.id, "material": port.material, "tile": board.port_positions[port.id][0],
+             "edge": board.port_positions[port.id][1]}
+            for port in board.ports if port.id in board.port_positions
+        ],
+        "robber": board.robber_position.id if board.robber_position else None,
+    }
+
+
+class BoardService:
+    """Estado compartido del servicio: plantillas, pool de hilos, vistas y métricas"""
+
+    def __init__(self, workers: Optional[int] = None, renderer: str = "sprites",
+                 cache_bytes: int = 64 * 1024 * 1024):
+        from view.render_cache import RenderCache
+
+        self.executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count(), thread_name_prefix="render")
+        self.renderer = renderer
+        self.render_cache = RenderCache(max_bytes=cache_bytes)
+        self._templates: Dict[str, BoardTemplate] = {}
+        self._generators: Dict[Tuple[str, Optional[int]], BatchBoardGenerator] = {}
+        self._local = threading.local()
+        self.requests: Dict[str, int] = {}
+        self.errors = 0
+        self.seconds: Dict[str, float] = {}
+        self.started = time.time()
+
+    # --- recursos precalentados ---
+
+    def _view(self):
+        """Un ImageView por hilo del pool (las vistas guardan sprites y no son seguras entre hilos)"""
+        view = getattr(self._local, "view", None)
+        if view is None:
+            if self.renderer == "sprites":
+                from view.sprite_view import SpriteImageView
+                view = SpriteImageView()
+            else:
+                from view.image_view import ImageView
+                view = ImageView()
+            view.render_cache = self.render_cache
+            self._local.view = view
+        return view
+
+    def template(self, payload: Dict) -> Tuple[str, BoardTemplate]:
+        if "radius" in payload:
+            radius = int(payload["radius"])
+            if not 0 < radius <= 10:
+                raise RequestError(400, "radius debe estar entre 1 y 10")
+            name = f"radius:{radius}"
+            if name not in self._templates:
+                self._templates[name] = BoardTemplate(generate_board_data(radius, seed=radius))
+            return name, self._templates[name]
+
+        name = os.path.basename(str(payload.get("map", "mapa1-2.json")))
+        if name not in self._templates:
+            path = MAPS_DIR / name
+            if not name.endswith(".json") or not path.is_file():
+                raise RequestError(404, f"Mapa desconocido: {name}")
+            try:
+                self._templates[name] = BoardTemplate.from_json(str(path))
+            except InvalidBoardException as e:
+                raise RequestError(422, f"El mapa {name} no es válido", e.errors)
+        return name, self._templates[name]
+
+    def warm_up(self) -> None:
+        self.template({"map": "mapa1-2.json"})
+        self.executor.submit(self._view).result()
+
+    def _generate_boards(self, payload: Dict):
+        name, template = self.template(payload)
+        count = int(payload.get("count", 1))
+        if not 0 < count <= MAX_COUNT:
+            raise RequestError(400, f"count debe estar entre 1 y {MAX_COUNT}")
+        seed = payload.get("seed")
+        if seed is None:
+            key = (name, None)
+            if key not in self._generators:
+                self._generators[key] = BatchBoardGenerator(template)
+            generator = self._generators[key]
+        else:
+            generator = BatchBoardGenerator(template, seed=int(seed))
+        rules = NumberPlacementRules() if payload.get("rules") else None
+        return list(generator.generate(count, rules=rules).boards())
+
+    # --- endpoints ---
+
+    async def generate(self, payload: Dict) -> Response:
+        loop = asyncio.get_running_loop()
+        boards = await loop.run_in_executor(self.executor, self._generate_boards, payload)
+        return _json_response({"boards": [board_to_dict(board) for board in boards]})
+
+    @staticmethod
+    def _validate(payload: Dict) -> List[Dict]:
+        try:
+            Board().load_from_dict(payload)
+        except InvalidBoardException as e:
+            return [{"code": error.code, "message": error.message, "tile_id": error.tile_id}
+                    for error in (e.errors or [])] or [{"code": None, "message": str(e), "tile_id": None}]
+        return []
+
+    async def validate(self, payload: Dict) -> Response:
+        loop = asyncio.get_running_loop()
+        errors = await loop.run_in_executor(self.executor, self._validate, payload)
+        return _json_response({"valid": not errors, "errors": errors})
+
+    def _render(self, payload: Dict, image_format: str) -> bytes:
+        if "tiles" in payload:
+            board = Board()
+            try:
+                board.load_from_dict(payload)
+            except InvalidBoardException as e:
+                raise RequestError(422, str(e), e.errors)
+            board.construir_tablero_con_hex_coords()
+        else:
+            board = self._generate_boards(dict(payload, count=1))[0]
+        return self._view().render_bytes(board.tile_coords, board.port_positions, board.robber_position, image_format)
+
+    async def render(self, payload: Dict) -> Response:
+        image_format = str(payload.get("format", "PNG")).upper()
+        if image_format not in CONTENT_TYPES:
+            raise RequestError(400, f"Formato no soportado: {image_format}")
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(self.executor, self._render, payload, image_format)
+        return 200, CONTENT_TYPES[image_format], data
+
+    def metrics(self) -> Response:
+        return _json_response({
+            "uptime_seconds": time.time() - self.started,
+            "requests": self.requests,
+            "errors": self.errors,
+            "mean_ms": {path: self.seconds[path] / self.requests[path] * 1e3 for path in self.requests},
+            "templates": sorted(self._templates),
+            "render_cache": self.render_cache.metrics(),
+        })
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Response:
+        routes = {"/generate": self.generate, "/validate": self.validate, "/render": self.render}
+        if path == "/health":
+            return _json_response({"status": "ok"})
+        if path == "/metrics":
+            return self.metrics()
+        if path not in routes:
+            raise RequestError(404, f"Ruta desconocida: {path}")
+        if method != "POST":
+            raise RequestError(405, "Usar POST")
+        try:
+            payload = json.loads(body or b"{}")
+        except json.JSONDecodeError:
+            raise RequestError(400, "Formato JSON inválido")
+        if not isinstance(payload, dict):
+            raise RequestError(400, "El cuerpo debe ser un objeto JSON")
+        return await routes[path](payload)
+
+    # --- HTTP/1.1 mínimo con keep-alive ---
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, _ = request_line.split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        key, value = line.split(":", 1)
+                        headers[key.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, *_json_response({"error": "Content-Length inválido"}, 400), False)
+                    break
+                if length > MAX_BODY:
+                    await self._respond(writer, *_json_response({"error": "Cuerpo demasiado grande"}, 413), False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                path = target.split("?", 1)[0]
+                start = time.perf_counter()
+                try:
+                    status, content_type, data = await self.dispatch(method, path, body)
+                except RequestError as e:
+                    errors = [{"code": error.code, "message": error.message, "tile_id": error.tile_id}
+                              for error in (e.errors or [])]
+                    status, content_type, data = _json_response({"error": str(e), "errors": errors}, e.status)
+                except (KeyError, TypeError, ValueError) as e:
+                    status, content_type, data = _json_response({"error": f"Solicitud inválida: {e}"}, 400)
+                except Exception as e:
+                    status, content_type, data = _json_response({"error": f"Error inesperado: {e}"}, 500)
+                self.requests[path] = self.requests.get(path, 0) + 1
+                self.seconds[path] = self.seconds.get(path, 0.0) + time.perf_counter() - start
+                if status >= 400:
+                    self.errors += 1
+
+                await self._respond(writer, status, content_type, data, keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status: int, content_type: str, data: bytes, keep_alive: bool) -> None:
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + data)
+        await writer.drain()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False)
+
+
+async def start_service(host: str = "127.0.0.1", port: int = 8765, **options) -> Tuple[asyncio.AbstractServer, BoardService]:
+    """Crea el servicio precalentado y empieza a escuchar (port=0 elige uno libre)"""
+    service = BoardService(**options)
+    await asyncio.get_running_loop().run_in_executor(None, service.warm_up)
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    return server, service
+
+
+async def _serve(args) -> None:
+    server, service = await start_service(args.host, args.port, workers=args.workers, renderer=args.renderer)
+    address = server.sockets[0].getsockname()
+    print(f"Servicio escuchando en http://{address[0]}:{address[1]}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio HTTP local de tableros")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="hilos para generar y codificar")
+    parser.add_argument("--renderer", choices=("sprites", "classic"), default="sprites")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,35 @@
 # main.py
+import argparse
 import sys
 import os
 from pathlib import Path
-from view.image_view import ImageView
+import json
+
+# Asegurar que Python encuentre los módulos (antes de importarlos)
+sys.path.insert(0, str(Path(__file__).parent))
+
 from model.board import Board
 from model.exceptions import InvalidBoardException
-import json
 
-# Asegurar que Python encuentre los módulos
-sys.path.append(str(Path(__file__).parent))
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Carga, valida y dibuja un tablero de Catan")
+    parser.add_argument("mapa", nargs="?", default=os.path.join(os.path.dirname(__file__), "mapa1-2.json"),
+                        help="archivo JSON del mapa (por defecto mapa1-2.json)")
+    parser.add_argument("--headless", action="store_true", help="no genera la imagen (no importa PIL)")
+    parser.add_argument("--validate-only", action="store_true", help="solo carga y valida el mapa")
+    parser.add_argument("--no-show", action="store_true", help="guarda la imagen sin abrir el visor")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
     try:
         board = Board()
-        # Usar ruta absoluta para el archivo JSON
-        json_path = os.path.join(os.path.dirname(__file__), "mapa1-2.json")
-        board.load_from_json(json_path)
+        board.load_from_json(args.mapa)
+        if args.validate_only:
+            print("Mapa cargado y validado correctamente!")
+            return 0
         board.construir_tablero_con_hex_coords()  # Asegúrate de construir el tablero antes de usar port_positions
         print("Mapa cargado y validado correctamente!")
         print(board)
@@ -33,27 +47,34 @@ def main():
     
     except FileNotFoundError:
         print("Error: Archivo no encontrado")
-        return  # Termina el programa
+        return 1  # Termina el programa
     except json.JSONDecodeError:
         print("Error: Formato JSON inválido")
-        return  # Termina el programa
+        return 1  # Termina el programa
     except InvalidBoardException as e:
-        if "19 tiles" in str(e):  # Verifica si el mensaje de la excepción menciona los 19 tiles
-            print("Error: El mapa no es válido porque tiene una cantidad distinta de 19 tiles.")
+        if "número hexagonal" in str(e):  # Verifica si el mensaje de la excepción menciona la cantidad de tiles
+            print("Error: El mapa no es válido porque su cantidad de tiles no forma un tablero hexagonal.")
         else:
             print(f"Error en el tablero: {str(e)}")
-        return  # Termina el programa
+        return 1  # Termina el programa
     except Exception as e:
         print(f"Error inesperado: {str(e)}")
-        return  # Termina el programa
+        return 1  # Termina el programa
+
+    if args.headless:
+        return 0
+
+    # Generar y mostrar imagen (PIL se importa recién acá)
+    from view.image_view import ImageView
 
-    # Generar y mostrar imagen
     image_view = ImageView()
     board_image = image_view.generate_board_image(board.tile_coords, board.port_positions, board.robber_position)
-    image_view.show_image(board_image)
+    if not args.no_show:
+        image_view.show_image(board_image)
     image_view.save_image(board_image)
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 
 MAPA_PATH = "Copia de Tarea_1.py/mapa1-2.json"
\ No newline at end of file
@@ -1,12 +1,63 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 from collections import deque
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HexCoord:
     """Coordenadas axiales optimizadas para Catan"""
     q: int  # columna (eje x)
     r: int  # fila (eje y)
     
     def __add__(self, other):
-        return HexCoord(self.q + other.q, self.r + other.r)
\ No newline at end of file
+        return HexCoord(self.q + other.q, self.r + other.r)
+
+
+# Desplazamientos axiales de cada dirección de los edges del JSON
+HEX_DIRECTIONS: Dict[str, HexCoord] = {
+    'top-left': HexCoord(0, -1),
+    'top-right': HexCoord(1, -1),
+    'right': HexCoord(1, 0),
+    'bottom-right': HexCoord(0, 1),
+    'bottom-left': HexCoord(-1, 1),
+    'left': HexCoord(-1, 0),
+}
+
+
+def tile_count_for_radius(radius: int) -> int:
+    """Cantidad de hexágonos de un tablero hexagonal de radio dado"""
+    return 3 * radius * (radius + 1) + 1
+
+
+def radius_for_tile_count(count: int) -> Optional[int]:
+    """Radio del tablero para una cantidad de tiles, o None si no es hexagonal"""
+    radius = 0
+    while tile_count_for_radius(radius) < count:
+        radius += 1
+    return radius if tile_count_for_radius(radius) == count else None
+
+
+def hex_coords_for_radius(radius: int) -> List[HexCoord]:
+    """Coordenadas de un tablero hexagonal ordenadas por fila y columna"""
+    return [
+        HexCoord(q, r)
+        for r in range(-radius, radius + 1)
+        for q in range(max(-radius, -r - radius), min(radius, -r + radius) + 1)
+    ]
+
+
+# Direcciones en sentido horario; dos direcciones consecutivas comparten una esquina
+DIRECTION_ORDER: List[str] = list(HEX_DIRECTIONS)
+
+# Dirección inversa de cada edge (la que usa el vecino para apuntar de vuelta)
+REVERSE_DIRECTIONS: Dict[str, str] = {
+    direction: DIRECTION_ORDER[(i + 3) % 6] for i, direction in enumerate(DIRECTION_ORDER)
+}
+
+
+def hex_corners(coord: HexCoord) -> List[FrozenSet[HexCoord]]:
+    """Las 6 esquinas de un hexágono, cada una como el trío de hexágonos que la comparten"""
+    offsets = list(HEX_DIRECTIONS.values())
+    return [
+        frozenset((coord, coord + offsets[i], coord + offsets[(i + 1) % 6]))
+        for i in range(6)
+    ]
@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from utils.constants import MATERIAL_CODES, NUMBER_PIPS
+
+# Recursos productivos en el orden de sus códigos (el desierto queda afuera)
+RESOURCES: Tuple[str, ...] = tuple(material for material in MATERIAL_CODES if material != "desert")
+RESOURCE_CODES = np.array([MATERIAL_CODES[resource] for resource in RESOURCES], dtype=np.uint8)
+
+# Pips por número, indexable directamente con el arreglo de números
+PIP_TABLE = np.zeros(13, dtype=np.float32)
+for _number, _pips in NUMBER_PIPS.items():
+    PIP_TABLE[_number] = _pips
+
+MAX_VERTEX_PIPS = 3 * max(NUMBER_PIPS.values())
+
+
+@dataclass(frozen=True)
+class FairnessWeights:
+    """Peso de cada componente en el puntaje de equidad"""
+    scarcity: float = 1.0  # desvío de la producción de cada recurso respecto a su parte esperada
+    spread: float = 1.0    # concentración de los pips de cada recurso en pocas esquinas
+    hotspot: float = 1.0   # producción de la mejor esquina respecto al máximo teórico
+
+
+@dataclass
+class FairnessReport:
+    """Métricas por tablero de un lote (B tableros, V vértices, R recursos)"""
+    vertex_production: np.ndarray  # (B, V, R) pips por esquina y recurso
+    resource_pips: np.ndarray      # (B, R) pips totales por recurso
+    scarcity: np.ndarray           # (B, R) pips / pips esperados; < 1 es escaso
+    spread: np.ndarray             # (B, R) coeficiente de variación entre esquinas
+    hotspot: np.ndarray            # (B,) mejor esquina / MAX_VERTEX_PIPS
+    scores: np.ndarray             # (B,) en (0, 1]; más alto es más equitativo
+
+    def top_k(self, k: int) -> np.ndarray:
+        """Índices de los k tableros más equitativos, ordenados"""
+        return top_k(self.scores, k)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    k = min(k, len(scores))
+    best = np.argpartition(-scores, k - 1)[:k]
+    return best[np.argsort(-scores[best])]
+
+
+def resource_pip_matrix(materials: np.ndarray, numbers: np.ndarray) -> np.ndarray:
+    """(B, T, R): pips de cada tile repartidos en la columna de su recurso"""
+    pips = PIP_TABLE[np.asarray(numbers)]
+    one_hot = np.asarray(materials)[..., None] == RESOURCE_CODES
+    return one_hot * pips[..., None]
+
+
+def board_fairness(materials: np.ndarray, numbers: np.ndarray, incidence: np.ndarray,
+                   weights: FairnessWeights = FairnessWeights()) -> FairnessReport:
+    """Métricas de producción y equidad de un lote de tableros con operaciones matriciales
+
+    materials y numbers son (B, T) en el orden de columnas de incidence (V, T), por
+    ejemplo un BoardBatch con BoardTopology.for_template(batch.template).
+    """
+    tile_pips = resource_pip_matrix(materials, numbers)          # (B, T, R)
+    vertex_production = np.matmul(incidence, tile_pips)          # (B, V, R)
+    resource_pips = tile_pips.sum(axis=1)                         # (B, R)
+
+    # Parte esperada: proporcional a la cantidad de tiles de cada recurso
+    tile_counts = (np.asarray(materials)[..., None] == RESOURCE_CODES).sum(axis=1)  # (B, R)
+    pips_per_tile = resource_pips.sum(axis=1, keepdims=True) / np.maximum(tile_counts.sum(axis=1, keepdims=True), 1)
+    expected = tile_counts * pips_per_tile
+    scarcity = np.divide(resource_pips, expected, out=np.ones_like(resource_pips), where=expected > 0)
+
+    mean = vertex_production.mean(axis=1)
+    std = vertex_production.std(axis=1)
+    spread = np.divide(std, mean, out=np.zeros_like(std), where=mean > 0)
+
+    hotspot = vertex_production.sum(axis=2).max(axis=1) / MAX_VERTEX_PIPS
+
+    penalty = (weights.scarcity * np.abs(scarcity - 1).mean(axis=1)
+               + weights.spread * spread.mean(axis=1)
+               + weights.hotspot * hotspot)
+    scores = 1.0 / (1.0 + penalty)
+    return FairnessReport(vertex_production, resource_pips, scarcity, spread, hotspot, scores)
+
+
+def fairness_scores(materials: np.ndarray, numbers: np.ndarray, incidence: np.ndarray,
+                    weights: FairnessWeights = FairnessWeights(), chunk_size: int = 50_000) -> np.ndarray:
+    """Solo los puntajes, procesando en bloques para acotar la memoria en lotes enormes"""
+    if len(materials) == 0:
+        return np.empty(0, dtype=np.float32)
+    return np.concatenate([
+        board_fairness(materials[start:start + chunk_size], numbers[start:start + chunk_size], incidence, weights).scores
+        for start in range(0, len(materials), chunk_size)
+    ])
+
+
+def batch_fairness(batch, weights: FairnessWeights = FairnessWeights()) -> FairnessReport:
+    """Atajo para un BoardBatch usando la topología compartida de su plantilla"""
+    from model.topology import BoardTopology
+
+    incidence = BoardTopology.for_template(batch.template).incidence_matrix()
+    return board_fairness(batch.materials, batch.numbers, incidence, weights)
@@ -0,0 +1,185 @@
+import weakref
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from model.board import Board
+from model.HexCoord import DIRECTION_ORDER, HexCoord
+from model.port import Port
+from model.tile import Tile
+from utils.constants import MATERIAL_CODES, PORT_CODES
+
+MATERIALS: Tuple[str, ...] = tuple(MATERIAL_CODES)
+PORT_MATERIALS: Tuple[str, ...] = tuple(PORT_CODES)
+
+# Valores especiales de la matriz de vecinos
+NO_EDGE = -1          # la dirección no figura en edges
+PORT_BASE = -2        # puerto p: PORT_BASE - p
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+class BoardLayout:
+    """Parte fija de un tablero (ids, vecinos, puertos y coordenadas), compartida
+
+    Todos los tableros con la misma forma comparten una única instancia (ver
+    BoardLayout.intern), así cada BoardArrays solo guarda sus materiales y números;
+    el registro no retiene layouts que ya nadie usa.
+    neighbors[t, d] es el índice del vecino en la dirección DIRECTION_ORDER[d],
+    NO_EDGE si no hay edge o PORT_BASE - p si el edge es el puerto p.
+    """
+
+    __slots__ = ("tile_ids", "port_ids", "port_materials", "neighbors", "coords", "extra_edges", "_key",
+                 "__weakref__")
+
+    # Referencias débiles: un layout se libera cuando ningún BoardArrays lo usa
+    _interned: "weakref.WeakValueDictionary[tuple, BoardLayout]" = weakref.WeakValueDictionary()
+
+    def __init__(self, tile_ids, port_ids, port_materials, neighbors, coords=None, extra_edges=()):
+        self.tile_ids: Tuple[str, ...] = tuple(tile_ids)
+        self.port_ids: Tuple[str, ...] = tuple(port_ids)
+        self.port_materials = _read_only(np.asarray(port_materials, dtype=np.uint8))
+        self.neighbors = _read_only(np.asarray(neighbors, dtype=np.int16).reshape(-1, 6))
+        self.coords = None if coords is None else _read_only(np.asarray(coords, dtype=np.int16).reshape(-1, 2))
+        # Edges que apuntan a ids desconocidos: (tile, dirección, destino), para no perder nada
+        self.extra_edges: Tuple[Tuple[int, int, str], ...] = tuple(extra_edges)
+        self._key = (
+            self.tile_ids, self.port_ids, self.port_materials.tobytes(), self.neighbors.tobytes(),
+            None if self.coords is None else self.coords.tobytes(), self.extra_edges,
+        )
+
+    @classmethod
+    def intern(cls, layout: "BoardLayout") -> "BoardLayout":
+        return cls._interned.setdefault(layout._key, layout)
+
+    def __len__(self) -> int:
+        return len(self.tile_ids)
+
+    def edges(self, index: int) -> Dict[str, str]:
+        """Reconstruye el diccionario edges del tile index"""
+        edges = {}
+        for d, target in enumerate(self.neighbors[index].tolist()):
+            if target >= 0:
+                edges[DIRECTION_ORDER[d]] = self.tile_ids[target]
+            elif target <= PORT_BASE:
+                edges[DIRECTION_ORDER[d]] = self.port_ids[PORT_BASE - target]
+        for tile, d, target in self.extra_edges:
+            if tile == index:
+                edges[DIRECTION_ORDER[d]] = target
+        return edges
+
+    def __repr__(self) -> str:
+        return f"BoardLayout(tiles={len(self.tile_ids)}, ports={len(self.port_ids)})"
+
+
+class BoardArrays:
+    """Tablero compacto: códigos de material y números en arreglos uint8 más el ladrón
+
+    La conversión con Board es sin pérdida: from_board(board).to_board() reproduce
+    tiles (ids, materiales, números y edges), puertos, ladrón y, si el tablero estaba
+    construido, hex_grid, tile_coords y port_positions.
+    """
+
+    __slots__ = ("layout", "materials", "numbers", "robber")
+
+    def __init__(self, layout: BoardLayout, materials: np.ndarray, numbers: np.ndarray, robber: int = NO_EDGE):
+        self.layout = layout
+        self.materials = np.asarray(materials, dtype=np.uint8)
+        self.numbers = np.asarray(numbers, dtype=np.uint8)
+        self.robber = robber
+
+    @classmethod
+    def from_board(cls, board: Board) -> "BoardArrays":
+        tiles = board.tiles
+        tile_index = {tile.id: t for t, tile in enumerate(tiles)}
+        port_index = {port.id: p for p, port in enumerate(board.ports)}
+
+        unknown = {tile.material for tile in tiles} - set(MATERIAL_CODES)
+        unknown |= {port.material for port in board.ports} - set(PORT_CODES)
+        if unknown:
+            raise ValueError(f"Materiales sin código compacto: {sorted(unknown)}")
+
+        neighbors = np.full((len(tiles), 6), NO_EDGE, dtype=np.int16)
+        extra_edges = []
+        for t, tile in enumerate(tiles):
+            for d, direction in enumerate(DIRECTION_ORDER):
+                target = tile.edges.get(direction)
+                if target is None:
+                    continue
+                if target in tile_index:
+                    neighbors[t, d] = tile_index[target]
+                elif target in port_index:
+                    neighbors[t, d] = PORT_BASE - port_index[target]
+                else:
+                    extra_edges.append((t, d, target))
+
+        coords = None
+        if board.tile_coords and all(tile in board.tile_coords for tile in tiles):
+            coords = [(board.tile_coords[tile].q, board.tile_coords[tile].r) for tile in tiles]
+
+        layout = BoardLayout.intern(BoardLayout(
+            [tile.id for tile in tiles],
+            [port.id for port in board.ports],
+            [PORT_CODES[port.material] for port in board.ports],
+            neighbors, coords, extra_edges,
+        ))
+        robber = tile_index.get(board.robber_position.id, NO_EDGE) if board.robber_position is not None else NO_EDGE
+        return cls(
+            layout,
+            [MATERIAL_CODES[tile.material] for tile in tiles],
+            [tile.number or 0 for tile in tiles],
+            robber,
+        )
+
+    def to_board(self, build: bool = False) -> Board:
+        """Board equivalente; si hay coordenadas guardadas se restauran sin recorrer el grafo"""
+        layout = self.layout
+        board = Board()
+        tiles = []
+        for t, (tile_id, material, number) in enumerate(
+                zip(layout.tile_ids, self.materials.tolist(), self.numbers.tolist())):
+            tile = Tile(tile_id, MATERIALS[material], layout.edges(t))
+            tile.number = number or None
+            tiles.append(tile)
+        board.tiles = tiles
+        board.ports = [
+            Port(port_id, PORT_MATERIALS[code])
+            for port_id, code in zip(layout.port_ids, layout.port_materials.tolist())
+        ]
+        board.robber_position = tiles[self.robber] if self.robber >= 0 else None
+
+        if layout.coords is not None:
+            for tile, (q, r) in zip(tiles, layout.coords.tolist()):
+                coord = HexCoord(q, r)
+                board.hex_grid[coord] = tile
+                board.tile_coords[tile] = coord
+            # Igual que construir_tablero_con_hex_coords (tiles ya en orden de fila)
+            for tile in tiles:
+                for direction, neighbor_id in tile.edges.items():
+                    if neighbor_id.startswith("p"):
+                        board.port_positions[neighbor_id] = (tile.id, direction)
+        elif build:
+            board.construir_tablero_con_hex_coords()
+        return board
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes propios de este tablero (sin contar el BoardLayout compartido)"""
+        return self.materials.nbytes + self.numbers.nbytes
+
+    def __len__(self) -> int:
+        return len(self.materials)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BoardArrays):
+            return NotImplemented
+        return (self.layout is other.layout and self.robber == other.robber
+                and np.array_equal(self.materials, other.materials) and np.array_equal(self.numbers, other.numbers))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"BoardArrays(tiles={len(self.materials)}, robber={self.robber})"
@@ -0,0 +1,241 @@
+"""Formato binario de ancho fijo para bibliotecas de tableros.
+
+Archivo = cabecera de HEADER_SIZE bytes + N registros de igual tamaño. Cada
+registro guarda códigos de material, números, coordenadas axiales, la
+adyacencia (índice del vecino en cada dirección de DIRECTION_ORDER, -1 si no
+hay), los puertos (material, tile y dirección) y el tile del ladrón. Los ids se
+normalizan a tileNN / pNN según el orden almacenado.
+"""
+import mmap
+import struct
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from model.board import Board
+from model.board_generator import MATERIALS, BoardBatch, BoardTemplate
+from model.exceptions import InvalidBoardException
+from model.HexCoord import DIRECTION_ORDER, HexCoord
+from model.port import Port
+from model.tile import Tile
+from utils.constants import MATERIAL_CODES, PORT_CODES
+
+MAGIC = b"CATANBRD"
+VERSION = 1
+HEADER = struct.Struct("<8sHHHxxQ")  # magic, versión, máx. tiles, máx. puertos, cantidad
+HEADER_SIZE = 32
+
+PORT_MATERIALS: Tuple[str, ...] = tuple(PORT_CODES)
+DIRECTION_CODES: Dict[str, int] = {direction: code for code, direction in enumerate(DIRECTION_ORDER)}
+
+
+def record_dtype(max_tiles: int, max_ports: int) -> np.dtype:
+    """dtype estructurado de un registro; todos los registros del archivo lo comparten"""
+    return np.dtype([
+        ("n_tiles", "<u2"),
+        ("n_ports", "<u2"),
+        ("robber", "<i2"),
+        ("materials", "u1", (max_tiles,)),
+        ("numbers", "u1", (max_tiles,)),
+        ("q", "i1", (max_tiles,)),
+        ("r", "i1", (max_tiles,)),
+        ("neighbors", "<i2", (max_tiles, 6)),
+        ("port_materials", "u1", (max_ports,)),
+        ("port_tiles", "<i2", (max_ports,)),
+        ("port_directions", "u1", (max_ports,)),
+    ])
+
+
+def _layout(edges: Sequence[Dict[str, str]], tile_ids: Sequence[str], ports: Sequence[Tuple[str, str]]):
+    """Adyacencia y puertos como arreglos de índices, a partir de los edges por id"""
+    index_of = {tile_id: i for i, tile_id in enumerate(tile_ids)}
+    port_index = {port_id: j for j, (port_id, _) in enumerate(ports)}
+    neighbors = np.full((len(tile_ids), 6), -1, dtype=np.int16)
+    port_tiles = np.full(len(ports), -1, dtype=np.int16)
+    port_directions = np.zeros(len(ports), dtype=np.uint8)
+    for i, tile_edges in enumerate(edges):
+        for direction, target in tile_edges.items():
+            if target in index_of:
+                neighbors[i, DIRECTION_CODES[direction]] = index_of[target]
+            elif target in port_index:
+                port_tiles[port_index[target]] = i
+                port_directions[port_index[target]] = DIRECTION_CODES[direction]
+    port_materials = np.array([PORT_CODES[material] for _, material in ports], dtype=np.uint8)
+    return neighbors, port_materials, port_tiles, port_directions
+
+
+class BoardBinaryWriter:
+    """Escribe tableros en el formato binario; usar como context manager"""
+
+    def __init__(self, file_path: str, max_tiles: int = 19, max_ports: int = 9):
+        self.max_tiles = max_tiles
+        self.max_ports = max_ports
+        self.dtype = record_dtype(max_tiles, max_ports)
+        self.count = 0
+        self._file = open(file_path, "wb")
+        self._file.write(bytes(HEADER_SIZE))
+
+    def _empty(self, count: int) -> np.ndarray:
+        records = np.zeros(count, dtype=self.dtype)
+        records["neighbors"] = -1
+        records["port_tiles"] = -1
+        return records
+
+    def _check_size(self, n_tiles: int, n_ports: int) -> None:
+        if n_tiles > self.max_tiles or n_ports > self.max_ports:
+            raise InvalidBoardException(
+                f"El tablero ({n_tiles} tiles, {n_ports} puertos) no entra en registros de "
+                f"{self.max_tiles} tiles y {self.max_ports} puertos."
+            )
+
+    def write(self, board: Board) -> None:
+        if not board.tile_coords:
+            board.construir_tablero_con_hex_coords()
+        tiles, ports = board.tiles, board.ports
+        n, p = len(tiles), len(ports)
+        self._check_size(n, p)
+
+        neighbors, port_materials, port_tiles, port_directions = _layout(
+            [tile.edges for tile in tiles], [tile.id for tile in tiles], [(port.id, port.material) for port in ports]
+        )
+        record = self._empty(1)[0]
+        record["n_tiles"], record["n_ports"] = n, p
+        record["robber"] = tiles.index(board.robber_position) if board.robber_position in tiles else -1
+        record["materials"][:n] = [MATERIAL_CODES[tile.material] for tile in tiles]
+        record["numbers"][:n] = [tile.number or 0 for tile in tiles]
+        record["q"][:n] = [board.tile_coords[tile].q for tile in tiles]
+        record["r"][:n] = [board.tile_coords[tile].r for tile in tiles]
+        record["neighbors"][:n] = neighbors
+        record["port_materials"][:p] = port_materials
+        record["port_tiles"][:p] = port_tiles
+        record["port_directions"][:p] = port_directions
+        self._file.write(record.tobytes())
+        self.count += 1
+
+    def write_batch(self, batch: BoardBatch) -> None:
+        """Escribe un lote completo de una vez, sin construir objetos Board"""
+        template: BoardTemplate = batch.template
+        n, p = len(template), len(template.ports)
+        self._check_size(n, p)
+
+        neighbors, port_materials, port_tiles, port_directions = _layout(template.edges, template.tile_ids, template.ports)
+        records = self._empty(len(batch))
+        records["n_tiles"], records["n_ports"] = n, p
+        records["robber"] = batch.robber
+        records["materials"][:, :n] = batch.materials
+        records["numbers"][:, :n] = batch.numbers
+        records["q"][:, :n] = [coord.q for coord in template.coords]
+        records["r"][:, :n] = [coord.r for coord in template.coords]
+        records["neighbors"][:, :n] = neighbors
+        records["port_materials"][:, :p] = port_materials
+        records["port_tiles"][:, :p] = port_tiles
+        records["port_directions"][:, :p] = port_directions
+        self._file.write(records.tobytes())
+        self.count += len(batch)
+
+    def close(self) -> None:
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.max_tiles, self.max_ports, self.count))
+        self._file.close()
+
+    def __enter__(self) -> "BoardBinaryWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class BoardLibrary:
+    """Lector con mmap: acceso aleatorio O(1) y sin copias a cualquier tablero por índice"""
+
+    def __init__(self, file_path: str):
+        self._file = open(file_path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.max_tiles, self.max_ports, count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise InvalidBoardException(f"{file_path} no es una biblioteca de tableros válida.")
+        self.dtype = record_dtype(self.max_tiles, self.max_ports)
+        self.records = np.frombuffer(self._mmap, dtype=self.dtype, count=count, offset=HEADER_SIZE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index: int) -> np.void:
+        return self.records[index]
+
+    @property
+    def materials(self) -> np.ndarray:
+        """Vista (tableros x max_tiles) de los códigos de material"""
+        return self.records["materials"]
+
+    @property
+    def numbers(self) -> np.ndarray:
+        """Vista (tableros x max_tiles) de los números"""
+        return self.records["numbers"]
+
+    def board(self, index: int) -> Board:
+        """Reconstruye el Board del registro index sin parsear JSON ni recorrer el grafo"""
+        record = self.records[index]
+        n, p = int(record["n_tiles"]), int(record["n_ports"])
+        ids = [f"tile{i + 1:02d}" for i in range(n)]
+        port_ids = [f"p{j + 1:02d}" for j in range(p)]
+
+        edges: List[Dict[str, str]] = [{} for _ in range(n)]
+        for i, row in enumerate(record["neighbors"][:n].tolist()):
+            for code, neighbor in enumerate(row):
+                if neighbor >= 0:
+                    edges[i][DIRECTION_ORDER[code]] = ids[neighbor]
+        port_tiles = record["port_tiles"][:p].tolist()
+        port_directions = record["port_directions"][:p].tolist()
+        for j, (tile_index, code) in enumerate(zip(port_tiles, port_directions)):
+            if tile_index >= 0:
+                edges[tile_index][DIRECTION_ORDER[code]] = port_ids[j]
+
+        board = Board()
+        board.tiles = [
+            Tile(tile_id, MATERIALS[material], tile_edges)
+            for tile_id, material, tile_edges in zip(ids, record["materials"][:n].tolist(), edges)
+        ]
+        for tile, number in zip(board.tiles, record["numbers"][:n].tolist()):
+            if number:
+                tile.set_number(number)
+        board.ports = [
+            Port(port_id, PORT_MATERIALS[material])
+            for port_id, material in zip(port_ids, record["port_materials"][:p].tolist())
+        ]
+        robber = int(record["robber"])
+        board.robber_position = board.tiles[robber] if robber >= 0 else None
+
+        for tile, q, r in zip(board.tiles, record["q"][:n].tolist(), record["r"][:n].tolist()):
+            coord = HexCoord(q, r)
+            board.hex_grid[coord] = tile
+            board.tile_coords[tile] = coord
+        board.port_positions = {
+            port_ids[j]: (ids[tile_index], DIRECTION_ORDER[code])
+            for j, (tile_index, code) in enumerate(zip(port_tiles, port_directions))
+            if tile_index >= 0
+        }
+        return board
+
+    def close(self) -> None:
+        self.records = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Todavía hay vistas de registros en uso; el mmap se libera cuando desaparezcan
+            pass
+        self._file.close()
+
+    def __enter__(self) -> "BoardLibrary":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_boards(file_path: str, boards: Iterable[Board], max_tiles: int = 19, max_ports: int = 9) -> int:
+    """Escribe una secuencia de Board y devuelve la cantidad escrita"""
+    with BoardBinaryWriter(file_path, max_tiles, max_ports) as writer:
+        for board in boards:
+            writer.write(board)
+    return writer.count
@@ -0,0 +1,129 @@
+import json
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from model.board import Board, build_number_pool
+from model.number_placement import NumberPlacementRules, NumberPlacer
+from model.port import Port
+from model.tile import Tile
+from utils.constants import MATERIAL_CODES
+
+# Tabla inversa código -> material
+MATERIALS: Tuple[str, ...] = tuple(MATERIAL_CODES)
+DESERT_CODE = MATERIAL_CODES["desert"]
+
+
+class BoardTemplate:
+    """Plantilla de mapa parseada una sola vez para generar muchos tableros"""
+
+    def __init__(self, data: Dict):
+        # Validar y construir la plantilla una única vez con el cargador normal
+        board = Board()
+        board.load_from_dict(data)
+        board.construir_tablero_con_hex_coords()
+
+        self.tile_ids: Tuple[str, ...] = tuple(tile["id"] for tile in data["tiles"])
+        self.coords = tuple(board.tile_coords[board.find_tile_by_id(tile_id)] for tile_id in self.tile_ids)
+        self.edges: Tuple[Dict[str, str], ...] = tuple(dict(tile["edges"]) for tile in data["tiles"])
+        self.ports: Tuple[Tuple[str, str], ...] = tuple((port["id"], port["material"]) for port in data["ports"])
+        self.base_materials = np.array([MATERIAL_CODES[tile["material"]] for tile in data["tiles"]], dtype=np.uint8)
+
+        self.desert_index = int(np.flatnonzero(self.base_materials == DESERT_CODE)[0])
+        self.numbered_indices = np.flatnonzero(self.base_materials != DESERT_CODE)
+        self.material_pool = self.base_materials[self.numbered_indices]
+        self.number_pool = np.array(build_number_pool(len(self.numbered_indices)), dtype=np.uint8)
+        self._placers: Dict[NumberPlacementRules, NumberPlacer] = {}
+
+    def number_placer(self, rules: NumberPlacementRules) -> NumberPlacer:
+        """Solver de números para esta plantilla (se crea una vez por conjunto de reglas)"""
+        if rules not in self._placers:
+            numbered = self.base_materials != DESERT_CODE
+            self._placers[rules] = NumberPlacer(self.coords, numbered.tolist(), self.number_pool.tolist(), rules)
+        return self._placers[rules]
+
+    @classmethod
+    def from_json(cls, file_path: str) -> "BoardTemplate":
+        with open(file_path, 'r') as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self.tile_ids)
+
+    def __repr__(self) -> str:
+        return f"BoardTemplate(tiles={len(self.tile_ids)}, ports={len(self.ports)})"
+
+
+@dataclass
+class BoardBatch:
+    """Lote de tableros en forma de arreglos (tableros x tiles)"""
+    template: BoardTemplate
+    materials: np.ndarray  # uint8, códigos de MATERIAL_CODES
+    numbers: np.ndarray    # uint8, 0 para el desierto
+    robber: np.ndarray     # índice del tile con el ladrón
+
+    def __len__(self) -> int:
+        return len(self.materials)
+
+    def board(self, index: int, build: bool = True) -> Board:
+        """Construye el Board completo del tablero index bajo demanda"""
+        template = self.template
+        board = Board()
+        board.tiles = [
+            Tile(tile_id, MATERIALS[material], dict(edges))
+            for tile_id, material, edges in zip(template.tile_ids, self.materials[index].tolist(), template.edges)
+        ]
+        for tile, number in zip(board.tiles, self.numbers[index].tolist()):
+            if number:
+                tile.set_number(number)
+        board.ports = [Port(port_id, material) for port_id, material in template.ports]
+        board.robber_position = board.tiles[int(self.robber[index])]
+        if build:
+            board.construir_tablero_con_hex_coords()
+        return board
+
+    def boards(self, build: bool = True) -> Iterator[Board]:
+        for index in range(len(self)):
+            yield self.board(index, build)
+
+
+class BatchBoardGenerator:
+    """Genera lotes de tableros con permutaciones vectorizadas de números y materiales"""
+
+    def __init__(self, template: BoardTemplate, seed: Optional[int] = None):
+        self.template = template
+        self.rng = np.random.default_rng(seed)
+        self._py_rng = random.Random(seed)
+
+    def generate(self, count: int, shuffle_materials: bool = True,
+                 rules: Optional[NumberPlacementRules] = None) -> BoardBatch:
+        template = self.template
+        numbered = template.numbered_indices
+
+        materials = np.tile(template.base_materials, (count, 1))
+        if shuffle_materials:
+            # El desierto se queda en su lugar: solo se permutan los tiles con número
+            pool = np.tile(template.material_pool, (count, 1))
+            materials[:, numbered] = self.rng.permuted(pool, axis=1, out=pool)
+
+        if rules is None:
+            numbers = np.zeros((count, len(template)), dtype=np.uint8)
+            pool = np.tile(template.number_pool, (count, 1))
+            numbers[:, numbered] = self.rng.permuted(pool, axis=1, out=pool)
+        else:
+            # Con reglas, cada tablero pasa por el solver de backtracking
+            placer = template.number_placer(rules)
+            numbers = np.array([placer.solve(self._py_rng) for _ in range(count)], dtype=np.uint8)
+
+        robber = np.full(count, template.desert_index, dtype=np.int32)
+        return BoardBatch(template, materials, numbers, robber)
+
+    def iter_batches(self, total: int, batch_size: int = 65536, shuffle_materials: bool = True,
+                     rules: Optional[NumberPlacementRules] = None) -> Iterator[BoardBatch]:
+        """Genera total tableros en lotes de tamaño acotado"""
+        while total > 0:
+            count = min(batch_size, total)
+            yield self.generate(count, shuffle_materials, rules)
+            total -= count
@@ -0,0 +1,55 @@
+import json
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, Optional, Union
+
+from model.board import Board
+from model.exceptions import InvalidBoardException
+
+
+@dataclass
+class BoardRecord:
+    """Resultado de cargar una línea del archivo JSONL"""
+    line_number: int
+    board: Optional[Board] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def iter_boards_jsonl(source: Union[str, BinaryIO], build: bool = True) -> Iterator[BoardRecord]:
+    """Lee un archivo JSONL (un tablero por línea) de a un registro por vez
+
+    Cada línea se parsea y valida por separado, así la memoria no depende del
+    tamaño del archivo. Las líneas inválidas producen un BoardRecord con error en
+    lugar de detener la lectura. Con build=False se omite
+    construir_tablero_con_hex_coords cuando solo se necesitan tiles y números.
+    """
+    stream = open(source, "rb") if isinstance(source, str) else source
+    try:
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            yield _load_line(line_number, line, build)
+    finally:
+        if stream is not source:
+            stream.close()
+
+
+def _load_line(line_number: int, line: bytes, build: bool) -> BoardRecord:
+    try:
+        data = json.loads(line)
+        board = Board()
+        board.load_from_dict(data)
+        if build:
+            board.construir_tablero_con_hex_coords()
+    except json.JSONDecodeError as e:
+        return BoardRecord(line_number, error=f"Formato JSON inválido: {e.msg}")
+    except InvalidBoardException as e:
+        return BoardRecord(line_number, error=str(e))
+    except UnicodeDecodeError as e:
+        return BoardRecord(line_number, error=f"Texto UTF-8 inválido: {e.reason}")
+    except (KeyError, TypeError, AttributeError, ValueError) as e:
+        return BoardRecord(line_number, error=f"Datos incompletos: {e!r}")
+    return BoardRecord(line_number, board=board)
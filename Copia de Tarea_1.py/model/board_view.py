@@ -1,2 +1 @@
-from board import Board
-
+from model.board import Board
@@ -1,3 +1,9 @@
 class InvalidBoardException(Exception):
     """Excepción para errores de tablero inválido"""
-    pass
\ No newline at end of file
+    def __init__(self, message: str, errors=None):
+        super().__init__(message)
+        # Lista de ValidationError cuando la excepción viene del validador
+        self.errors = errors or []
+
+class InvalidMoveException(Exception):
+    """Excepción para jugadas que no respetan las reglas del estado de juego"""
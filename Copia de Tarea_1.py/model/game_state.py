@@ -0,0 +1,382 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from model.analytics import RESOURCES
+from model.exceptions import InvalidMoveException
+from model.topology import BoardTopology
+
+SETTLEMENT, CITY, ROAD, ROBBER = "settlement", "city", "road", "robber"
+LONGEST_ROAD_MIN = 5
+# Fichas disponibles por jugador
+MAX_ROADS, MAX_SETTLEMENTS, MAX_CITIES = 15, 5, 4
+NO_PLAYER = -1
+
+
+@dataclass(frozen=True)
+class Move:
+    """Una jugada: target es un vértice (settlement/city), un edge (road) o un hexágono (robber)"""
+    kind: str
+    player: int
+    target: int
+
+
+class RoadNetwork:
+    """Union-find sobre los edges con caminos, con deshacer (unión por tamaño, sin compresión)
+
+    Sin compresión de caminos cada unión cambia un solo padre, así que se deshace
+    restaurando ese padre y los tamaños. length[raíz] guarda el camino más largo de
+    la componente.
+    """
+
+    __slots__ = ("parent", "size", "length")
+
+    def __init__(self, edge_count: int):
+        self.parent = list(range(edge_count))
+        self.size = [1] * edge_count
+        self.length = [0] * edge_count
+
+    def find(self, edge: int) -> int:
+        parent = self.parent
+        while parent[edge] != edge:
+            edge = parent[edge]
+        return edge
+
+    def union(self, a: int, b: int) -> Optional[Tuple[int, int, int]]:
+        """Une las componentes; devuelve (hijo, raíz, largo previo de la raíz) para deshacer"""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return None
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return b, a, self.length[a]
+
+    def undo(self, record: Tuple[int, int, int]) -> None:
+        child, root, length = record
+        self.parent[child] = child
+        self.size[root] -= self.size[child]
+        self.length[root] = length
+
+
+class GameState:
+    """Estado de juego mutable sobre un Board construido, con apply/undo en O(jugada)
+
+    Mantiene dueños de vértices y edges, las redes de caminos en un RoadNetwork, el
+    camino más largo por jugador (solo se recalcula la componente tocada) y las tablas
+    de producción por jugador, tirada y recurso, separando lo que bloquea el ladrón.
+    Los índices de vértices, edges y hexágonos son los de BoardTopology.for_board.
+    """
+
+    def __init__(self, board, players: int = 4, topology: Optional[BoardTopology] = None):
+        self.board = board
+        self.players = players
+        self.topology = topology = topology or BoardTopology.for_board(board)
+
+        self.vertex_hexes = [topology.vertex_hexes(v).tolist() for v in range(topology.vertex_count)]
+        self.vertex_neighbors = [topology.vertex_neighbors(v).tolist() for v in range(topology.vertex_count)]
+        self.vertex_edges = [topology.vertex_edges(v).tolist() for v in range(topology.vertex_count)]
+        self.edge_vertices = [tuple(pair) for pair in topology.edge_vertices.tolist()]
+        self.hex_vertices = topology.hex_vertices.tolist()
+
+        # Índice en las tablas de producción de cada hexágono (-1 si no produce)
+        resources = len(RESOURCES)
+        self.hex_slot = []
+        for tile in board.tiles:
+            column = RESOURCES.index(tile.material) if tile.material in RESOURCES else -1
+            self.hex_slot.append(tile.number * resources + column if tile.number and column >= 0 else -1)
+
+        self.buildings = [0] * topology.vertex_count  # 0 vacío, 1 poblado, 2 ciudad
+        self.vertex_owner = [NO_PLAYER] * topology.vertex_count
+        self.edge_owner = [NO_PLAYER] * topology.edge_count
+        self.player_roads: List[List[int]] = [[] for _ in range(players)]
+        self.settlements = [0] * players  # poblados colocados, incluidos los ya convertidos en ciudad
+        self.cities = [0] * players
+        self.roads = RoadNetwork(topology.edge_count)
+        self.road_length = [0] * players
+        self.longest_road_holder = NO_PLAYER
+
+        # Producción por jugador: income[p][tirada * R + recurso] sin lo bloqueado por el ladrón
+        self.income = [[0] * (13 * resources) for _ in range(players)]
+        self.blocked = [[0] * (13 * resources) for _ in range(players)]
+        tiles = board.tiles
+        self.robber = tiles.index(board.robber_position) if board.robber_position in tiles else -1
+
+        self.history: List[Move] = []
+        self._undo: List[tuple] = []
+
+    # --- consultas ---
+
+    def _reachable(self, player: int, vertex: int) -> bool:
+        """El jugador llega al vértice con un camino propio que no está cortado ahí"""
+        owner = self.vertex_owner[vertex]
+        if owner == player:
+            return True
+        if owner != NO_PLAYER:
+            return False
+        return any(self.edge_owner[edge] == player for edge in self.vertex_edges[vertex])
+
+    def is_legal(self, move: Move) -> bool:
+        kind, player, target = move.kind, move.player, move.target
+        if not 0 <= player < self.players:
+            return False
+        if kind == SETTLEMENT:
+            if not 0 <= target < len(self.buildings) or self.buildings[target]:
+                return False
+            if self.settlements[player] - self.cities[player] >= MAX_SETTLEMENTS:
+                return False
+            if any(self.buildings[other] for other in self.vertex_neighbors[target]):
+                return False
+            # Los dos primeros poblados (colocación inicial) no necesitan camino
+            return self.settlements[player] < 2 or self._reachable(player, target)
+        if kind == CITY:
+            return (0 <= target < len(self.buildings) and self.buildings[target] == 1
+                    and self.vertex_owner[target] == player and self.cities[player] < MAX_CITIES)
+        if kind == ROAD:
+            if not 0 <= target < len(self.edge_owner) or self.edge_owner[target] != NO_PLAYER:
+                return False
+            if len(self.player_roads[player]) >= MAX_ROADS:
+                return False
+            return any(self._reachable(player, vertex) for vertex in self.edge_vertices[target])
+        if kind == ROBBER:
+            return 0 <= target < len(self.hex_slot) and target != self.robber
+        return False
+
+    def legal_moves(self, player: int) -> List[Move]:
+        moves = [Move(SETTLEMENT, player, v) for v in range(len(self.buildings))
+                 if self.is_legal(Move(SETTLEMENT, player, v))]
+        moves += [Move(CITY, player, v) for v in range(len(self.buildings))
+                  if self.is_legal(Move(CITY, player, v))]
+        candidates = {edge for road in self.player_roads[player] for v in self.edge_vertices[road]
+                      for edge in self.vertex_edges[v]}
+        candidates.update(edge for v in range(len(self.buildings)) if self.vertex_owner[v] == player
+                          for edge in self.vertex_edges[v])
+        moves += [Move(ROAD, player, edge) for edge in sorted(candidates) if self.is_legal(Move(ROAD, player, edge))]
+        return moves
+
+    def production(self) -> np.ndarray:
+        """(jugadores, 13, R) recursos por tirada, ya descontado el ladrón"""
+        return np.array(self.income).reshape(self.players, 13, len(RESOURCES))
+
+    def blocked_production(self) -> np.ndarray:
+        """(jugadores, 13, R) recursos por tirada que bloquea el ladrón"""
+        return np.array(self.blocked).reshape(self.players, 13, len(RESOURCES))
+
+    def longest_road(self, player: int) -> int:
+        return self.road_length[player]
+
+    # --- apply / undo ---
+
+    def apply(self, move: Move) -> None:
+        if not self.is_legal(move):
+            raise InvalidMoveException(f"Jugada ilegal: {move}")
+        if move.kind == ROBBER:
+            record = self._move_robber(move.target)
+        elif move.kind == ROAD:
+            record = self._place_road(move.player, move.target)
+        else:
+            record = self._build(move.player, move.target)
+        self.history.append(move)
+        self._undo.append(record)
+
+    def undo(self) -> Move:
+        if not self.history:
+            raise InvalidMoveException("No hay jugadas para deshacer")
+        move = self.history.pop()
+        record = self._undo.pop()
+        if move.kind == ROBBER:
+            self._set_robber(record)
+        elif move.kind == ROAD:
+            self._remove_road(move.player, move.target, record)
+        else:
+            self._unbuild(move.player, move.target, record)
+        return move
+
+    def _add_production(self, player: int, vertex: int, weight: int) -> None:
+        income, blocked = self.income[player], self.blocked[player]
+        for h in self.vertex_hexes[vertex]:
+            slot = self.hex_slot[h]
+            if slot >= 0:
+                if h == self.robber:
+                    blocked[slot] += weight
+                else:
+                    income[slot] += weight
+
+    def _build(self, player: int, vertex: int):
+        if self.buildings[vertex]:
+            self.buildings[vertex] = 2
+            self.cities[player] += 1
+            self._add_production(player, vertex, 1)
+            return None
+        self.buildings[vertex] = 1
+        self.vertex_owner[vertex] = player
+        self.settlements[player] += 1
+        self._add_production(player, vertex, 1)
+
+        # Un poblado ajeno puede cortar una red de caminos que pasa por el vértice
+        cut = {self.edge_owner[edge] for edge in self.vertex_edges[vertex]} - {NO_PLAYER, player}
+        holder = self.longest_road_holder
+        saved = []
+        for other in cut:
+            saved.append(self._snapshot(other))
+            self._rebuild_network(other)
+        return saved, holder
+
+    def _unbuild(self, player: int, vertex: int, record) -> None:
+        if record is None:
+            self._add_production(player, vertex, -1)
+            self.cities[player] -= 1
+            self.buildings[vertex] = 1
+            return
+        saved, holder = record
+        for snapshot in reversed(saved):
+            self._restore(snapshot)
+        self.longest_road_holder = holder
+        self._add_production(player, vertex, -1)
+        self.settlements[player] -= 1
+        self.vertex_owner[vertex] = NO_PLAYER
+        self.buildings[vertex] = 0
+
+    def _place_road(self, player: int, edge: int):
+        roads = self.roads
+        self.edge_owner[edge] = player
+        self.player_roads[player].append(edge)
+        unions = []
+        for vertex in self.edge_vertices[edge]:
+            if self.vertex_owner[vertex] not in (NO_PLAYER, player):
+                continue
+            for other in self.vertex_edges[vertex]:
+                if other != edge and self.edge_owner[other] == player:
+                    record = roads.union(edge, other)
+                    if record is not None:
+                        unions.append(record)
+        root = roads.find(edge)
+        previous = (self.road_length[player], self.longest_road_holder)
+        roads.length[root] = self._longest_trail(player, self._component(player, root))
+        # Agregar un camino nunca acorta otra componente: basta comparar con la tocada
+        self.road_length[player] = max(self.road_length[player], roads.length[root])
+        self._update_holder()
+        return unions, previous
+
+    def _remove_road(self, player: int, edge: int, record) -> None:
+        unions, (length, holder) = record
+        for union in reversed(unions):
+            self.roads.undo(union)
+        self.roads.length[edge] = 0
+        self.road_length[player] = length
+        self.longest_road_holder = holder
+        self.player_roads[player].pop()
+        self.edge_owner[edge] = NO_PLAYER
+
+    def _move_robber(self, target: int) -> int:
+        previous = self.robber
+        self._set_robber(target)
+        return previous
+
+    def _set_robber(self, target: int) -> None:
+        """Mueve el ladrón pasando la producción de los vértices afectados entre las dos tablas"""
+        for h, unblock in ((self.robber, True), (target, False)):
+            slot = self.hex_slot[h] if h >= 0 else -1
+            if slot < 0:
+                continue
+            for vertex in self.hex_vertices[h]:
+                weight = self.buildings[vertex]
+                if weight:
+                    player = self.vertex_owner[vertex]
+                    delta = weight if unblock else -weight
+                    self.income[player][slot] += delta
+                    self.blocked[player][slot] -= delta
+        self.robber = target
+        tiles = self.board.tiles
+        if self.board.robber_position is not None:
+            self.board.robber_position.has_robber = False
+        self.board.robber_position = tiles[target] if target >= 0 else None
+        if self.board.robber_position is not None:
+            self.board.robber_position.has_robber = True
+
+    # --- caminos ---
+
+    def _component(self, player: int, root: int) -> List[int]:
+        find = self.roads.find
+        return [edge for edge in self.player_roads[player] if find(edge) == root]
+
+    def _longest_trail(self, player: int, edges: List[int]) -> int:
+        """Camino más largo (sin repetir edges) dentro de una componente; no atraviesa poblados ajenos"""
+        adjacency: Dict[int, List[Tuple[int, int]]] = {}
+        for bit, edge in enumerate(edges):
+            a, b = self.edge_vertices[edge]
+            adjacency.setdefault(a, []).append((1 << bit, b))
+            adjacency.setdefault(b, []).append((1 << bit, a))
+        owner = self.vertex_owner
+        blocked = {v for v in adjacency if owner[v] not in (NO_PLAYER, player)}
+
+        # Caso común: la componente es un camino simple (o un ciclo) sin cortes intermedios
+        if all(len(links) <= 2 for links in adjacency.values()) and not any(len(adjacency[v]) == 2 for v in blocked):
+            return len(edges)
+
+        def extend(vertex: int, used: int) -> int:
+            if vertex in blocked:
+                return 0
+            best = 0
+            for bit, other in adjacency[vertex]:
+                if not used & bit:
+                    length = extend(other, used | bit) + 1
+                    if length > best:
+                        best = length
+            return best
+
+        # Un camino maximal solo termina en vértices de grado impar o en poblados ajenos
+        starts = [v for v, links in adjacency.items() if len(links) % 2 or v in blocked] or list(adjacency)
+        best = 0
+        for start in starts:
+            # El primer vértice puede ser un poblado ajeno: el camino termina ahí
+            for bit, other in adjacency[start]:
+                length = extend(other, bit) + 1
+                if length > best:
+                    best = length
+        return best
+
+    def _snapshot(self, player: int):
+        roads = self.roads
+        edges = self.player_roads[player]
+        return (player, [(edge, roads.parent[edge], roads.size[edge], roads.length[edge]) for edge in edges],
+                self.road_length[player])
+
+    def _restore(self, snapshot) -> None:
+        player, entries, length = snapshot
+        roads = self.roads
+        for edge, parent, size, edge_length in entries:
+            roads.parent[edge], roads.size[edge], roads.length[edge] = parent, size, edge_length
+        self.road_length[player] = length
+
+    def _rebuild_network(self, player: int) -> None:
+        """Rearma las componentes de un jugador desde cero (solo cuando un poblado ajeno las corta)"""
+        roads = self.roads
+        edges = self.player_roads[player]
+        for edge in edges:
+            roads.parent[edge], roads.size[edge], roads.length[edge] = edge, 1, 0
+        owned = set(edges)
+        for edge in edges:
+            for vertex in self.edge_vertices[edge]:
+                if self.vertex_owner[vertex] in (NO_PLAYER, player):
+                    for other in self.vertex_edges[vertex]:
+                        if other in owned:
+                            roads.union(edge, other)
+        best = 0
+        for root in {roads.find(edge) for edge in edges}:
+            roads.length[root] = self._longest_trail(player, self._component(player, root))
+            best = max(best, roads.length[root])
+        self.road_length[player] = best
+        self._update_holder()
+
+    def _update_holder(self) -> None:
+        """Camino más largo: hace falta LONGEST_ROAD_MIN y superar estrictamente al poseedor actual"""
+        lengths = self.road_length
+        holder = self.longest_road_holder
+        best = max(lengths)
+        if holder != NO_PLAYER and lengths[holder] == best and best >= LONGEST_ROAD_MIN:
+            return
+        leaders = [p for p, length in enumerate(lengths) if length == best]
+        self.longest_road_holder = leaders[0] if best >= LONGEST_ROAD_MIN and len(leaders) == 1 else NO_PLAYER
@@ -0,0 +1,198 @@
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from model.exceptions import InvalidBoardException
+from model.HexCoord import HexCoord, hex_corners
+from utils.constants import NUMBER_PIPS, RED_NUMBERS
+
+
+@dataclass(frozen=True)
+class NumberPlacementRules:
+    """Reglas configurables para colocar los números"""
+    no_adjacent_red: bool = True        # sin 6/8 en hexágonos vecinos
+    no_adjacent_equal: bool = True      # sin números iguales en hexágonos vecinos
+    max_vertex_pips: Optional[int] = None  # suma máxima de pips en una esquina
+
+
+class NumberPlacer:
+    """Coloca números con backtracking sobre bitmasks de adyacencia precalculados"""
+
+    def __init__(self, coords: Sequence[HexCoord], numbered: Sequence[bool], pool: Sequence[int],
+                 rules: NumberPlacementRules = NumberPlacementRules(), max_attempts: int = 1000):
+        self.coords = list(coords)
+        self.rules = rules
+        self.max_attempts = max_attempts
+        self.pool = list(pool)
+
+        # Solo participan los hexágonos con número; se indexan de 0 a n-1
+        self.slots = [i for i, flag in enumerate(numbered) if flag]
+        if len(self.slots) != len(self.pool):
+            raise InvalidBoardException("La cantidad de números no coincide con los tiles numerados.")
+        slot_of = {self.coords[i]: k for k, i in enumerate(self.slots)}
+
+        self.adjacency: List[int] = [0] * len(self.slots)
+        for coord, k in slot_of.items():
+            for corner in hex_corners(coord):
+                for other in corner:
+                    if other != coord and other in slot_of:
+                        self.adjacency[k] |= 1 << slot_of[other]
+
+        # Esquinas compartidas por al menos dos hexágonos con número
+        vertex_ids: Dict[frozenset, int] = {}
+        self.tile_vertices: List[List[int]] = [[] for _ in self.slots]
+        for coord, k in slot_of.items():
+            for corner in hex_corners(coord):
+                members = [slot_of[c] for c in corner if c in slot_of]
+                if len(members) < 2:
+                    continue
+                vertex = vertex_ids.setdefault(corner, len(vertex_ids))
+                self.tile_vertices[k].append(vertex)
+        self.vertex_count = len(vertex_ids)
+
+        # Se colocan primero los valores más restringidos: rojos y luego por pips
+        self.steps = sorted(self.pool, key=lambda value: (value not in RED_NUMBERS, -NUMBER_PIPS.get(value, 0), value))
+
+    @classmethod
+    def from_board(cls, board, rules: NumberPlacementRules = NumberPlacementRules()) -> "NumberPlacer":
+        """Crea el solver a partir de un Board ya construido (hex_grid)"""
+        from model.board import build_number_pool
+
+        tiles = board.tiles
+        numbered = [tile.material != "desert" for tile in tiles]
+        coords = [board.tile_coords[tile] for tile in tiles]
+        return cls(coords, numbered, build_number_pool(sum(numbered)), rules)
+
+    def is_valid(self, numbers: Sequence[int]) -> bool:
+        """Verifica una asignación completa (alineada con coords) contra las reglas"""
+        values = [numbers[i] for i in self.slots]
+        for k, value in enumerate(values):
+            mask = self.adjacency[k]
+            while mask:
+                low = mask & -mask
+                other = values[low.bit_length() - 1]
+                if self.rules.no_adjacent_red and value in RED_NUMBERS and other in RED_NUMBERS:
+                    return False
+                if self.rules.no_adjacent_equal and value == other:
+                    return False
+                mask ^= low
+        if self.rules.max_vertex_pips is not None:
+            sums = [0] * self.vertex_count
+            for k, value in enumerate(values):
+                for vertex in self.tile_vertices[k]:
+                    sums[vertex] += NUMBER_PIPS.get(value, 0)
+            if max(sums, default=0) > self.rules.max_vertex_pips:
+                return False
+        return True
+
+    def solve(self, rng: Optional[random.Random] = None) -> List[int]:
+        """Devuelve los números alineados con coords (0 para tiles sin número)"""
+        rng = rng or random
+        # Reinicios aleatorios con un presupuesto corto de backtracking por intento
+        budget = 4 * len(self.steps)
+        for _ in range(self.max_attempts):
+            numbers = self._search(rng, budget)
+            if numbers is not None:
+                return numbers
+        raise InvalidBoardException("No se encontró una asignación de números que cumpla las reglas.")
+
+    def _search(self, rng, budget: int) -> Optional[List[int]]:
+        rules = self.rules
+        adjacency = self.adjacency
+        tile_vertices = self.tile_vertices
+        max_pips = rules.max_vertex_pips
+        check_equal = rules.no_adjacent_equal
+        check_red = rules.no_adjacent_red
+        steps = self.steps
+
+        # Orden aleatorio de los tiles; también sirve para romper simetrías entre números repetidos
+        order = list(range(len(self.slots)))
+        rng.shuffle(order)
+
+        free = (1 << len(self.slots)) - 1
+        remaining: Dict[int, int] = {}
+        for value in steps:
+            remaining[value] = remaining.get(value, 0) + 1
+        value_block = {value: 0 for value in remaining}  # vecinos de cada número ya colocado
+        red_block = 0                                     # vecinos de algún número rojo
+        reds_left = sum(remaining.get(value, 0) for value in RED_NUMBERS)
+        vertex_sums = [0] * self.vertex_count
+
+        n = len(steps)
+        candidates: List[Optional[List[int]]] = [None] * n
+        chosen = [0] * n  # posición en order del tile elegido en cada paso
+        saved = [(0, 0)] * n
+        pos = 0
+        backtracks = 0
+
+        while 0 <= pos < n:
+            value = steps[pos]
+            is_red = value in RED_NUMBERS
+            pips = NUMBER_PIPS.get(value, 0)
+            if candidates[pos] is None:
+                allowed = free
+                if check_equal:
+                    allowed &= ~value_block[value]
+                if check_red and is_red:
+                    allowed &= ~red_block
+                first = chosen[pos - 1] + 1 if pos and steps[pos - 1] == value else 0
+                cands = [
+                    index for index in range(first, len(order))
+                    if allowed >> order[index] & 1
+                    and (max_pips is None or all(vertex_sums[v] + pips <= max_pips for v in tile_vertices[order[index]]))
+                ]
+                cands.reverse()
+                candidates[pos] = cands
+            else:
+                # Deshacer el intento anterior en este paso
+                slot = order[chosen[pos]]
+                free |= 1 << slot
+                remaining[value] += 1
+                if is_red:
+                    reds_left += 1
+                value_block[value], red_block = saved[pos]
+                for vertex in tile_vertices[slot]:
+                    vertex_sums[vertex] -= pips
+
+            cands = candidates[pos]
+            placed = False
+            while cands:
+                index = cands.pop()
+                slot = order[index]
+                new_free = free & ~(1 << slot)
+                new_value_block = value_block[value] | adjacency[slot]
+                new_red_block = red_block | adjacency[slot] if is_red else red_block
+                # Chequeo hacia adelante: cada número pendiente necesita lugares libres suficientes
+                if check_equal and (new_free & ~new_value_block).bit_count() < remaining[value] - 1:
+                    continue
+                if check_red and (new_free & ~new_red_block).bit_count() < reds_left - is_red:
+                    continue
+                chosen[pos] = index
+                saved[pos] = (value_block[value], red_block)
+                free = new_free
+                value_block[value] = new_value_block
+                red_block = new_red_block
+                remaining[value] -= 1
+                if is_red:
+                    reds_left -= 1
+                for vertex in tile_vertices[slot]:
+                    vertex_sums[vertex] += pips
+                placed = True
+                break
+
+            if placed:
+                pos += 1
+            else:
+                candidates[pos] = None
+                pos -= 1
+                backtracks += 1
+                if backtracks > budget:
+                    return None
+
+        if pos != n:
+            return None
+
+        numbers = [0] * len(self.coords)
+        for value, index in zip(steps, chosen):
+            numbers[self.slots[order[index]]] = value
+        return numbers
@@ -0,0 +1,230 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from model.analytics import RESOURCES, resource_pip_matrix
+from model.port import Port
+from model.topology import BoardTopology
+from utils.constants import MATERIAL_CODES
+
+BANK_RATIO = 4
+
+
+@dataclass(frozen=True)
+class OpeningWeights:
+    """Peso de cada componente en el puntaje de un par de asentamientos iniciales"""
+    diversity: float = 1.0  # por cada recurso distinto que produce el par
+    port: float = 1.0       # ganancia esperada al comerciar por los puertos del par
+
+
+@dataclass(frozen=True)
+class Opening:
+    """Par de esquinas iniciales con su puntaje"""
+    score: float
+    vertices: Tuple[int, int]
+    pips: int
+    resources: Tuple[str, ...]
+    ports: Tuple[str, ...]  # materiales de los puertos que toca el par
+
+
+class OpeningSearch:
+    """Busca los mejores pares de asentamientos iniciales con branch-and-bound y top-k
+
+    Puntaje de un par (a, b): pips totales + diversity * recursos distintos +
+    port * sum(pips del recurso r * ganancia del mejor puerto del par para r), con la
+    misma ganancia por puerto que ProductionSimulator (1/ratio - 1/BANK_RATIO, según
+    Port.ratio). Cada esquina tiene una cota superior aditiva, así que recorriendo las
+    esquinas por cota descendente se corta en cuanto la cota del par no supera el
+    k-ésimo mejor puntaje del heap.
+    """
+
+    def __init__(self, topology: BoardTopology, ports: Sequence[Port] = (),
+                 weights: OpeningWeights = OpeningWeights()):
+        self.topology = topology
+        self.weights = weights
+        vertex_count = topology.vertex_count
+
+        self.neighbor_masks: List[int] = [0] * vertex_count
+        for v in range(vertex_count):
+            for other in topology.vertex_neighbors(v).tolist():
+                self.neighbor_masks[v] |= 1 << other
+
+        # Ganancia por recurso al comerciar desde cada esquina (None si no toca un puerto)
+        self.trade_gain: List[Optional[Tuple[float, ...]]] = [None] * vertex_count
+        self.vertex_ports: List[Optional[str]] = [None] * vertex_count
+        self.max_gain = 0.0
+        for v, p in enumerate(topology.vertex_port.tolist()):
+            if p < 0 or p >= len(ports):
+                continue
+            port = ports[p]
+            gain = 1 / int(port.ratio.split(":")[0]) - 1 / BANK_RATIO
+            if port.material == "generic":
+                self.trade_gain[v] = (gain,) * len(RESOURCES)
+            elif port.material in RESOURCES:
+                self.trade_gain[v] = tuple(gain if r == port.material else 0.0 for r in RESOURCES)
+            else:
+                continue
+            self.vertex_ports[v] = port.material
+            self.max_gain = max(self.max_gain, gain)
+
+    @classmethod
+    def for_board(cls, board, weights: OpeningWeights = OpeningWeights()) -> "OpeningSearch":
+        """Motor para un Board construido; los vértices siguen BoardTopology.for_board"""
+        ports = [port for port in board.ports if port.id in board.port_positions]
+        return cls(BoardTopology.for_board(board), ports, weights)
+
+    @classmethod
+    def for_template(cls, template, weights: OpeningWeights = OpeningWeights()) -> "OpeningSearch":
+        """Motor compartido por todos los tableros de un BoardBatch de esta plantilla"""
+        ports = [Port(port_id, material) for port_id, material in template.ports]
+        return cls(BoardTopology.for_template(template), ports, weights)
+
+    @staticmethod
+    def board_arrays(board) -> Tuple[np.ndarray, np.ndarray]:
+        """Materiales y números de un Board alineados con board.tiles"""
+        materials = np.array([MATERIAL_CODES[tile.material] for tile in board.tiles], dtype=np.uint8)
+        numbers = np.array([tile.number or 0 for tile in board.tiles], dtype=np.uint8)
+        return materials, numbers
+
+    def production(self, materials: np.ndarray, numbers: np.ndarray) -> np.ndarray:
+        """(B, V, R) pips por esquina y recurso para un lote (o (V, R) para un tablero)"""
+        return np.matmul(self.topology.incidence_matrix(), resource_pip_matrix(materials, numbers))
+
+    def pair_score(self, production: Sequence[Sequence[float]], a: int, b: int) -> float:
+        """Puntaje exacto de un par (sin chequear la regla de distancia)"""
+        pa, pb = production[a], production[b]
+        diversity = sum(1 for x, y in zip(pa, pb) if x or y)
+        return sum(pa) + sum(pb) + self.weights.diversity * diversity + self._port_score(pa, pb, a, b)
+
+    def _port_score(self, pa, pb, a: int, b: int) -> float:
+        ga, gb = self.trade_gain[a], self.trade_gain[b]
+        if ga is None and gb is None:
+            return 0.0
+        gain = ga if gb is None else gb if ga is None else tuple(map(max, ga, gb))
+        return self.weights.port * sum((x + y) * g for x, y, g in zip(pa, pb, gain))
+
+    def _vertex_tables(self, production) -> Tuple[List[float], List[int], List[Tuple[float, int]]]:
+        """Pips, bitmask de recursos y cotas (ordenadas de mayor a menor) de cada esquina
+
+        Cota aditiva: pips con el mejor puerto del tablero + diversity * recursos propios,
+        de modo que cota(a) + cota(b) >= puntaje(a, b).
+        """
+        port_factor = 1 + self.weights.port * self.max_gain
+        pips, masks, bounds = [], [], []
+        for v, row in enumerate(production):
+            mask = 0
+            for r, x in enumerate(row):
+                if x:
+                    mask |= 1 << r
+            pips.append(sum(row))
+            masks.append(mask)
+            bounds.append((pips[v] * port_factor + self.weights.diversity * mask.bit_count(), v))
+        bounds.sort(reverse=True)
+        return pips, masks, bounds
+
+    def top_pairs(self, production: Sequence[Sequence[float]], k: int = 5, occupied: int = 0,
+                  tables=None) -> List[Opening]:
+        """Los k mejores pares legales dado un bitmask de esquinas ocupadas"""
+        pips, masks, ranked = tables or self._vertex_tables(production)
+        neighbor_masks = self.neighbor_masks
+        trade_gain = self.trade_gain
+        diversity_weight = self.weights.diversity
+
+        blocked = occupied
+        mask = occupied
+        while mask:
+            low = mask & -mask
+            blocked |= neighbor_masks[low.bit_length() - 1]
+            mask ^= low
+        bounds = [item for item in ranked if not blocked >> item[1] & 1]
+
+        # Heap de mínimos con (puntaje, -a, -b): ante empates gana el par de índices menores
+        heap: List[Tuple[float, int, int]] = []
+        worst = float("-inf")
+        for i, (bound_a, a) in enumerate(bounds):
+            if i + 1 < len(bounds) and bound_a + bounds[i + 1][0] < worst:
+                break
+            excluded = neighbor_masks[a]
+            for bound_b, b in bounds[i + 1:]:
+                if bound_a + bound_b < worst:
+                    break
+                if excluded >> b & 1:
+                    continue
+                score = pips[a] + pips[b] + diversity_weight * (masks[a] | masks[b]).bit_count()
+                if trade_gain[a] is not None or trade_gain[b] is not None:
+                    score += self._port_score(production[a], production[b], a, b)
+                entry = (score, -min(a, b), -max(a, b))
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+                else:
+                    continue
+                if len(heap) == k:
+                    worst = heap[0][0]
+
+        return [self._opening(production, score, -a, -b) for score, a, b in sorted(heap, reverse=True)]
+
+    def _opening(self, production, score: float, a: int, b: int) -> Opening:
+        pa, pb = production[a], production[b]
+        resources = tuple(r for r, x, y in zip(RESOURCES, pa, pb) if x or y)
+        ports = tuple(port for port in (self.vertex_ports[a], self.vertex_ports[b]) if port is not None)
+        return Opening(score, (a, b), int(round(sum(pa) + sum(pb))), resources, ports)
+
+    def rank_seats(self, production: Sequence[Sequence[float]], seats: int = 4, k: int = 5) -> List[List[Opening]]:
+        """Top-k por asiento: cada asiento toma su mejor par y bloquea esas esquinas para los siguientes"""
+        if isinstance(production, np.ndarray):
+            production = production.tolist()
+        tables = self._vertex_tables(production)
+        rankings = []
+        occupied = 0
+        for _ in range(seats):
+            ranking = self.top_pairs(production, k, occupied, tables)
+            rankings.append(ranking)
+            if ranking:
+                a, b = ranking[0].vertices
+                occupied |= 1 << a | 1 << b
+        return rankings
+
+    def search(self, materials: np.ndarray, numbers: np.ndarray, seats: int = 4, k: int = 5) -> List[List[List[Opening]]]:
+        """rank_seats para cada tablero de un lote (B, T)"""
+        return [self.rank_seats(rows, seats, k) for rows in self.production(materials, numbers).tolist()]
+
+
+def _search_chunk(engine: OpeningSearch, materials: np.ndarray, numbers: np.ndarray, seats: int, k: int):
+    return engine.search(materials, numbers, seats, k)
+
+
+def _search_board(board, seats: int, k: int, weights: OpeningWeights):
+    engine = OpeningSearch.for_board(board, weights)
+    return engine.rank_seats(engine.production(*engine.board_arrays(board)), seats, k)
+
+
+def search_boards(boards: Sequence, seats: int = 4, k: int = 5, weights: OpeningWeights = OpeningWeights(),
+                  workers: Optional[int] = None) -> List[List[List[Opening]]]:
+    """Ranking de aperturas por asiento para varios Board, repartidos en procesos"""
+    boards = list(boards)
+    if workers == 1 or len(boards) <= 1:
+        return [_search_board(board, seats, k, weights) for board in boards]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        count = len(boards)
+        return list(executor.map(_search_board, boards, [seats] * count, [k] * count, [weights] * count))
+
+
+def search_batch(batch, seats: int = 4, k: int = 5, weights: OpeningWeights = OpeningWeights(),
+                 workers: Optional[int] = None, chunk_size: int = 1024) -> List[List[List[Opening]]]:
+    """Ranking de aperturas para un BoardBatch; a cada proceso se le envían bloques de filas"""
+    engine = OpeningSearch.for_template(batch.template, weights)
+    starts = range(0, len(batch), chunk_size)
+    chunks = [(batch.materials[s:s + chunk_size], batch.numbers[s:s + chunk_size]) for s in starts]
+    if workers == 1 or len(chunks) <= 1:
+        results = [engine.search(materials, numbers, seats, k) for materials, numbers in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                _search_chunk, [engine] * len(chunks), *zip(*chunks), [seats] * len(chunks), [k] * len(chunks)
+            ))
+    return [ranking for chunk in results for ranking in chunk]
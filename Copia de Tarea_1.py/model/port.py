@@ -1,4 +1,6 @@
 class Port:
+    __slots__ = ("id", "material")
+
     def __init__(self, port_id: str, material: str):
         self.id = port_id
         self.material = material
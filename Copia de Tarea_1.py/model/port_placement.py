@@ -0,0 +1,203 @@
+import random
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from model.exceptions import InvalidBoardException
+from model.HexCoord import DIRECTION_ORDER, HEX_DIRECTIONS, HexCoord
+from model.port import Port
+from utils.constants import PORT_DISTRIBUTION, expand_distribution
+
+# Edge de costa: (hexágono, índice de dirección en DIRECTION_ORDER)
+CoastEdge = Tuple[HexCoord, int]
+
+_OFFSETS = list(HEX_DIRECTIONS.values())
+
+
+def port_count_for_coast(coast_length: int, distribution: Dict[str, int] = PORT_DISTRIBUTION) -> int:
+    """Cantidad de puertos para una costa dada (9 por cada 30 edges, como el tablero estándar)"""
+    return max(1, round(coast_length * sum(distribution.values()) / 30))
+
+
+class Coastline:
+    """Edges de costa de un tablero, recorridos en sentido horario
+
+    Se deriva de las coordenadas de hex_grid: un edge es de costa si el vecino en esa
+    dirección no está en el tablero. El siguiente edge comparte una esquina con el
+    actual (la misma regla que usa BoardValidator para los puertos colindantes).
+    Un tablero con huecos tiene varios ciclos; cycles guarda (inicio, largo) de cada uno.
+    """
+
+    __slots__ = ("edges", "cycles", "index", "_conflicts")
+
+    def __init__(self, coords: Iterable[HexCoord]):
+        coords = frozenset(coords)
+        coast = {
+            (coord, d) for coord in coords for d, offset in enumerate(_OFFSETS)
+            if coord + offset not in coords
+        }
+        edges: List[CoastEdge] = []
+        cycles: List[Tuple[int, int]] = []
+        for start in sorted(coast, key=lambda edge: (edge[0].r, edge[0].q, edge[1])):
+            if start not in coast:
+                continue
+            first = len(edges)
+            edge = start
+            while edge in coast:
+                coast.discard(edge)
+                edges.append(edge)
+                coord, d = edge
+                corner = coord + _OFFSETS[(d + 1) % 6]
+                edge = (corner, (d - 1) % 6) if corner in coords else (coord, (d + 1) % 6)
+            cycles.append((first, len(edges) - first))
+
+        self.edges: Tuple[CoastEdge, ...] = tuple(edges)
+        self.cycles: Tuple[Tuple[int, int], ...] = tuple(cycles)
+        self.index: Dict[CoastEdge, int] = {edge: i for i, edge in enumerate(edges)}
+        self._conflicts: Dict[int, List[int]] = {}
+
+    @classmethod
+    def shared(cls, coords: Sequence[HexCoord]) -> "Coastline":
+        """Instancia compartida para esta forma de tablero"""
+        return _shared_coastline(frozenset(coords))
+
+    @classmethod
+    def for_board(cls, board) -> "Coastline":
+        if not board.hex_grid:
+            board.construir_tablero_con_hex_coords()
+        return cls.shared(board.hex_grid)
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def capacity(self, min_spacing: int) -> int:
+        """Máximo de puertos que entran con esa separación (en edges de costa)"""
+        return sum(length // max(1, min_spacing) for _, length in self.cycles)
+
+    def conflicts(self, min_spacing: int) -> List[int]:
+        """Para cada edge, bitmask de los edges a menos de min_spacing sobre su ciclo (incluido él)"""
+        masks = self._conflicts.get(min_spacing)
+        if masks is None:
+            masks = [0] * len(self.edges)
+            for first, length in self.cycles:
+                reach = min(max(1, min_spacing) - 1, length // 2)
+                for i in range(length):
+                    for step in range(-reach, reach + 1):
+                        masks[first + i] |= 1 << (first + (i + step) % length)
+            self._conflicts[min_spacing] = masks
+        return masks
+
+    def __repr__(self) -> str:
+        return f"Coastline(edges={len(self.edges)}, cycles={len(self.cycles)})"
+
+
+@lru_cache(maxsize=64)
+def _shared_coastline(coords: frozenset) -> Coastline:
+    return Coastline(coords)
+
+
+class PortPlacer:
+    """Coloca puertos al azar sobre la costa con backtracking sobre bitmasks de conflicto
+
+    Respeta una separación mínima entre puertos (min_spacing=2: nunca colindantes) y
+    reparte los materiales según la distribución escalada con expand_distribution.
+    """
+
+    def __init__(self, coastline: Coastline, count: Optional[int] = None, min_spacing: int = 2,
+                 distribution: Dict[str, int] = PORT_DISTRIBUTION, max_attempts: int = 1000):
+        self.coastline = coastline
+        self.count = port_count_for_coast(len(coastline), distribution) if count is None else count
+        self.min_spacing = min_spacing
+        self.distribution = distribution
+        self.max_attempts = max_attempts
+        if self.count > coastline.capacity(min_spacing):
+            raise InvalidBoardException(
+                f"No entran {self.count} puertos en {len(coastline)} edges de costa con separación {min_spacing}."
+            )
+        self.conflicts = coastline.conflicts(min_spacing)
+        self.pool = expand_distribution(distribution, self.count)
+
+    @classmethod
+    def from_board(cls, board, **options) -> "PortPlacer":
+        return cls(Coastline.for_board(board), **options)
+
+    def is_valid(self, edges: Sequence[int]) -> bool:
+        """Verifica que ningún par de edges esté a menos de min_spacing"""
+        used = 0
+        for edge in edges:
+            if used & self.conflicts[edge]:
+                return False
+            used |= 1 << edge
+        return len(edges) == self.count
+
+    def solve(self, rng: Optional[random.Random] = None) -> List[int]:
+        """Índices de costa elegidos, en orden horario"""
+        rng = rng or random
+        budget = 4 * len(self.conflicts)
+        for _ in range(self.max_attempts):
+            edges = self._search(rng, budget)
+            if edges is not None:
+                return edges
+        raise InvalidBoardException("No se encontró una ubicación de puertos que cumpla la separación.")
+
+    def _search(self, rng, budget: int) -> Optional[List[int]]:
+        conflicts = self.conflicts
+        k = self.count
+        order = list(range(len(conflicts)))
+        rng.shuffle(order)
+        n = len(order)
+
+        # suffix[i]: edges de order[i:], para acotar cuántos puertos pueden entrar todavía
+        suffix = [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            suffix[i] = suffix[i + 1] | 1 << order[i]
+
+        available = [0] * (k + 1)
+        available[0] = suffix[0]
+        chosen = [0] * k
+        pos = index = backtracks = 0
+        while pos < k:
+            free = available[pos]
+            if (free & suffix[index]).bit_count() >= k - pos:
+                while not free >> order[index] & 1:
+                    index += 1
+                chosen[pos] = index
+                available[pos + 1] = free & ~conflicts[order[index]]
+                pos += 1
+                index += 1
+                continue
+            # Sin lugar suficiente: se descarta la última elección
+            pos -= 1
+            backtracks += 1
+            if pos < 0 or backtracks > budget:
+                return None
+            index = chosen[pos] + 1
+        return sorted(order[i] for i in chosen)
+
+    def materials(self, rng: Optional[random.Random] = None) -> List[str]:
+        materials = self.pool.copy()
+        (rng or random).shuffle(materials)
+        return materials
+
+    def place(self, board, rng: Optional[random.Random] = None) -> List[Port]:
+        """Reemplaza los puertos del Board (edges, ports y port_positions) por una ubicación nueva"""
+        rng = rng or random
+        if not board.hex_grid:
+            board.construir_tablero_con_hex_coords()
+        edges = self.solve(rng)
+
+        old_ids = {port.id for port in board.ports}
+        for tile in board.tiles:
+            # Diccionario nuevo: los edges pueden venir compartidos con los datos del JSON
+            tile.edges = {direction: target for direction, target in tile.edges.items() if target not in old_ids}
+
+        ports = []
+        board.port_positions = {}
+        for i, (edge, material) in enumerate(zip(edges, self.materials(rng))):
+            coord, d = self.coastline.edges[edge]
+            tile = board.hex_grid[coord]
+            port = Port(f"p{i + 1:02d}", material)
+            tile.edges[DIRECTION_ORDER[d]] = port.id
+            board.port_positions[port.id] = (tile.id, DIRECTION_ORDER[d])
+            ports.append(port)
+        board.ports = ports
+        return ports
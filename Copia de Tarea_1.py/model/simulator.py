@@ -0,0 +1,129 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from model.analytics import RESOURCE_CODES, RESOURCES
+from model.topology import BoardTopology
+from utils.constants import MATERIAL_CODES
+
+BANK_RATIO = 4
+
+
+@dataclass
+class SimulationResult:
+    """Resultados promedio por turno para cada esquina (V) y recurso (R)"""
+    turns: int
+    income: np.ndarray       # (V, R) recursos por turno, ya descontado el ladrón
+    robber_loss: np.ndarray  # (V, R) recursos por turno bloqueados por el ladrón
+    port_value: np.ndarray   # (V,) recursos extra por turno al comerciar por el puerto en vez del banco
+    roll_counts: np.ndarray  # (13,) cuántas veces salió cada tirada
+
+    def position_value(self, vertices: Sequence[int]) -> float:
+        """Ingreso total por turno de un conjunto de esquinas iniciales"""
+        vertices = list(vertices)
+        return float(self.income[vertices].sum() + self.port_value[vertices].sum())
+
+
+class ProductionSimulator:
+    """Simula tiradas en lotes de NumPy y acumula producción con tablas precalculadas
+
+    Cada turno se tiran dos dados; con un 7 el ladrón se mueve a un tile con número
+    elegido al azar. La producción se acumula por tile (conteos por número) y se
+    reparte a las esquinas con las tablas tile -> vértice de BoardTopology, sin
+    recorrer las tiradas en Python.
+    """
+
+    def __init__(self, board, topology: Optional[BoardTopology] = None):
+        self.topology = topology or BoardTopology.for_board(board)
+        tiles = board.tiles
+        self.numbers = np.array([tile.number or 0 for tile in tiles], dtype=np.int64)
+        materials = np.array([MATERIAL_CODES[tile.material] for tile in tiles], dtype=np.int64)
+        self.robber_start = tiles.index(board.robber_position) if board.robber_position in tiles else -1
+        self.robber_targets = np.flatnonzero(self.numbers > 0)
+
+        # Tabla tile -> vértice como pares (vértice, hexágono, columna de recurso)
+        topology = self.topology
+        self._rows = np.repeat(np.arange(topology.vertex_count), np.diff(topology.vertex_hex_indptr))
+        self._hexes = topology.vertex_hex_indices
+        resource_column = np.full(len(MATERIAL_CODES), -1, dtype=np.int64)
+        resource_column[RESOURCE_CODES] = np.arange(len(RESOURCES))
+        productive = resource_column[materials[self._hexes]] >= 0
+        self._rows, self._hexes = self._rows[productive], self._hexes[productive]
+        self._columns = resource_column[materials[self._hexes]]
+
+        # Factor de ganancia de cada esquina y recurso al comerciar por su puerto
+        self._trade_gain = np.zeros((topology.vertex_count, len(RESOURCES)))
+        for vertex, port_index in enumerate(topology.vertex_port.tolist()):
+            if port_index < 0:
+                continue
+            port = board.ports[port_index]
+            ratio = int(port.ratio.split(":")[0])
+            gain = 1 / ratio - 1 / BANK_RATIO
+            if port.material == "generic":
+                self._trade_gain[vertex, :] = gain
+            elif port.material in RESOURCES:
+                self._trade_gain[vertex, RESOURCES.index(port.material)] = gain
+
+    def _to_vertices(self, tile_counts: np.ndarray) -> np.ndarray:
+        result = np.zeros((self.topology.vertex_count, len(RESOURCES)))
+        np.add.at(result, (self._rows, self._columns), tile_counts[self._hexes])
+        return result
+
+    def run(self, turns: int, rng: Optional[np.random.Generator] = None, batch_size: int = 1_000_000) -> SimulationResult:
+        if turns <= 0:
+            raise ValueError(f"turns debe ser positivo (se recibió {turns})")
+        rng = rng if rng is not None else np.random.default_rng()
+        tile_count = len(self.numbers)
+        roll_counts = np.zeros(13, dtype=np.int64)
+        blocked = np.zeros(tile_count, dtype=np.int64)
+        robber = self.robber_start
+
+        done = 0
+        while done < turns:
+            size = min(batch_size, turns - done)
+            rolls = rng.integers(1, 7, size) + rng.integers(1, 7, size)
+            roll_counts += np.bincount(rolls, minlength=13)
+
+            # Posición del ladrón en cada turno: la elegida en el último 7 (o la anterior al lote)
+            sevens = np.flatnonzero(rolls == 7)
+            if len(self.robber_targets) and len(sevens):
+                moves = rng.choice(self.robber_targets, len(sevens))
+                marker = np.full(size, -1, dtype=np.int64)
+                marker[sevens] = np.arange(len(sevens))
+                last = np.maximum.accumulate(marker)
+                positions = np.where(last >= 0, moves[last], robber)
+                robber = int(moves[-1])
+            else:
+                positions = np.full(size, robber, dtype=np.int64)
+
+            valid = positions >= 0
+            hits = valid & (rolls == self.numbers[np.where(valid, positions, 0)])
+            blocked += np.bincount(positions[hits], minlength=tile_count)
+            done += size
+
+        gross = roll_counts[self.numbers] * (self.numbers > 0)
+        income = self._to_vertices((gross - blocked).astype(float)) / turns
+        robber_loss = self._to_vertices(blocked.astype(float)) / turns
+        port_value = (income * self._trade_gain).sum(axis=1)
+        return SimulationResult(turns, income, robber_loss, port_value, roll_counts)
+
+
+def _simulate_one(board, turns: int, seed: np.random.SeedSequence) -> SimulationResult:
+    return ProductionSimulator(board).run(turns, np.random.default_rng(seed))
+
+
+def simulate_boards(boards: Sequence, turns: int, seed: Optional[int] = None,
+                    workers: Optional[int] = None) -> List[SimulationResult]:
+    """Simula varios tableros, repartidos en procesos, con semillas reproducibles
+
+    Cada tablero recibe su propia semilla derivada de seed con SeedSequence.spawn,
+    así el resultado no depende de la cantidad de procesos ni del orden de ejecución.
+    """
+    boards = list(boards)
+    seeds = np.random.SeedSequence(seed).spawn(len(boards))
+    if workers == 1 or len(boards) <= 1:
+        return [_simulate_one(board, turns, child) for board, child in zip(boards, seeds)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_simulate_one, boards, [turns] * len(boards), seeds))
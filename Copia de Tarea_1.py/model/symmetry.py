@@ -0,0 +1,299 @@
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from model.HexCoord import HEX_DIRECTIONS, HexCoord
+from utils.constants import MATERIAL_CODES
+
+# Clave por tile: material * 13 + número (0 sin número); entra en un uint8
+KEY_BASE = 13
+
+PortSpec = Tuple[int, str, str]  # (índice del hexágono, dirección, material del puerto)
+
+
+def _rotate(coord: HexCoord) -> HexCoord:
+    """Rotación de 60° alrededor del centro en coordenadas axiales"""
+    return HexCoord(-coord.r, coord.q + coord.r)
+
+
+def _reflect(coord: HexCoord) -> HexCoord:
+    """Reflexión que intercambia los ejes q y r"""
+    return HexCoord(coord.r, coord.q)
+
+
+def _symmetries() -> List[Callable[[HexCoord], HexCoord]]:
+    """Las 12 simetrías del hexágono: 6 rotaciones, con y sin reflexión"""
+    result = []
+    for reflected in (False, True):
+        for turns in range(6):
+            def transform(coord, turns=turns, reflected=reflected):
+                if reflected:
+                    coord = _reflect(coord)
+                for _ in range(turns):
+                    coord = _rotate(coord)
+                return coord
+            result.append(transform)
+    return result
+
+
+SYMMETRIES = _symmetries()
+_DIRECTION_BY_OFFSET = {offset: direction for direction, offset in HEX_DIRECTIONS.items()}
+
+
+def board_keys(materials: np.ndarray, numbers: np.ndarray) -> np.ndarray:
+    """Claves uint8 por tile (o por tablero y tile en un lote) a partir de códigos y números"""
+    return (np.asarray(materials, dtype=np.uint8) * KEY_BASE + np.asarray(numbers, dtype=np.uint8)).astype(np.uint8)
+
+
+def _fingerprint(row: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(row, digest_size=8).digest(), "little")
+
+
+class BoardSymmetry:
+    """Tablas de permutación de las simetrías que conservan una forma de tablero
+
+    tables[s, j] es el índice del hexágono que la simetría s lleva a la posición j
+    (en orden de fila y columna), así keys[tables[s]] es el tablero transformado.
+    Solo se guardan las simetrías que llevan la forma sobre sí misma (las 12 en un
+    tablero hexagonal centrado); si se pasan puertos, además deben dejarlos en el
+    mismo lugar y con el mismo material.
+    La forma canónica es la transformada lexicográficamente mínima.
+    """
+
+    def __init__(self, coords: Sequence[HexCoord], ports: Sequence[PortSpec] = ()):
+        self.coords: Tuple[HexCoord, ...] = tuple(coords)
+        index_of = {coord: i for i, coord in enumerate(self.coords)}
+        port_set = {(self.coords[h], direction, material) for h, direction, material in ports}
+
+        # Las filas de tables siguen el orden (r, q), así la forma canónica no depende
+        # del orden en que vengan los hexágonos
+        ordered = sorted(self.coords, key=lambda coord: (coord.r, coord.q))
+        tables = []
+        for transform in SYMMETRIES:
+            mapped = [index_of.get(transform(coord)) for coord in ordered]
+            if None in mapped:
+                continue
+            moved_ports = {
+                (transform(coord), _DIRECTION_BY_OFFSET[transform(HEX_DIRECTIONS[direction])], material)
+                for coord, direction, material in port_set
+            }
+            if moved_ports != port_set:
+                continue
+            tables.append(mapped)
+
+        self.tables = np.array(tables, dtype=np.intp)
+        self.tables.flags.writeable = False
+
+    @classmethod
+    def shared(cls, coords: Sequence[HexCoord], ports: Sequence[PortSpec] = ()) -> "BoardSymmetry":
+        return _shared_symmetry(tuple(coords), tuple(ports))
+
+    @classmethod
+    def for_board(cls, board, include_ports: bool = False) -> "BoardSymmetry":
+        """Simetrías de un Board construido; los índices siguen board.tiles"""
+        if not board.hex_grid:
+            board.construir_tablero_con_hex_coords()
+        ports = ()
+        if include_ports:
+            index_of = {tile.id: h for h, tile in enumerate(board.tiles)}
+            materials = {port.id: port.material for port in board.ports}
+            ports = tuple(sorted(
+                (index_of[tile_id], direction, materials[port_id])
+                for port_id, (tile_id, direction) in board.port_positions.items()
+            ))
+        return cls.shared([board.tile_coords[tile] for tile in board.tiles], ports)
+
+    @classmethod
+    def for_template(cls, template, include_ports: bool = False) -> "BoardSymmetry":
+        """Simetrías de un BoardTemplate; los índices siguen template.tile_ids"""
+        ports = ()
+        if include_ports:
+            materials = dict(template.ports)
+            ports = tuple(sorted(
+                (h, direction, materials[target])
+                for h, edges in enumerate(template.edges)
+                for direction, target in edges.items() if target in materials
+            ))
+        return cls.shared(template.coords, ports)
+
+    @property
+    def size(self) -> int:
+        return len(self.tables)
+
+    def canonical(self, keys: np.ndarray) -> Tuple[np.ndarray, int]:
+        """Forma canónica de un tablero y el índice de la simetría que la produce"""
+        forms, symmetry = self.canonical_batch(np.asarray(keys)[None, :])
+        return forms[0], int(symmetry[0])
+
+    def canonical_batch(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Formas canónicas de un lote (B, N) comparando columna por columna"""
+        transformed = np.asarray(keys)[:, self.tables]          # (B, S, N)
+        candidates = np.ones(transformed.shape[:2], dtype=bool)
+        for column in range(transformed.shape[2]):
+            values = np.where(candidates, transformed[:, :, column], 255)
+            candidates &= values == values.min(axis=1, keepdims=True)
+            if not (candidates.sum(axis=1) > 1).any():
+                break
+        symmetry = candidates.argmax(axis=1)
+        return transformed[np.arange(len(transformed)), symmetry], symmetry
+
+    def fingerprint(self, keys: np.ndarray) -> int:
+        """Huella de 64 bits de la forma canónica"""
+        form, _ = self.canonical(keys)
+        return _fingerprint(form.astype(np.uint8).tobytes())
+
+    def fingerprints(self, keys: np.ndarray) -> np.ndarray:
+        """Huellas uint64 de un lote (B, N)"""
+        forms, _ = self.canonical_batch(keys)
+        forms = np.ascontiguousarray(forms, dtype=np.uint8)
+        return np.fromiter((_fingerprint(row.tobytes()) for row in forms), dtype=np.uint64, count=len(forms))
+
+    def __repr__(self) -> str:
+        return f"BoardSymmetry(hexes={len(self.coords)}, symmetries={self.size})"
+
+
+@lru_cache(maxsize=64)
+def _shared_symmetry(coords: Tuple[HexCoord, ...], ports: Tuple[PortSpec, ...]) -> BoardSymmetry:
+    return BoardSymmetry(coords, ports)
+
+
+def board_state_keys(board) -> np.ndarray:
+    """Claves por tile de un Board en el orden de board.tiles"""
+    materials = [MATERIAL_CODES[tile.material] for tile in board.tiles]
+    numbers = [tile.number or 0 for tile in board.tiles]
+    return board_keys(materials, numbers)
+
+
+def canonical_form(board, include_ports: bool = False) -> np.ndarray:
+    """Forma canónica del hex_grid de un Board (claves en orden de fila y columna)"""
+    symmetry = BoardSymmetry.for_board(board, include_ports)
+    return symmetry.canonical(board_state_keys(board))[0]
+
+
+def board_fingerprint(board, include_ports: bool = False) -> int:
+    """Huella de 64 bits que es igual para tableros que son rotaciones o reflejos entre sí"""
+    symmetry = BoardSymmetry.for_board(board, include_ports)
+    return symmetry.fingerprint(board_state_keys(board))
+
+
+class BloomFilter:
+    """Filtro de Bloom sobre huellas de 64 bits con un arreglo de bits de NumPy
+
+    Nunca da falsos negativos; la tasa de falsos positivos depende de bits y hashes.
+    Los k índices salen de la propia huella con doble hashing.
+    """
+
+    def __init__(self, bits: int, hashes: int = 7):
+        self.bits = bits
+        self.hashes = hashes
+        self._array = np.zeros((bits + 7) // 8, dtype=np.uint8)
+        self._steps = np.arange(hashes, dtype=np.uint64)
+
+    def _positions(self, fingerprints: np.ndarray) -> np.ndarray:
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        low = fingerprints & np.uint64(0xFFFFFFFF)
+        high = (fingerprints >> np.uint64(32)) | np.uint64(1)
+        return (low[:, None] + self._steps * high[:, None]) % np.uint64(self.bits)  # (B, k)
+
+    def contains_many(self, fingerprints: np.ndarray) -> np.ndarray:
+        positions = self._positions(fingerprints)
+        bits = (self._array[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return bits.all(axis=1)
+
+    def add_many(self, fingerprints: np.ndarray) -> None:
+        positions = self._positions(fingerprints).ravel()
+        np.bitwise_or.at(self._array, positions >> np.uint64(3),
+                         (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8)))
+
+    @property
+    def nbytes(self) -> int:
+        return self._array.nbytes
+
+
+class SeenSet:
+    """Conjunto de huellas ya vistas con memoria acotada
+
+    Guarda hasta max_exact huellas exactas. Al llenarse, si hay Bloom las nuevas van
+    al filtro (puede descartar por error algún tablero nuevo, nunca dejar pasar un
+    repetido); sin Bloom se olvidan las más viejas y podrían volver a aparecer.
+    """
+
+    def __init__(self, max_exact: int = 1_000_000, bloom_bits: int = 0, bloom_hashes: int = 7):
+        self.max_exact = max_exact
+        self._exact: "OrderedDict[int, None]" = OrderedDict()
+        self.bloom = BloomFilter(bloom_bits, bloom_hashes) if bloom_bits else None
+        self.forgotten = 0
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def __contains__(self, fingerprint: int) -> bool:
+        if int(fingerprint) in self._exact:
+            return True
+        return bool(self.bloom is not None and self.bloom.contains_many(np.array([fingerprint], dtype=np.uint64))[0])
+
+    def add_new(self, fingerprints: np.ndarray) -> np.ndarray:
+        """Registra un lote de huellas y devuelve la máscara de las que no se habían visto"""
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        # Repetidos dentro del mismo lote: solo cuenta la primera aparición
+        _, first = np.unique(fingerprints, return_index=True)
+        new = np.zeros(len(fingerprints), dtype=bool)
+        new[first] = True
+
+        exact = self._exact
+        values = fingerprints.tolist()
+        for i in np.flatnonzero(new).tolist():
+            if values[i] in exact:
+                new[i] = False
+        if self.bloom is not None:
+            new &= ~self.bloom.contains_many(fingerprints)
+
+        for value in fingerprints[new].tolist():
+            if len(exact) < self.max_exact:
+                exact[value] = None
+            elif self.bloom is None:
+                exact.popitem(last=False)
+                exact[value] = None
+                self.forgotten += 1
+        if self.bloom is not None and len(exact) >= self.max_exact:
+            self.bloom.add_many(fingerprints[new])
+        return new
+
+
+def unique_batches(generator, total: Optional[int] = None, batch_size: int = 10_000,
+                   seen: Optional[SeenSet] = None, max_batches: Optional[int] = None,
+                   include_ports: bool = False, max_idle: int = 10,
+                   **generate_options) -> Iterator[Tuple[np.ndarray, "object"]]:
+    """Genera lotes con BatchBoardGenerator y deja pasar solo tableros no vistos
+
+    Produce pares (huellas, BoardBatch) hasta juntar total tableros únicos o agotar
+    max_batches lotes. Dos tableros que son rotaciones o reflejos cuentan como uno.
+    También se detiene tras max_idle lotes seguidos sin tableros nuevos (clases de
+    simetría agotadas o filtro de Bloom saturado), así nunca queda girando en vacío.
+    """
+    if max_idle < 1:
+        raise ValueError(f"max_idle debe ser positivo (se recibió {max_idle})")
+    from model.board_generator import BoardBatch
+
+    template = generator.template
+    symmetry = BoardSymmetry.for_template(template, include_ports)
+    seen = seen if seen is not None else SeenSet()
+    produced = batches = idle = 0
+    while (total is None or produced < total) and (max_batches is None or batches < max_batches):
+        batch = generator.generate(batch_size, **generate_options)
+        batches += 1
+        fingerprints = symmetry.fingerprints(board_keys(batch.materials, batch.numbers))
+        new = np.flatnonzero(seen.add_new(fingerprints))
+        if total is not None:
+            new = new[:total - produced]
+        if len(new) == 0:
+            idle += 1
+            if idle >= max_idle:
+                return
+            continue
+        idle = 0
+        produced += len(new)
+        yield fingerprints[new], BoardBatch(template, batch.materials[new], batch.numbers[new], batch.robber[new])
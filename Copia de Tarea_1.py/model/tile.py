@@ -1,6 +1,8 @@
 from typing import Dict, Optional
 
 class Tile:
+    __slots__ = ("id", "material", "edges", "number", "has_robber")
+
     def __init__(self, tile_id: str, material: str, edges: Dict[str, str]):
         self.id = tile_id
         self.material = material
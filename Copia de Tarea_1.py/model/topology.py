@@ -0,0 +1,168 @@
+from functools import lru_cache
+from typing import Dict, FrozenSet, Sequence, Tuple
+
+import numpy as np
+
+from model.HexCoord import DIRECTION_ORDER, HEX_DIRECTIONS, HexCoord, hex_corners
+
+PortSpec = Tuple[int, str]  # (índice del hexágono, dirección del edge)
+
+
+def _csr(rows: Sequence[Sequence[int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Convierte listas de adyacencia en (indptr, indices) al estilo CSR"""
+    indptr = np.zeros(len(rows) + 1, dtype=np.int32)
+    indptr[1:] = np.cumsum([len(row) for row in rows])
+    indices = np.fromiter((item for row in rows for item in row), dtype=np.int32, count=int(indptr[-1]))
+    return indptr, indices
+
+
+def _read_only(*arrays: np.ndarray) -> None:
+    for array in arrays:
+        array.flags.writeable = False
+
+
+class BoardTopology:
+    """Esquinas (vértices) y caminos (edges) de una forma de tablero, con índices enteros
+
+    Se construye una vez por forma (coordenadas de los hexágonos + ubicación de los
+    puertos) y se comparte entre todos los tableros con esa forma: los arreglos son
+    de solo lectura. Las adyacencias se guardan en formato CSR (indptr, indices).
+    """
+
+    def __init__(self, coords: Sequence[HexCoord], ports: Sequence[PortSpec] = ()):
+        self.coords: Tuple[HexCoord, ...] = tuple(coords)
+        self.ports: Tuple[PortSpec, ...] = tuple(ports)
+        hex_count = len(self.coords)
+
+        vertex_ids: Dict[FrozenSet[HexCoord], int] = {}
+        edge_ids: Dict[FrozenSet[HexCoord], int] = {}
+        self.hex_vertices = np.zeros((hex_count, 6), dtype=np.int32)
+        self.hex_edges = np.zeros((hex_count, 6), dtype=np.int32)
+        vertex_hexes = []
+        edge_vertices = []
+
+        offsets = list(HEX_DIRECTIONS.values())
+        for h, coord in enumerate(self.coords):
+            corners = hex_corners(coord)
+            for i, corner in enumerate(corners):
+                if corner not in vertex_ids:
+                    vertex_ids[corner] = len(vertex_ids)
+                    vertex_hexes.append([])
+                vertex = vertex_ids[corner]
+                self.hex_vertices[h, i] = vertex
+                vertex_hexes[vertex].append(h)
+            # El edge en la dirección i une las esquinas i-1 e i
+            for i, offset in enumerate(offsets):
+                key = frozenset((coord, coord + offset))
+                if key not in edge_ids:
+                    edge_ids[key] = len(edge_ids)
+                    edge_vertices.append((int(self.hex_vertices[h, i - 1]), int(self.hex_vertices[h, i])))
+                self.hex_edges[h, i] = edge_ids[key]
+
+        self.vertex_count = len(vertex_ids)
+        self.edge_count = len(edge_ids)
+        self.hex_count = hex_count
+
+        self.edge_vertices = np.array(edge_vertices, dtype=np.int32).reshape(-1, 2)
+
+        neighbors = [[] for _ in range(self.vertex_count)]
+        edges_of = [[] for _ in range(self.vertex_count)]
+        for e, (a, b) in enumerate(edge_vertices):
+            neighbors[a].append(b)
+            neighbors[b].append(a)
+            edges_of[a].append(e)
+            edges_of[b].append(e)
+
+        self.vertex_hex_indptr, self.vertex_hex_indices = _csr(vertex_hexes)
+        self.vertex_neighbor_indptr, self.vertex_neighbor_indices = _csr(neighbors)
+        self.vertex_edge_indptr, self.vertex_edge_indices = _csr(edges_of)
+
+        # Pares (origen, destino) de vértices vecinos para consultas vectorizadas
+        self._neighbor_sources = np.repeat(
+            np.arange(self.vertex_count, dtype=np.int32), np.diff(self.vertex_neighbor_indptr)
+        )
+
+        self.vertex_port = np.full(self.vertex_count, -1, dtype=np.int32)
+        for p, (h, direction) in enumerate(self.ports):
+            i = DIRECTION_ORDER.index(direction)
+            self.vertex_port[self.hex_vertices[h, i - 1]] = p
+            self.vertex_port[self.hex_vertices[h, i]] = p
+
+        self._incidence = None
+        _read_only(
+            self.hex_vertices, self.hex_edges, self.edge_vertices,
+            self.vertex_hex_indptr, self.vertex_hex_indices,
+            self.vertex_neighbor_indptr, self.vertex_neighbor_indices,
+            self.vertex_edge_indptr, self.vertex_edge_indices,
+            self._neighbor_sources, self.vertex_port,
+        )
+
+    @classmethod
+    def shared(cls, coords: Sequence[HexCoord], ports: Sequence[PortSpec] = ()) -> "BoardTopology":
+        """Instancia compartida para esta forma de tablero"""
+        return _shared_topology(tuple(coords), tuple(ports))
+
+    @classmethod
+    def for_board(cls, board) -> "BoardTopology":
+        """Topología de un Board construido; los índices siguen board.tiles y board.ports"""
+        if not board.tile_coords:
+            board.construir_tablero_con_hex_coords()
+        index_of = {tile.id: h for h, tile in enumerate(board.tiles)}
+        ports = tuple(
+            (index_of[board.port_positions[port.id][0]], board.port_positions[port.id][1])
+            for port in board.ports if port.id in board.port_positions
+        )
+        return cls.shared([board.tile_coords[tile] for tile in board.tiles], ports)
+
+    @classmethod
+    def for_template(cls, template) -> "BoardTopology":
+        """Topología de un BoardTemplate; los índices siguen template.tile_ids y template.ports"""
+        port_index = {port_id: p for p, (port_id, _) in enumerate(template.ports)}
+        located = {}
+        for h, edges in enumerate(template.edges):
+            for direction, target in edges.items():
+                if target in port_index:
+                    located[port_index[target]] = (h, direction)
+        return cls.shared(template.coords, tuple(located[p] for p in sorted(located)))
+
+    def vertex_hexes(self, vertex: int) -> np.ndarray:
+        return self.vertex_hex_indices[self.vertex_hex_indptr[vertex]:self.vertex_hex_indptr[vertex + 1]]
+
+    def vertex_neighbors(self, vertex: int) -> np.ndarray:
+        return self.vertex_neighbor_indices[self.vertex_neighbor_indptr[vertex]:self.vertex_neighbor_indptr[vertex + 1]]
+
+    def vertex_edges(self, vertex: int) -> np.ndarray:
+        return self.vertex_edge_indices[self.vertex_edge_indptr[vertex]:self.vertex_edge_indptr[vertex + 1]]
+
+    def incidence_matrix(self) -> np.ndarray:
+        """Matriz densa vértices x hexágonos (1.0 si el vértice toca el hexágono)"""
+        if self._incidence is None:
+            incidence = np.zeros((self.vertex_count, self.hex_count), dtype=np.float32)
+            rows = np.repeat(np.arange(self.vertex_count), np.diff(self.vertex_hex_indptr))
+            incidence[rows, self.vertex_hex_indices] = 1.0
+            _read_only(incidence)
+            self._incidence = incidence
+        return self._incidence
+
+    def hexes_for_roll(self, numbers: np.ndarray, roll: int) -> np.ndarray:
+        """Hexágonos que producen con la tirada dada (numbers alineado con coords)"""
+        return np.flatnonzero(np.asarray(numbers) == roll)
+
+    def vertices_for_roll(self, numbers: np.ndarray, roll: int) -> np.ndarray:
+        """Vértices que reciben producción con la tirada dada"""
+        return np.unique(self.hex_vertices[self.hexes_for_roll(numbers, roll)])
+
+    def legal_settlement_spots(self, occupied: np.ndarray) -> np.ndarray:
+        """Máscara de vértices libres que respetan la regla de distancia"""
+        occupied = np.asarray(occupied, dtype=bool)
+        blocked = occupied.copy()
+        blocked[self.vertex_neighbor_indices[occupied[self._neighbor_sources]]] = True
+        return ~blocked
+
+    def __repr__(self) -> str:
+        return f"BoardTopology(hexes={self.hex_count}, vertices={self.vertex_count}, edges={self.edge_count})"
+
+
+@lru_cache(maxsize=64)
+def _shared_topology(coords: Tuple[HexCoord, ...], ports: Tuple[PortSpec, ...]) -> BoardTopology:
+    return BoardTopology(coords, ports)
@@ -0,0 +1,142 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from model.HexCoord import DIRECTION_ORDER, REVERSE_DIRECTIONS, radius_for_tile_count
+from utils.constants import MATERIAL_DISTRIBUTION, PORT_DISTRIBUTION, expand_distribution
+
+
+@dataclass(frozen=True)
+class ValidationError:
+    """Un error de validación con un código estable para filtrarlo o agruparlo"""
+    code: str
+    message: str
+    tile_id: Optional[str] = None
+
+
+class BoardValidator:
+    """Validador compilado: precalcula las tablas una vez y valida en una sola pasada
+
+    Las distribuciones esperadas se escalan con expand_distribution, así un tablero
+    de 19 tiles y 9 puertos se compara exactamente con MATERIAL_DISTRIBUTION y
+    PORT_DISTRIBUTION, y uno más grande con la distribución repetida.
+    """
+
+    _default: Optional["BoardValidator"] = None
+
+    def __init__(self, material_distribution: Dict[str, int] = MATERIAL_DISTRIBUTION,
+                 port_distribution: Dict[str, int] = PORT_DISTRIBUTION):
+        self.material_distribution = {m: n for m, n in material_distribution.items() if m != "desert"}
+        self.port_distribution = port_distribution
+        self.known_materials = frozenset(material_distribution)
+        self.known_ports = frozenset(port_distribution)
+        self.reverse = REVERSE_DIRECTIONS
+        # Para cada dirección: (siguiente en sentido horario, anterior)
+        self.turns = {
+            direction: (DIRECTION_ORDER[(i + 1) % 6], DIRECTION_ORDER[(i - 1) % 6])
+            for i, direction in enumerate(DIRECTION_ORDER)
+        }
+        self._expected_materials: Dict[int, Counter] = {}
+        self._expected_ports: Dict[int, Counter] = {}
+
+    @classmethod
+    def default(cls) -> "BoardValidator":
+        """Instancia compartida con las distribuciones estándar"""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def _expected(self, cache: Dict[int, Counter], distribution: Dict[str, int], count: int) -> Counter:
+        expected = cache.get(count)
+        if expected is None:
+            expected = cache[count] = Counter(expand_distribution(distribution, count)) if count else Counter()
+        return expected
+
+    def validate(self, tiles: Sequence, ports: Sequence) -> List[ValidationError]:
+        """Devuelve todos los errores del tablero (lista vacía si es válido)"""
+        errors: List[ValidationError] = []
+        add = errors.append
+
+        if radius_for_tile_count(len(tiles)) is None:
+            add(ValidationError("tile_count", f"La cantidad de tiles ({len(tiles)}) no forma un tablero hexagonal."))
+
+        # Índices y contadores construidos una sola vez
+        tiles_by_id: Dict[str, object] = {}
+        materials: Counter = Counter()
+        for tile in tiles:
+            if tile.id in tiles_by_id:
+                add(ValidationError("duplicate_tile", f"El id de tile '{tile.id}' está repetido.", tile.id))
+            tiles_by_id[tile.id] = tile
+            materials[tile.material] += 1
+            if tile.material not in self.known_materials:
+                add(ValidationError("unknown_material", f"El tile '{tile.id}' tiene un material desconocido '{tile.material}'.", tile.id))
+
+        port_materials: Counter = Counter()
+        port_ids = set()
+        for port in ports:
+            if port.id in port_ids or port.id in tiles_by_id:
+                add(ValidationError("duplicate_port", f"El id de puerto '{port.id}' está repetido."))
+            port_ids.add(port.id)
+            port_materials[port.material] += 1
+            if port.material not in self.known_ports:
+                add(ValidationError("unknown_port", f"El puerto '{port.id}' tiene un material desconocido '{port.material}'."))
+
+        deserts = materials.get("desert", 0)
+        if deserts != 1:
+            add(ValidationError("desert_count", f"Debe haber exactamente 1 tile de desierto, se encontraron {deserts}."))
+
+        # Pasada única por los edges: ids válidos, reciprocidad y puertos colindantes
+        port_uses: Counter = Counter()
+        reverse = self.reverse
+        turns = self.turns
+        for tile in tiles:
+            edges = tile.edges
+            for direction, target_id in edges.items():
+                if direction not in reverse:
+                    add(ValidationError("bad_direction", f"El tile '{tile.id}' tiene una dirección inválida '{direction}'.", tile.id))
+                    continue
+                neighbor = tiles_by_id.get(target_id)
+                if neighbor is not None:
+                    if neighbor.edges.get(reverse[direction]) != tile.id:
+                        add(ValidationError(
+                            "edge_mismatch",
+                            f"El edge '{direction}' de '{tile.id}' apunta a '{target_id}', pero "
+                            f"'{target_id}' no apunta de vuelta por '{reverse[direction]}'.",
+                            tile.id,
+                        ))
+                elif target_id in port_ids:
+                    port_uses[target_id] += 1
+                    # El siguiente edge de costa en sentido horario comparte una esquina con este
+                    clockwise, counter = turns[direction]
+                    corner = tiles_by_id.get(edges.get(clockwise))
+                    if corner is not None:
+                        following = corner.edges.get(counter)
+                    else:
+                        following = edges.get(clockwise)
+                    if following in port_ids and following != target_id:
+                        add(ValidationError(
+                            "adjacent_ports",
+                            f"Los puertos '{target_id}' y '{following}' son colindantes.",
+                            tile.id,
+                        ))
+                else:
+                    add(ValidationError("invalid_edge", f"El tile '{tile.id}' tiene un edge inválido hacia '{target_id}'.", tile.id))
+
+        for port_id in port_ids:
+            uses = port_uses.get(port_id, 0)
+            if uses != 1:
+                add(ValidationError("port_placement", f"El puerto '{port_id}' aparece en {uses} edges (se espera 1)."))
+
+        # Distribuciones contra las esperadas para este tamaño de tablero
+        expected = self._expected(self._expected_materials, self.material_distribution, len(tiles) - deserts)
+        actual = Counter({m: n for m, n in materials.items() if m != "desert"})
+        if actual != expected:
+            add(ValidationError("material_distribution", f"Distribución de materiales {dict(actual)}, se esperaba {dict(expected)}."))
+        expected = self._expected(self._expected_ports, self.port_distribution, len(ports))
+        if port_materials != expected:
+            add(ValidationError("port_distribution", f"Distribución de puertos {dict(port_materials)}, se esperaba {dict(expected)}."))
+
+        return errors
+
+    def validate_board(self, board) -> List[ValidationError]:
+        return self.validate(board.tiles, board.ports)
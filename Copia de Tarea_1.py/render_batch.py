@@ -0,0 +1,173 @@
+"""Valida y renderiza muchos tableros en paralelo sin abrir ningún visor.
+
+Uso:
+    python render_batch.py mapas/ --out imagenes/
+    python render_batch.py tableros.jsonl --tar tableros.tar --workers 8
+    cat tableros.jsonl | python render_batch.py - --out imagenes/
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import tarfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from model.board import Board
+from model.exceptions import InvalidBoardException
+
+STAGES = ("parse", "load", "build", "render", "encode")
+
+# Un ImageView por proceso, creado en el initializer del pool
+_worker_view = None
+
+
+def _init_worker(renderer: str) -> None:
+    global _worker_view
+    if renderer == "sprites":
+        from view.sprite_view import SpriteImageView
+        _worker_view = SpriteImageView()
+    else:
+        from view.image_view import ImageView
+        _worker_view = ImageView()
+
+
+def _render_one(task: Tuple[int, str, str]):
+    """Procesa un tablero: devuelve (índice, nombre, png o None, error, tiempos)"""
+    index, name, text = task
+    timings: Dict[str, float] = {}
+    clock = time.perf_counter
+    try:
+        start = clock()
+        data = json.loads(text)
+        timings["parse"] = clock() - start
+
+        start = clock()
+        board = Board()
+        board.load_from_dict(data)
+        timings["load"] = clock() - start
+
+        start = clock()
+        board.construir_tablero_con_hex_coords()
+        timings["build"] = clock() - start
+
+        start = clock()
+        image = _worker_view.generate_board_image(board.tile_coords, board.port_positions, board.robber_position)
+        timings["render"] = clock() - start
+
+        start = clock()
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        timings["encode"] = clock() - start
+        return index, name, buffer.getvalue(), None, timings
+    except json.JSONDecodeError:
+        return index, name, None, "Formato JSON inválido", timings
+    except InvalidBoardException as e:
+        return index, name, None, f"Error en el tablero: {e}", timings
+    except (KeyError, TypeError, AttributeError) as e:
+        return index, name, None, f"Datos incompletos: {e!r}", timings
+
+
+def iter_sources(source: str) -> Iterator[Tuple[str, str]]:
+    """Produce (nombre, texto JSON) desde un directorio, un archivo JSONL o stdin ('-')"""
+    if source != "-" and os.path.isdir(source):
+        for path in sorted(Path(source).glob("*.json")):
+            yield path.name, path.read_text()
+        return
+
+    stream = sys.stdin if source == "-" else open(source, "r")
+    try:
+        for line_number, line in enumerate(stream, start=1):
+            if line.strip():
+                yield f"linea {line_number}", line
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def _bounded_map(executor, fn, items, window: int):
+    """Como executor.map pero con a lo sumo window tareas pendientes (memoria acotada)"""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class _Output:
+    """Escribe las imágenes numeradas en un directorio o en un archivo tar"""
+
+    def __init__(self, out_dir: Optional[str], tar_path: Optional[str]):
+        self.out_dir = out_dir
+        self.tar = tarfile.open(tar_path, "w") if tar_path else None
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+
+    def write(self, index: int, png: bytes) -> None:
+        filename = f"board_{index:06d}.png"
+        if self.tar is not None:
+            info = tarfile.TarInfo(filename)
+            info.size = len(png)
+            info.mtime = int(time.time())
+            self.tar.addfile(info, io.BytesIO(png))
+        else:
+            with open(os.path.join(self.out_dir, filename), "wb") as f:
+                f.write(png)
+
+    def close(self) -> None:
+        if self.tar is not None:
+            self.tar.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Renderiza tableros en paralelo")
+    parser.add_argument("source", help="directorio con *.json, archivo JSONL o '-' para stdin")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--out", help="directorio de salida para board_NNNNNN.png")
+    target.add_argument("--tar", help="archivo tar de salida")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--renderer", choices=("sprites", "classic"), default="sprites")
+    args = parser.parse_args(argv)
+
+    totals = {stage: 0.0 for stage in STAGES + ("write",)}
+    rendered = failed = 0
+    output = _Output(args.out, args.tar)
+    start = time.perf_counter()
+
+    tasks = ((index, name, text) for index, (name, text) in enumerate(iter_sources(args.source), start=1))
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                             initargs=(args.renderer,)) as executor:
+        for index, name, png, error, timings in _bounded_map(executor, _render_one, tasks, 4 * args.workers):
+            for stage, elapsed in timings.items():
+                totals[stage] += elapsed
+            if error:
+                failed += 1
+                print(f"{name}: {error}", file=sys.stderr)
+                continue
+            write_start = time.perf_counter()
+            output.write(index, png)
+            totals["write"] += time.perf_counter() - write_start
+            rendered += 1
+
+    output.close()
+    elapsed = time.perf_counter() - start
+    processed = rendered + failed
+    print(f"\nTableros renderizados: {rendered}, con errores: {failed}")
+    print(f"Tiempo total: {elapsed:.2f} s ({rendered / elapsed if elapsed else 0:.1f} tableros/s, "
+          f"{args.workers} procesos)")
+    print("Tiempos por etapa (suma en todos los procesos / promedio por tablero):")
+    for stage, total in totals.items():
+        mean = total / processed * 1e3 if processed else 0.0
+        print(f"  {stage:<7} {total:>9.3f} s {mean:>9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import math
+import random
+from typing import Dict, List, Optional, Tuple
+from model.HexCoord import DIRECTION_ORDER, HexCoord, HEX_DIRECTIONS, hex_coords_for_radius
+from utils.constants import MATERIAL_DISTRIBUTION, PORT_DISTRIBUTION, expand_distribution
+
+
+def _edge_angle(coord: HexCoord, offset: HexCoord) -> float:
+    """Ángulo del punto medio de un edge respecto al centro del tablero"""
+    q = coord.q + offset.q / 2
+    r = coord.r + offset.r / 2
+    return math.atan2(1.5 * r, math.sqrt(3) * (q + r / 2))
+
+
+def generate_board_data(radius: int, seed: Optional[int] = None, random_ports: bool = False) -> Dict:
+    """Genera un mapa sintético de radio dado con el mismo formato que los JSON
+
+    Con random_ports los puertos se ubican al azar (sin puertos colindantes) con
+    PortPlacer en lugar de repartirse uniformemente a lo largo de la costa.
+    """
+    rng = random.Random(seed)
+    coords = hex_coords_for_radius(radius)
+    ids = {coord: f"tile{i + 1:02d}" for i, coord in enumerate(coords)}
+    center = HexCoord(0, 0)
+
+    materials = expand_distribution({m: n for m, n in MATERIAL_DISTRIBUTION.items() if m != "desert"}, len(coords) - 1)
+    rng.shuffle(materials)
+
+    tiles = []
+    coast: List[Tuple[float, Dict, str]] = []
+    for coord in coords:
+        edges = {}
+        for direction, offset in HEX_DIRECTIONS.items():
+            neighbor = coord + offset
+            if neighbor in ids:
+                edges[direction] = ids[neighbor]
+            else:
+                coast.append((_edge_angle(coord, offset), edges, direction))
+        material = "desert" if coord == center else materials.pop()
+        tiles.append({"id": ids[coord], "material": material, "edges": edges})
+
+    # Puertos repartidos uniformemente a lo largo de la costa (9 por cada 30 edges)
+    coast.sort(key=lambda item: item[0])
+    port_count = max(1, round(len(coast) * sum(PORT_DISTRIBUTION.values()) / 30))
+    port_materials = expand_distribution(PORT_DISTRIBUTION, port_count)
+    rng.shuffle(port_materials)
+    slots = [coast[i * len(coast) // port_count][1:] for i in range(port_count)]
+    if random_ports:
+        from model.port_placement import Coastline, PortPlacer
+
+        edges_of = {coord: tile["edges"] for coord, tile in zip(coords, tiles)}
+        coastline = Coastline.shared(coords)
+        slots = [
+            (edges_of[coastline.edges[edge][0]], DIRECTION_ORDER[coastline.edges[edge][1]])
+            for edge in PortPlacer(coastline, count=port_count).solve(rng)
+        ]
+    ports = []
+    for i, (material, (edges, direction)) in enumerate(zip(port_materials, slots)):
+        port_id = f"p{i + 1:02d}"
+        edges[direction] = port_id
+        ports.append({"id": port_id, "material": material})
+
+    return {"tiles": tiles, "ports": ports}
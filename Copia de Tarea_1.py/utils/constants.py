@@ -20,5 +20,23 @@ PORT_DISTRIBUTION: Dict[str, int] = {
     "mineral": 1
 }
 
+
+def expand_distribution(distribution: Dict[str, int], count: int) -> List[str]:
+    """Repite la distribución hasta obtener exactamente count elementos"""
+    pool = [material for material, amount in distribution.items() for _ in range(amount)]
+    repeats = -(-count // len(pool))
+    return (pool * repeats)[:count]
+
+
 # Orden de numeración de los terrenos
-NUMBER_ORDER: List[int] = [5, 2, 6, 3, 8, 10, 9, 12, 11, 4, 8, 10, 9, 4, 5, 6, 3, 11]
\ No newline at end of file
+NUMBER_ORDER: List[int] = [5, 2, 6, 3, 8, 10, 9, 12, 11, 4, 8, 10, 9, 4, 5, 6, 3, 11]
+
+# Códigos compactos de materiales para las representaciones en arreglos
+MATERIAL_CODES: Dict[str, int] = {material: code for code, material in enumerate(MATERIAL_DISTRIBUTION)}
+PORT_CODES: Dict[str, int] = {material: code for code, material in enumerate(PORT_DISTRIBUTION)}
+
+# Probabilidad de cada número expresada en "pips" (combinaciones de dos dados)
+NUMBER_PIPS: Dict[int, int] = {2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 8: 5, 9: 4, 10: 3, 11: 2, 12: 1}
+
+# Números rojos (los más probables)
+RED_NUMBERS = (6, 8)
@@ -0,0 +1,172 @@
+"""Medición opcional por fases (tiempo, llamadas y memoria) de Board e ImageView
+
+Desactivada por defecto: phase() devuelve un contexto vacío compartido, así el
+costo en el camino normal es una consulta a una variable global.
+
+    with profiling(track_allocations=True) as profiler:
+        board.load_from_json("mapa1-2.json")
+    print(profiler.to_prometheus())
+"""
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, TextIO
+
+_DISABLED = nullcontext()
+_active: Optional["Profiler"] = None
+
+
+@dataclass
+class PhaseEvent:
+    """Una ejecución de una fase"""
+    name: str
+    seconds: float
+    allocated_bytes: Optional[int] = None  # pico de memoria dentro de la fase (si se rastrea)
+
+
+@dataclass
+class PhaseStats:
+    """Acumulado de todas las ejecuciones de una fase"""
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    allocated_bytes: int = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "max_seconds": self.max_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "allocated_bytes": self.allocated_bytes,
+        }
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start", "base_memory", "saved_peak", "child_peak")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        if self.profiler.track_allocations:
+            # El pico de tracemalloc es global: se guarda el del padre y se reinicia
+            self.base_memory, self.saved_peak = tracemalloc.get_traced_memory()
+            self.child_peak = 0
+            tracemalloc.reset_peak()
+            self.profiler._stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        allocated = None
+        profiler = self.profiler
+        if profiler.track_allocations:
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, self.child_peak)
+            allocated = max(0, peak - self.base_memory)
+            profiler._stack.pop()
+            if profiler._stack:
+                parent = profiler._stack[-1]
+                parent.child_peak = max(parent.child_peak, peak, self.saved_peak)
+        profiler.record(PhaseEvent(self.name, seconds, allocated))
+        return False
+
+
+class Profiler:
+    """Acumula PhaseStats por nombre y reenvía cada PhaseEvent a los callbacks"""
+
+    def __init__(self, track_allocations: bool = False,
+                 callbacks: Optional[List[Callable[[PhaseEvent], None]]] = None):
+        self.track_allocations = track_allocations
+        self.callbacks = list(callbacks or [])
+        self.stats: Dict[str, PhaseStats] = {}
+        self._stack: List[_Phase] = []
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+
+    def record(self, event: PhaseEvent) -> None:
+        stats = self.stats.get(event.name)
+        if stats is None:
+            stats = self.stats[event.name] = PhaseStats()
+        stats.calls += 1
+        stats.total_seconds += event.seconds
+        stats.max_seconds = max(stats.max_seconds, event.seconds)
+        if event.allocated_bytes is not None:
+            stats.allocated_bytes += event.allocated_bytes
+        for callback in self.callbacks:
+            callback(event)
+
+    def report(self) -> Dict[str, Dict]:
+        return {name: stats.to_dict() for name, stats in sorted(self.stats.items())}
+
+    def to_json_lines(self) -> str:
+        """Una línea JSON por fase con sus acumulados"""
+        return "".join(json.dumps(dict(phase=name, **values)) + "\n" for name, values in self.report().items())
+
+    def to_prometheus(self, prefix: str = "catan") -> str:
+        """Acumulados en formato de texto de Prometheus, con la fase como etiqueta"""
+        metrics = (
+            ("phase_calls_total", "counter", "Ejecuciones de la fase", "calls"),
+            ("phase_seconds_total", "counter", "Tiempo total en la fase", "total_seconds"),
+            ("phase_seconds_max", "gauge", "Ejecución más lenta de la fase", "max_seconds"),
+            ("phase_allocated_bytes_total", "counter", "Memoria pico sumada de la fase", "allocated_bytes"),
+        )
+        report = self.report()
+        lines = []
+        for suffix, kind, help_text, key in metrics:
+            name = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for phase_name, values in report.items():
+                lines.append(f'{name}{{phase="{phase_name}"}} {values[key]}')
+        return "\n".join(lines) + "\n"
+
+
+class JsonLinesExporter:
+    """Callback que escribe cada PhaseEvent como una línea JSON en un stream abierto"""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def __call__(self, event: PhaseEvent) -> None:
+        self.stream.write(json.dumps({
+            "phase": event.name,
+            "seconds": event.seconds,
+            "allocated_bytes": event.allocated_bytes,
+        }) + "\n")
+
+
+def phase(name: str):
+    """Contexto que mide una fase si hay un profiling() activo; si no, no hace nada"""
+    if _active is None:
+        return _DISABLED
+    return _active.phase(name)
+
+
+def active_profiler() -> Optional[Profiler]:
+    return _active
+
+
+@contextmanager
+def profiling(track_allocations: bool = False,
+              callbacks: Optional[List[Callable[[PhaseEvent], None]]] = None) -> Iterator[Profiler]:
+    """Activa la medición de fases dentro del bloque y devuelve el Profiler"""
+    global _active
+    profiler = Profiler(track_allocations, callbacks)
+    previous = _active
+    started_tracing = track_allocations and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    _active = profiler
+    try:
+        yield profiler
+    finally:
+        _active = previous
+        if started_tracing:
+            tracemalloc.stop()
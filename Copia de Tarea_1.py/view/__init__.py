@@ -0,0 +1,15 @@
+"""Vistas del tablero; se cargan al usarlas para no importar PIL en modo headless"""
+import importlib
+
+_LAZY = {
+    "ImageView": "view.image_view",
+    "SpriteImageView": "view.sprite_view",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,99 @@
+import io
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import BinaryIO, Optional
+
+from PIL import Image
+
+from utils.instrumentation import phase
+
+ENCODERS = ("PNG", "WEBP", "JPEG", "RAW")
+CONTENT_TYPES = {"PNG": "image/png", "WEBP": "image/webp", "JPEG": "image/jpeg", "RAW": "application/octet-stream"}
+EXTENSIONS = {".png": "PNG", ".webp": "WEBP", ".jpg": "JPEG", ".jpeg": "JPEG", ".rgb": "RAW", ".raw": "RAW"}
+DEFAULT_QUALITY = {"WEBP": 80, "JPEG": 95}
+
+
+@dataclass(frozen=True)
+class EncodeOptions:
+    """Opciones de codificación; los valores por defecto son los de Pillow"""
+    format: str = "PNG"
+    compress_level: int = 6   # PNG: 0 (sin comprimir, más rápido) a 9
+    quality: Optional[int] = None  # WebP con pérdida y JPEG (None: DEFAULT_QUALITY)
+    lossless: bool = False    # WebP sin pérdida
+    method: int = 4           # WebP: 0 (rápido) a 6 (más chico)
+
+    def __post_init__(self):
+        if self.format not in ENCODERS:
+            raise ValueError(f"Formato no soportado: {self.format} (opciones: {', '.join(ENCODERS)})")
+
+    @classmethod
+    def for_filename(cls, filename: str, **options) -> "EncodeOptions":
+        """Opciones según la extensión del archivo; ValueError si no se reconoce"""
+        extension = filename[filename.rfind("."):].lower() if "." in filename else ""
+        if extension not in EXTENSIONS:
+            raise ValueError(f"Extensión no soportada: {filename!r} (opciones: {', '.join(EXTENSIONS)})")
+        return cls(format=EXTENSIONS[extension], **options)
+
+    def save_arguments(self) -> dict:
+        quality = self.quality if self.quality is not None else DEFAULT_QUALITY.get(self.format)
+        if self.format == "PNG":
+            return {"format": "PNG", "compress_level": self.compress_level}
+        if self.format == "WEBP":
+            return {"format": "WEBP", "quality": quality, "lossless": self.lossless, "method": self.method}
+        if self.format == "JPEG":
+            return {"format": "JPEG", "quality": quality}
+        return {}
+
+
+def encode_image(image: Image.Image, options: EncodeOptions = EncodeOptions(),
+                 stream: Optional[BinaryIO] = None) -> Optional[bytes]:
+    """Codifica la imagen; con stream escribe ahí y devuelve None, si no devuelve los bytes
+
+    RAW son los píxeles RGB fila por fila, sin encabezado (el tamaño lo conoce quien llama).
+    """
+    with phase("image.encode"):
+        target = stream if stream is not None else io.BytesIO()
+        if options.format == "RAW":
+            target.write(image.convert("RGB").tobytes())
+        else:
+            image.save(target, **options.save_arguments())
+        return None if stream is not None else target.getvalue()
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+class PngStreamWriter:
+    """Escribe un PNG RGB de a franjas con zlib incremental, sin tener la imagen completa
+
+    Cada write() recibe las filas siguientes (una Image RGB del ancho total); los datos
+    comprimidos salen como chunks IDAT a medida que zlib los produce.
+    """
+
+    def __init__(self, stream: BinaryIO, width: int, height: int, compress_level: int = 6):
+        self.stream = stream
+        self.width, self.height = width, height
+        self.rows = 0
+        self._compressor = zlib.compressobj(compress_level)
+        stream.write(b"\x89PNG\r\n\x1a\n")
+        stream.write(_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+
+    def write(self, strip: Image.Image) -> None:
+        if strip.width != self.width or self.rows + strip.height > self.height:
+            raise ValueError("La franja no coincide con el tamaño declarado del PNG")
+        data = strip.convert("RGB").tobytes()
+        stride = 3 * self.width
+        # Filtro 0 (None) por fila: un byte nulo delante de cada fila
+        rows = b"".join(b"\x00" + data[i:i + stride] for i in range(0, len(data), stride))
+        compressed = self._compressor.compress(rows)
+        if compressed:
+            self.stream.write(_chunk(b"IDAT", compressed))
+        self.rows += strip.height
+
+    def close(self) -> None:
+        if self.rows != self.height:
+            raise ValueError(f"Se escribieron {self.rows} filas de {self.height}")
+        self.stream.write(_chunk(b"IDAT", self._compressor.flush()))
+        self.stream.write(_chunk(b"IEND", b""))
@@ -1,13 +1,25 @@
 from PIL import Image, ImageDraw, ImageFont
 import math
-from typing import List, Dict, Tuple
+from dataclasses import astuple
+from typing import List, Dict, Optional, Tuple
 from model.tile import Tile
 from model.port import Port
 from model.HexCoord import HexCoord
+from utils.instrumentation import phase
+from view.encoding import EncodeOptions, PngStreamWriter, encode_image
+from view.render_cache import RenderCache, board_state_key
+
+# Margen extra alrededor de los hexágonos extremos (puertos con su texto) y ancho de la leyenda
+CANVAS_MARGIN = 40
+LEGEND_WIDTH = 250
 
 class ImageView:
     def __init__(self):
         self.tile_size = 80
+        self.canvas_size = (1200, 900)
+        # Si el tablero no entra en canvas_size, el lienzo crece según su extensión
+        self.fit_canvas = True
+        self.render_cache: Optional[RenderCache] = None
         self._init_fonts()
         
         self.colors = {
@@ -70,60 +82,130 @@ class ImageView:
         # Letra R encima
         draw.text((x, y), "R", fill="white", anchor="mm", font=self.font)
 
+    def canvas_layout(self, tile_coords) -> Tuple[int, int, int, int]:
+        """(ancho, alto, centro x, centro y) del lienzo para estos tiles
+
+        Si el tablero entra centrado en canvas_size se usa ese tamaño; si no, cada eje
+        que no entra crece hasta la extensión del tablero (la leyenda ocupa LEGEND_WIDTH
+        a la derecha).
+        """
+        width, height = self.canvas_size
+        center_x, center_y = width // 2, height // 2
+        if not self.fit_canvas or not tile_coords:
+            return width, height, center_x, center_y
+
+        centers = [self._hex_center(coord, 0, 0) for coord in tile_coords.values()]
+        margin_x = self.tile_size + CANVAS_MARGIN // 2
+        margin_y = self.tile_size + CANVAS_MARGIN
+        min_x = min(x for x, _ in centers) - margin_x
+        max_x = max(x for x, _ in centers) + margin_x
+        min_y = min(y for _, y in centers) - margin_y
+        max_y = max(y for _, y in centers) + margin_y
+        if center_x + min_x < 0 or center_x + max_x > width - LEGEND_WIDTH:
+            width = max(width, math.ceil(max_x - min_x) + LEGEND_WIDTH)
+            center_x = math.ceil(-min_x)
+        if center_y + min_y < 0 or center_y + max_y > height:
+            height = max(height, math.ceil(max_y - min_y))
+            center_y = math.ceil(-min_y) + (height - math.ceil(max_y - min_y)) // 2
+        return width, height, center_x, center_y
+
     def generate_board_image(self, tile_coords, port_positions, robber_position):
-        from PIL import Image, ImageDraw
-        import math
-
-        width, height = 1200, 900
-        image = Image.new("RGB", (width, height), "#4682B4")
-        draw = ImageDraw.Draw(image)
-
-        center_x = width // 2
-        center_y = height // 2
-
-        # Desplazamientos horizontales por fila para formar la estructura hexagonal
-        offset_map = {
-            -2: -2,
-            -1: -1,
-            0: 0,
-            1: 1,
-            2: 2
-        }
+        with phase("image.generate"):
+            from PIL import Image, ImageDraw
+            import math
 
-        # Dibujar los hexágonos (tiles)
-        for tile, coord in tile_coords.items():
-            q, r = coord.q, coord.r
+            width, height, center_x, center_y = self.canvas_layout(tile_coords)
+            image = Image.new("RGB", (width, height), "#4682B4")
+            draw = ImageDraw.Draw(image)
+            self._draw_board(draw, tile_coords, port_positions, robber_position, width, height, center_x, center_y)
+            return image
 
-            dx = offset_map.get(r, 0) * self.tile_size * 0.75
-            x = center_x + q * self.tile_size * 1.5 + dx
-            y = center_y + r * self.tile_size * math.sqrt(3)
+    def _draw_board(self, draw, tile_coords, port_positions, robber_position, width, height,
+                    center_x, center_y, top: int = 0, rows: Optional[int] = None):
+        """Dibuja tiles, puertos y leyenda; con rows solo lo que toca la franja [top, top + rows)"""
+        size = self.tile_size
+        center_y -= top
 
-            self._draw_hexagon(draw, x, y, tile)
+        def visible(y, reach):
+            return rows is None or -reach <= y <= rows + reach
 
-            if tile == robber_position:
-                self._draw_robber(draw, x, y)
+        with phase("image.draw_tiles"):
+            # Dibujar los hexágonos (tiles)
+            for tile, coord in tile_coords.items():
+                x, y = self._hex_center(coord, center_x, center_y)
+                if not visible(y, size + 3):
+                    continue
 
-        # Dibujar los puertos
-        for port_id, (tile_id, edge) in port_positions.items():
-            tile = next((t for t in tile_coords if t.id == tile_id), None)
-            if tile is None:
-                continue
+                self._draw_hexagon(draw, x, y, tile)
 
-            coord = tile_coords[tile]
-            r = coord.r
-            dx = offset_map.get(r, 0) * self.tile_size * 0.75
-            x = center_x + coord.q * self.tile_size * 1.5 + dx
-            y = center_y + coord.r * self.tile_size * math.sqrt(3)
+                if tile == robber_position:
+                    self._draw_robber(draw, x, y)
 
-            self._draw_port(draw, port_id, edge, x, y)
+        with phase("image.draw_ports"):
+            # Dibujar los puertos
+            tiles_by_id = {t.id: t for t in tile_coords}
+            for port_id, (tile_id, edge) in port_positions.items():
+                tile = tiles_by_id.get(tile_id)
+                if tile is None:
+                    continue
+
+                x, y = self._hex_center(tile_coords[tile], center_x, center_y)
+                if not visible(y, size + CANVAS_MARGIN):
+                    continue
+                self._draw_port(draw, port_id, edge, x, y)
+
+        # Leyenda
+        with phase("image.draw_legend"):
+            self._draw_legend(draw, width, height, top)
+
+    def render_tiled(self, tile_coords, port_positions, robber_position, stream,
+                     options: EncodeOptions = EncodeOptions(), strip_height: int = 256) -> Tuple[int, int]:
+        """Dibuja el tablero en franjas horizontales y las escribe en stream (PNG o RAW)
+
+        La memoria máxima es la de una franja (ancho x strip_height más un margen), no
+        la del lienzo completo. Cada franja se dibuja con un desplazamiento vertical
+        entero y con un margen arriba y abajo (Pillow rasteriza distinto lo que queda
+        cortado en el borde), así que el resultado coincide con generate_board_image.
+        Devuelve (ancho, alto).
+        """
+        from PIL import Image, ImageDraw
+
+        if options.format not in ("PNG", "RAW"):
+            raise ValueError(f"El render por franjas solo admite PNG o RAW, no {options.format}")
+        width, height, center_x, center_y = self.canvas_layout(tile_coords)
+        writer = PngStreamWriter(stream, width, height, options.compress_level) if options.format == "PNG" else None
+
+        pad = self.tile_size + CANVAS_MARGIN
+        for top in range(0, height, strip_height):
+            rows = min(strip_height, height - top)
+            canvas = Image.new("RGB", (width, rows + 2 * pad), "#4682B4")
+            draw = ImageDraw.Draw(canvas)
+            # Subir el centro equivale a dibujar el lienzo completo y recortar la franja
+            self._draw_board(draw, tile_coords, port_positions, robber_position, width, height,
+                             center_x, center_y, top - pad, rows + 2 * pad)
+            strip = canvas.crop((0, pad, width, pad + rows))
+            with phase("image.encode"):
+                if writer is not None:
+                    writer.write(strip)
+                else:
+                    stream.write(strip.tobytes())
+        if writer is not None:
+            writer.close()
+        return width, height
+
+    def _hex_center(self, coord, center_x, center_y):
+        """Centro en píxeles de un hexágono; cada fila se desplaza 3/4 de tile hacia la derecha"""
+        x = center_x + coord.q * self.tile_size * 1.5 + coord.r * self.tile_size * 0.75
+        y = center_y + coord.r * self.tile_size * math.sqrt(3)
+        return x, y
 
-        # Leyenda y retorno de imagen
-        self._draw_legend(draw, width, height)
-        return image
-    
     def _draw_hexagon(self, draw, x, y, tile):
+        self._draw_hexagon_shape(draw, x, y, tile.material, tile.number)
+        self._draw_tile_label(draw, x, y, tile.id)
+
+    def _draw_hexagon_shape(self, draw, x, y, material, number):
         size = self.tile_size
-        color = self.colors.get(tile.material, "#FFFFFF")
+        color = self.colors.get(material, "#FFFFFF")
         
         points = []
         for i in range(6):
@@ -134,16 +216,17 @@ class ImageView:
         
         draw.polygon(points, fill=color, outline="#000000", width=3)
         
-        if tile.number and self.font:
-            draw.text((x, y), str(tile.number), fill="#000000", font=self.font, anchor="mm")
-        
-        if self.small_font:
-            draw.text((x - size/2 + 10, y - size/2 + 10), tile.id, fill="#00000080", font=self.small_font)
+        if number and self.font:
+            draw.text((x, y), str(number), fill="#000000", font=self.font, anchor="mm")
 
+    def _draw_tile_label(self, draw, x, y, tile_id):
+        size = self.tile_size
+        if self.small_font:
+            draw.text((x - size/2 + 10, y - size/2 + 10), tile_id, fill="#000000", font=self.small_font)
 
-    def _draw_port(self, draw, port_id, edge, x, y):
-        import math
 
+    def _port_point(self, edge, x, y):
+        """Punta del triángulo del puerto y su ángulo, hacia afuera del edge"""
         angle_map = {
             "top-left": -150,
             "top-right": -30,
@@ -160,6 +243,10 @@ class ImageView:
         port_distance = self.tile_size + 10
         px = x + port_distance * math.cos(angle_rad)
         py = y + port_distance * math.sin(angle_rad)
+        return px, py, angle_rad
+
+    def _draw_port(self, draw, port_id, edge, x, y):
+        px, py, angle_rad = self._port_point(edge, x, y)
 
         # Dibujar un triángulo como símbolo del puerto
         triangle = [
@@ -220,11 +307,11 @@ class ImageView:
         if self.font:
             draw.text((x, y), "R", fill="#FFFFFF", font=self.font, anchor="mm")
 
-    def _draw_legend(self, draw, width, height):
+    def _draw_legend(self, draw, width, height, y_offset=0):
         if not self.font: return
         
         legend_x = width - 250  # Leyenda más a la derecha
-        legend_y = height // 4
+        legend_y = height // 4 - y_offset
         box_size = 30
         
         # Título
@@ -248,9 +335,50 @@ class ImageView:
                 anchor="lm"
             )
     
-    def save_image(self, image: Image.Image, filename: str = "catan_board.png"):
-        image.save(filename, quality=95)
+    def save_image(self, image: Image.Image, filename: str = "catan_board.png", **encode_options):
+        """Guarda la imagen; el formato sale de la extensión (.png, .webp, .jpg/.jpeg, .rgb/.raw)
+
+        Se codifica antes de abrir el archivo, así un error no deja un archivo a medias.
+        """
+        options = EncodeOptions.for_filename(filename, **encode_options)
+        with phase("image.save"):
+            data = encode_image(image, options)
+            with open(filename, "wb") as f:
+                f.write(data)
         print(f"Tablero guardado como {filename}")
     
+    def render_bytes(self, tile_coords, port_positions, robber_position, format: str = "PNG",
+                     **encode_options) -> bytes:
+        """Imagen del tablero ya codificada; si hay render_cache, se reutiliza por hash del estado
+
+        encode_options son los campos de EncodeOptions (compress_level, quality, ...).
+        """
+        options = EncodeOptions(format=format.upper(), **encode_options)
+        cache = self.render_cache
+        key = None
+        if cache is not None:
+            key = board_state_key(tile_coords, port_positions, robber_position,
+                                  type(self).__name__, self.tile_size, self.canvas_size, self.fit_canvas,
+                                  astuple(options))
+            data = cache.get(key)
+            if data is not None:
+                return data
+
+        image = self.generate_board_image(tile_coords, port_positions, robber_position)
+        data = encode_image(image, options)
+
+        if cache is not None:
+            cache.put(key, data)
+        return data
+
+    def render_to(self, stream, tile_coords, port_positions, robber_position, format: str = "PNG",
+                  **encode_options) -> None:
+        """Como render_bytes, pero escribe en un stream binario (archivo, socket, BytesIO)"""
+        if self.render_cache is not None:
+            stream.write(self.render_bytes(tile_coords, port_positions, robber_position, format, **encode_options))
+            return
+        image = self.generate_board_image(tile_coords, port_positions, robber_position)
+        encode_image(image, EncodeOptions(format=format.upper(), **encode_options), stream)
+
     def show_image(self, image: Image.Image):
         image.show()
\ No newline at end of file
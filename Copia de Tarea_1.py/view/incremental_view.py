@@ -0,0 +1,182 @@
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw
+
+from utils.instrumentation import phase
+from view.image_view import ImageView
+
+Box = Tuple[int, int, int, int]  # (x0, y0, x1, y1), x1/y1 exclusivos
+
+
+@dataclass
+class RenderUpdate:
+    """Resultado de un turno: el cuadro completo y la zona que cambió"""
+    image: Image.Image        # cuadro actual; se modifica en el lugar en el próximo render
+    box: Optional[Box]        # caja que contiene todo lo redibujado; None si no cambió nada
+    full: bool                # True si se redibujó todo el lienzo
+    dirty_tiles: List[str]
+    boxes: List[Box]          # zonas redibujadas, una por tile sucio
+
+    def region(self) -> Optional[Image.Image]:
+        """Solo los píxeles que cambiaron, para enviar como parche"""
+        return self.image.crop(self.box) if self.box else None
+
+    def regions(self) -> List[Tuple[Box, Image.Image]]:
+        """Un parche por zona redibujada, más chicos que region() si están separadas"""
+        return [(box, self.image.crop(box)) for box in self.boxes]
+
+
+def _union(a: Optional[Box], b: Box) -> Box:
+    if a is None:
+        return b
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _intersects(a: Box, b: Box) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+class IncrementalImageView(ImageView):
+    """ImageView con estado que redibuja solo los hexágonos que cambiaron
+
+    Guarda el último cuadro y, en cada render, compara material, número y ladrón de
+    cada tile con el anterior. Cada zona sucia (el hexágono si cambió el material,
+    solo su centro si cambió el número o el ladrón) se vuelve a dibujar en un lienzo
+    auxiliar con las mismas coordenadas y el mismo orden que el render completo, pero
+    solo con lo que la toca (hexágonos vecinos, ladrón, puertos y leyenda), y se copia
+    al cuadro. No se dibuja desplazado porque PIL no rasteriza igual los bordes
+    gruesos en otra posición. Si cambia la forma del tablero se dibuja todo.
+    """
+
+    background = "#4682B4"
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def reset(self) -> None:
+        """Olvida el último cuadro; el próximo render será completo"""
+        self._image: Optional[Image.Image] = None
+        self._layout = None
+        self._state: Dict[str, Tuple[str, Optional[int]]] = {}
+        self._robber_id: Optional[str] = None
+        self._hex_boxes: Dict[str, Box] = {}
+        self._center_boxes: Dict[str, Box] = {}
+        self._port_boxes: Dict[str, Box] = {}
+        self._legend_box: Optional[Box] = None
+        self._scratch: Optional[Image.Image] = None
+        self._canvas: Tuple[int, int, int, int] = (0, 0, 0, 0)  # ancho, alto y centro del último render completo
+
+    def render(self, tile_coords, port_positions, robber_position) -> RenderUpdate:
+        layout = (
+            self.tile_size, self.canvas_size, self.fit_canvas,
+            tuple((tile.id, coord) for tile, coord in tile_coords.items()),
+            tuple(port_positions.items()),
+        )
+        state = {tile.id: (tile.material, tile.number) for tile in tile_coords}
+        robber_id = robber_position.id if robber_position is not None else None
+
+        if self._image is None or layout != self._layout:
+            self._full_render(tile_coords, port_positions, robber_position)
+            self._layout, self._state, self._robber_id = layout, state, robber_id
+            width, height = self._image.size
+            box = (0, 0, width, height)
+            return RenderUpdate(self._image, box, True, list(state), [box])
+
+        # Si solo cambió el número o el ladrón, alcanza con el centro del hexágono
+        boxes = []
+        dirty = []
+        for tile_id, values in state.items():
+            previous = self._state.get(tile_id)
+            robber_moved = robber_id != self._robber_id and tile_id in (robber_id, self._robber_id)
+            if previous != values or robber_moved:
+                dirty.append(tile_id)
+                if previous is not None and previous[0] != values[0]:
+                    boxes.append(self._hex_boxes[tile_id])
+                else:
+                    boxes.append(self._center_boxes[tile_id])
+        self._state, self._robber_id = state, robber_id
+        if not dirty:
+            return RenderUpdate(self._image, None, False, [], [])
+
+        width, height = self._image.size
+        boxes = [(max(x0, 0), max(y0, 0), min(x1, width), min(y1, height)) for x0, y0, x1, y1 in boxes]
+        with phase("image.incremental"):
+            for box in boxes:
+                self._redraw_region(box, tile_coords, port_positions, robber_position)
+
+        union = None
+        for box in boxes:
+            union = _union(union, box)
+        return RenderUpdate(self._image, union, False, dirty, boxes)
+
+    def _full_render(self, tile_coords, port_positions, robber_position) -> None:
+        self._image = self.generate_board_image(tile_coords, port_positions, robber_position)
+        self._canvas = width, height, center_x, center_y = self.canvas_layout(tile_coords)
+
+        # Cajas de cada hexágono (con el borde de 3 px), de su centro (ladrón y número)
+        # y de cada puerto (triángulo + texto)
+        size = self.tile_size
+        half_width = size * math.cos(math.pi / 6)
+        center = size / 3 + 3
+        self._hex_boxes = {}
+        self._center_boxes = {}
+        centers = {}
+        for tile, coord in tile_coords.items():
+            x, y = self._hex_center(coord, center_x, center_y)
+            centers[tile.id] = (x, y)
+            self._hex_boxes[tile.id] = (
+                math.floor(x - half_width) - 3, math.floor(y - size) - 3,
+                math.ceil(x + half_width) + 4, math.ceil(y + size) + 4,
+            )
+            self._center_boxes[tile.id] = (
+                math.floor(x - center), math.floor(y - center), math.ceil(x + center) + 1, math.ceil(y + center) + 1,
+            )
+
+        self._port_boxes = {}
+        for port_id, (tile_id, edge) in port_positions.items():
+            if tile_id not in centers:
+                continue
+            px, py, _ = self._port_point(edge, *centers[tile_id])
+            box = (math.floor(px) - 6, math.floor(py) - 6, math.ceil(px) + 7, math.ceil(py) + 7)
+            if self.small_font:
+                left, top, right, bottom = self.small_font.getbbox(port_id, anchor="mm")
+                box = _union(box, (math.floor(px + left) - 1, math.floor(py - 10 + top) - 1,
+                                   math.ceil(px + right) + 2, math.ceil(py - 10 + bottom) + 2))
+            self._port_boxes[port_id] = box
+
+        legend = Image.new("L", (width, height), 0)
+        self._draw_legend(ImageDraw.Draw(legend), width, height)
+        self._legend_box = legend.getbbox()
+        self._scratch = Image.new("RGB", (width, height), self.background)
+
+    def _redraw_region(self, box: Box, tile_coords, port_positions, robber_position) -> None:
+        draw = ImageDraw.Draw(self._scratch)
+        draw.rectangle((box[0], box[1], box[2] - 1, box[3] - 1), fill=self.background)
+
+        width, height, center_x, center_y = self._canvas
+
+        # Mismo orden que generate_board_image: tiles (con ladrón), puertos, leyenda
+        tiles_by_id = {}
+        for tile, coord in tile_coords.items():
+            tiles_by_id[tile.id] = tile
+            if not _intersects(self._hex_boxes[tile.id], box):
+                continue
+            x, y = self._hex_center(coord, center_x, center_y)
+            self._draw_hexagon(draw, x, y, tile)
+            if tile == robber_position:
+                self._draw_robber(draw, x, y)
+
+        for port_id, (tile_id, edge) in port_positions.items():
+            tile = tiles_by_id.get(tile_id)
+            if tile is None or not _intersects(self._port_boxes[port_id], box):
+                continue
+            x, y = self._hex_center(tile_coords[tile], center_x, center_y)
+            self._draw_port(draw, port_id, edge, x, y)
+
+        if self._legend_box and _intersects(self._legend_box, box):
+            self._draw_legend(draw, width, height)
+
+        self._image.paste(self._scratch.crop(box), box[:2])
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+def board_state_key(tile_coords, port_positions, robber_position, *params) -> str:
+    """Hash sha256 canónico de todo lo que se ve en la imagen del tablero
+
+    Incluye coordenada, id, material y número de cada tile, la ubicación de cada
+    puerto y el tile del ladrón; params agrega los parámetros del renderizador
+    (tile_size, formato, etc.). No depende del orden de los diccionarios.
+    """
+    tiles = sorted(
+        (coord.q, coord.r, tile.id, tile.material, tile.number or 0)
+        for tile, coord in tile_coords.items()
+    )
+    ports = sorted((port_id, tile_id, edge) for port_id, (tile_id, edge) in port_positions.items())
+    robber = robber_position.id if robber_position is not None else None
+    state = json.dumps([tiles, ports, robber, list(params)], separators=(",", ":"))
+    return hashlib.sha256(state.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_evictions: int = 0
+    disk_evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict:
+        return dict(vars(self), hits=self.hits, hit_rate=self.hit_rate)
+
+
+class RenderCache:
+    """Cache de imágenes codificadas por hash del tablero: LRU en memoria + disco opcional
+
+    La capa en memoria se acota por bytes totales. La de disco guarda un archivo por
+    clave en disk_dir y, al superar max_disk_bytes, borra los menos usados (por mtime,
+    que se actualiza en cada acierto). Los aciertos en disco se suben a memoria.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, disk_dir: Optional[str] = None,
+                 max_disk_bytes: int = 512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._disk: "OrderedDict[str, int]" = OrderedDict()  # clave -> tamaño, del menos al más usado
+        self._disk_bytes = 0
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._scan_disk()
+
+    def _scan_disk(self) -> None:
+        entries = []
+        for path in self.disk_dir.glob("*.bin"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+        self._evict_disk()
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.bin"
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memory_bytes
+
+    @property
+    def disk_bytes(self) -> int:
+        return self._disk_bytes
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._memory or key in self._disk
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return data
+
+            if key in self._disk:
+                path = self._disk_path(key)
+                try:
+                    data = path.read_bytes()
+                    os.utime(path)
+                except FileNotFoundError:
+                    self._forget_disk(key)
+                else:
+                    self._disk.move_to_end(key)
+                    self.stats.disk_hits += 1
+                    self._store_memory(key, data)
+                    return data
+
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._store_memory(key, data)
+            if self.disk_dir and key not in self._disk:
+                path = self._disk_path(key)
+                tmp = path.with_suffix(f".tmp{os.getpid()}")
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+                self._disk[key] = len(data)
+                self._disk_bytes += len(data)
+                self._evict_disk()
+
+    def _store_memory(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.stats.memory_evictions += 1
+
+    def _forget_disk(self, key: str) -> None:
+        self._disk_bytes -= self._disk.pop(key)
+
+    def _evict_disk(self) -> None:
+        while self._disk_bytes > self.max_disk_bytes and self._disk:
+            key = next(iter(self._disk))
+            self._forget_disk(key)
+            try:
+                self._disk_path(key).unlink()
+            except FileNotFoundError:
+                pass
+            self.stats.disk_evictions += 1
+
+    def clear(self) -> None:
+        """Vacía la capa en memoria (los archivos en disco se conservan)"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def metrics(self) -> Dict:
+        """Aciertos, fallos, desalojos y ocupación de cada capa"""
+        return dict(
+            self.stats.to_dict(),
+            memory_entries=len(self._memory),
+            memory_bytes=self._memory_bytes,
+            disk_entries=len(self._disk),
+            disk_bytes=self._disk_bytes,
+        )
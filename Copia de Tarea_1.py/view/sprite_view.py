@@ -0,0 +1,151 @@
+from PIL import Image, ImageDraw
+from typing import Callable, Dict, Tuple
+from utils.instrumentation import phase
+from view.image_view import ImageView
+
+Sprite = Tuple[Image.Image, Image.Image, Tuple[int, int]]  # imagen RGB, máscara y desplazamiento respecto al centro
+
+
+class SpriteImageView(ImageView):
+    """ImageView que arma el tablero pegando sprites pre-renderizados
+
+    Se dibuja un sprite por cada par (material, número), etiqueta, puerto y ladrón
+    una sola vez por tile_size; luego cada tablero solo pega imágenes en posiciones
+    precalculadas.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._cached_tile_size = None
+        self._reset_sprites()
+
+    def _reset_sprites(self):
+        self._hex_sprites: Dict[Tuple[str, int], Sprite] = {}
+        self._label_sprites: Dict[str, Sprite] = {}
+        self._port_sprites: Dict[Tuple[str, str], Sprite] = {}
+        self._robber_sprite = None
+        self._legend_sprite = None
+        self._canvas_key = None
+        self._pixel_offsets = {}
+        self._offsets_center = None
+        self._cached_tile_size = self.tile_size
+
+    def _make_sprite(self, draw_fn: Callable, extent: int) -> Sprite:
+        """Dibuja con draw_fn centrado en un lienzo transparente y recorta al contenido"""
+        canvas = Image.new("RGBA", (2 * extent, 2 * extent), (0, 0, 0, 0))
+        draw_fn(ImageDraw.Draw(canvas), extent, extent)
+        bbox = canvas.getbbox() or (0, 0, 1, 1)
+        canvas = canvas.crop(bbox)
+        return (canvas.convert("RGB"), self._sprite_mask(canvas), (bbox[0] - extent, bbox[1] - extent))
+
+    @staticmethod
+    def _sprite_mask(canvas: Image.Image) -> Image.Image:
+        # Una máscara binaria se pega sin mezclar colores, mucho más rápido que una alfa
+        alpha = canvas.getchannel("A")
+        if not any(alpha.histogram()[1:255]):
+            return alpha.convert("1")
+        return alpha
+
+    def _hex_sprite(self, material, number) -> Sprite:
+        key = (material, number)
+        sprite = self._hex_sprites.get(key)
+        if sprite is None:
+            sprite = self._make_sprite(
+                lambda draw, x, y: self._draw_hexagon_shape(draw, x, y, material, number),
+                self.tile_size + 4,
+            )
+            self._hex_sprites[key] = sprite
+        return sprite
+
+    def _label_sprite(self, tile_id) -> Sprite:
+        sprite = self._label_sprites.get(tile_id)
+        if sprite is None:
+            sprite = self._make_sprite(
+                lambda draw, x, y: self._draw_tile_label(draw, x, y, tile_id),
+                self.tile_size + 4,
+            )
+            self._label_sprites[tile_id] = sprite
+        return sprite
+
+    def _port_sprite(self, port_id, edge) -> Sprite:
+        key = (port_id, edge)
+        sprite = self._port_sprites.get(key)
+        if sprite is None:
+            sprite = self._make_sprite(
+                lambda draw, x, y: self._draw_port(draw, port_id, edge, x, y),
+                self.tile_size + 40,
+            )
+            self._port_sprites[key] = sprite
+        return sprite
+
+    def _legend_layer(self, width, height):
+        """Capa de leyenda, dibujada una vez por tamaño de lienzo"""
+        if self._canvas_key != (width, height):
+            legend = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+            self._draw_legend(ImageDraw.Draw(legend), width, height)
+            bbox = legend.getbbox()
+            if bbox:
+                legend = legend.crop(bbox)
+                self._legend_sprite = (legend.convert("RGB"), self._sprite_mask(legend), bbox[:2])
+            else:
+                self._legend_sprite = None
+            self._pixel_offsets = {}
+            self._canvas_key = (width, height)
+        return self._legend_sprite
+
+    def _pixel_offset(self, coord, center_x, center_y):
+        offset = self._pixel_offsets.get(coord)
+        if offset is None:
+            x, y = self._hex_center(coord, center_x, center_y)
+            offset = self._pixel_offsets[coord] = (round(x), round(y))
+        return offset
+
+    def generate_board_image(self, tile_coords, port_positions, robber_position):
+        with phase("image.generate"):
+            if self.tile_size != self._cached_tile_size:
+                self._reset_sprites()
+
+            width, height, center_x, center_y = self.canvas_layout(tile_coords)
+            legend = self._legend_layer(width, height)
+            image = Image.new("RGB", (width, height), "#4682B4")
+            paste = image.paste
+
+            # Los desplazamientos en píxeles dependen del centro del lienzo
+            if self._offsets_center != (center_x, center_y):
+                self._pixel_offsets = {}
+                self._offsets_center = (center_x, center_y)
+
+            if self._robber_sprite is None:
+                self._robber_sprite = self._make_sprite(self._draw_robber, self.tile_size)
+            robber_sprite, robber_mask, (rdx, rdy) = self._robber_sprite
+
+            with phase("image.draw_tiles"):
+                # Pegar los hexágonos en el mismo orden que el renderizador original
+                tiles_by_id = {}
+                for tile, coord in tile_coords.items():
+                    tiles_by_id[tile.id] = tile
+                    x, y = self._pixel_offset(coord, center_x, center_y)
+
+                    sprite, mask, (dx, dy) = self._hex_sprite(tile.material, tile.number)
+                    paste(sprite, (x + dx, y + dy), mask)
+                    sprite, mask, (dx, dy) = self._label_sprite(tile.id)
+                    paste(sprite, (x + dx, y + dy), mask)
+
+                    if tile == robber_position:
+                        paste(robber_sprite, (x + rdx, y + rdy), robber_mask)
+
+            with phase("image.draw_ports"):
+                # Pegar los puertos
+                for port_id, (tile_id, edge) in port_positions.items():
+                    tile = tiles_by_id.get(tile_id)
+                    if tile is None:
+                        continue
+                    x, y = self._pixel_offset(tile_coords[tile], center_x, center_y)
+                    sprite, mask, (dx, dy) = self._port_sprite(port_id, edge)
+                    paste(sprite, (x + dx, y + dy), mask)
+
+            if legend is not None:
+                with phase("image.draw_legend"):
+                    sprite, mask, position = legend
+                    paste(sprite, position, mask)
+            return image